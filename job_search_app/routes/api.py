@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "jobspy2" / "src"))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "jobsparser" / "src"))
 
 from jobspy2 import scrape_jobs
+from jobspy2.dedup import QUERY_SEPARATOR
 
 from ..services.job_matcher import JobMatcher
 from ..services.keyword_expander import KeywordExpander
@@ -226,45 +227,32 @@ def search_jobs():
         is_remote = data.get('is_remote', False)
         job_types = data.get('job_types', [])
         hours_old = data.get('hours_old')
+        deduplicate = data.get('deduplicate', False)
         
         current_app.logger.info(f"Job search request: {search_terms} in {location}")
         
-        # Search for each term and combine results
-        all_jobs = []
-        jobs_by_term = {}
-        
-        for term in search_terms:
-            try:
-                current_app.logger.info(f"Searching for: {term}")
-                
-                jobs_df = scrape_jobs(
-                    site_name=sites,
-                    search_term=term,
-                    location=location,
-                    results_wanted=results_wanted,
-                    distance=distance,
-                    job_type=job_types[0] if job_types else None,
-                    is_remote=is_remote,
-                    country_indeed='usa',
-                    hours_old=hours_old
-                )
-                
-                if jobs_df is not None and len(jobs_df) > 0:
-                    jobs_by_term[term] = len(jobs_df)
-                    all_jobs.append(jobs_df)
-                else:
-                    jobs_by_term[term] = 0
-                    
-            except Exception as e:
-                current_app.logger.error(f"Error searching for {term}: {str(e)}")
-                jobs_by_term[term] = 0
-        
-        # Combine all results
-        if all_jobs:
-            combined_df = pd.concat(all_jobs, ignore_index=True)
-            # Remove duplicates based on job_url
-            combined_df = combined_df.drop_duplicates(subset=['job_url'], keep='first')
-        else:
+        # Search all terms in one scrape: every site's searches run in parallel, a job found by several terms
+        # comes back once, tagged with the terms that found it, and a term that fails only loses its own jobs
+        jobs_by_term = dict.fromkeys(search_terms, 0)
+        try:
+            combined_df = scrape_jobs(
+                site_name=sites,
+                search_term=list(search_terms),
+                location=location,
+                results_wanted=results_wanted,
+                distance=distance,
+                job_type=job_types[0] if job_types else None,
+                is_remote=is_remote,
+                country_indeed='usa',
+                hours_old=hours_old,
+                # Merge listings of the same job across sites only when asked to
+                deduplicate=deduplicate
+            )
+        except Exception as e:
+            current_app.logger.error(f"Error searching for {search_terms}: {str(e)}")
+            combined_df = None
+        
+        if combined_df is None or combined_df.empty:
             return jsonify({
                 'status': 'success',
                 'jobs_count': 0,
@@ -273,6 +261,15 @@ def search_jobs():
                 'jobs_by_term': jobs_by_term
             })
         
+        if not deduplicate:
+            # Remove duplicates based on job_url
+            combined_df = combined_df.drop_duplicates(subset=['job_url'], keep='first')
+        
+        for terms in combined_df['search_term'].dropna():
+            for term in terms.split(QUERY_SEPARATOR):
+                if term in jobs_by_term:
+                    jobs_by_term[term] += 1
+        
         # Convert to list of dictionaries
         jobs_list = combined_df.to_dict('records')
         
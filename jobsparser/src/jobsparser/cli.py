@@ -1,5 +1,7 @@
 import click
-from jobspy2 import scrape_jobs, LinkedInExperienceLevel
+from jobspy2 import scrape_jobs, configure_rate_limits, deduplicate_jobs, write_parquet, LinkedInExperienceLevel
+from jobspy2.dedup import QUERY_SEPARATOR
+from jobspy2.scrapers import Site
 import pandas as pd
 import os
 import time
@@ -34,9 +36,32 @@ def get_version(ctx, param, value):
     click.echo(f"jobsparser, version {version}")
     ctx.exit()
 
+RETRY_BACKOFF = 10  # Seconds; base backoff after a failed batch when --sleep-time is 0
+# Search page requests per second for the sites jobspy2 doesn't pace itself. The CLI scrapes in batches and used to
+# sleep between them, so it keeps these sites from being hit at full speed; --rate-limit overrides them.
+CLI_RATE_LIMITS = {"indeed": 1.0, "glassdoor": 0.5, "google": 0.5}
+
+
+def _parse_rate_limits(ctx, param, value):
+    """Parses SITE=REQUESTS_PER_MINUTE pairs into requests per second for configure_rate_limits."""
+    limits = {}
+    for item in value:
+        site_name, _, rate = item.partition("=")
+        site_names = [site.value for site in Site]
+        if site_name not in site_names:
+            raise click.BadParameter(f"unknown site {site_name!r} in {item!r}; expected one of {', '.join(site_names)}")
+        try:
+            per_minute = float(rate)
+        except ValueError:
+            raise click.BadParameter(f"expected SITE=REQUESTS_PER_MINUTE, got {item!r}")
+        if per_minute < 0:
+            raise click.BadParameter(f"rate for {site_name} must not be negative")
+        limits[site_name] = per_minute / 60 if per_minute else None
+    return limits
+
 def _scrape_single_site(
     site_name: str,
-    search_term: str,
+    search_terms: list[str],
     location: str,
     distance: int,
     linkedin_fetch_description: bool,
@@ -50,21 +75,29 @@ def _scrape_single_site(
     batch_size: int,
     sleep_time: int,
     max_retries: int,
+    cpu_workers: int | None = None,
+    indeed_projection: str = "full",
+    indeed_page_size: int = 100,
+    linkedin_detail_concurrency: int = 5,
+    site_concurrency: int = 2,
 ):
-    """Scrapes jobs for a single site with retries, batching, and sleep."""
+    """Scrapes jobs for a single site with retries, batching, and sleep.
+
+    Each batch searches all the terms that may still have jobs in one scrape, site_concurrency of them at a time.
+    """
     offset = 0
     site_all_jobs = []
-    found_all_available_jobs_for_site = False
+    active_terms = list(search_terms)
 
-    while len(site_all_jobs) < results_wanted_for_site and not found_all_available_jobs_for_site:
+    while active_terms and offset < results_wanted_for_site:
         retry_count = 0
         while retry_count < max_retries:
-            logger.info(f"Fetching jobs: {offset} to {offset + batch_size}")
+            logger.info(f"Fetching jobs: {offset} to {offset + batch_size} for {len(active_terms)} search term(s)")
             try:
-                iteration_results_wanted = min(batch_size, results_wanted_for_site - len(site_all_jobs))
+                iteration_results_wanted = min(batch_size, results_wanted_for_site - offset)
                 jobs_df_scraped = scrape_jobs(
                     site_name=site_name,
-                    search_term=search_term,
+                    search_term=active_terms,
                     location=location,
                     distance=distance,
                     linkedin_fetch_description=linkedin_fetch_description,
@@ -75,6 +108,11 @@ def _scrape_single_site(
                     proxies=proxies,
                     hours_old=hours_old,
                     linkedin_experience_levels=linkedin_experience_levels,
+                    cpu_workers=cpu_workers,
+                    indeed_projection=indeed_projection,
+                    indeed_page_size=indeed_page_size,
+                    linkedin_detail_concurrency=linkedin_detail_concurrency,
+                    site_concurrency=site_concurrency,
                     logger=logger # Pass the parent logger for jobspy to use
                 )
                 if jobs_df_scraped is None or jobs_df_scraped.empty:
@@ -85,31 +123,34 @@ def _scrape_single_site(
                 site_all_jobs.extend(new_jobs)
                 offset += iteration_results_wanted
 
-                if len(new_jobs) < iteration_results_wanted:
-                    logger.info(f"Scraped {len(site_all_jobs)} jobs.")
-                    logger.info(f"No more jobs available. Wanted {results_wanted_for_site} jobs, got {len(site_all_jobs)}")
-                    found_all_available_jobs_for_site = True
-                    break
-
-                if len(site_all_jobs) >= results_wanted_for_site:
-                    logger.info(f"Reached desired {len(site_all_jobs)} jobs for this site.")
-                    break
-                    
+                # Jobs are tagged with every term that found them; a term that found fewer than asked for is done
+                found_per_term = dict.fromkeys(active_terms, 0)
+                for job in new_jobs:
+                    for term in str(job.get("search_term") or "").split(QUERY_SEPARATOR):
+                        if term in found_per_term:
+                            found_per_term[term] += 1
+                for term, found in found_per_term.items():
+                    if found < iteration_results_wanted:
+                        logger.info(f"No more jobs available for '{term}'. Wanted {iteration_results_wanted} jobs, got {found}")
+                active_terms = [term for term, found in found_per_term.items() if found >= iteration_results_wanted]
                 logger.info(f"Scraped {len(site_all_jobs)} jobs.")
-                current_sleep_duration = sleep_time 
-                logger.info(f"Sleeping for {current_sleep_duration} seconds before next batch.")
-                time.sleep(current_sleep_duration)
+
+                if offset >= results_wanted_for_site:
+                    logger.info(f"Reached desired {results_wanted_for_site} jobs per search term for this site.")
+                elif active_terms and sleep_time:
+                    logger.info(f"Sleeping for {sleep_time} seconds before next batch.")
+                    time.sleep(sleep_time)
                 break 
 
             except Exception as e:
                 logger.error(f"Error scraping: {e}", exc_info=True) # Add exc_info for traceback
                 retry_count += 1
-                sleep_duration_on_error = sleep_time * (retry_count + 1) # Exponential backoff
+                sleep_duration_on_error = max(sleep_time, RETRY_BACKOFF) * (retry_count + 1) # Exponential backoff
                 logger.warning(f"Sleeping for {sleep_duration_on_error} seconds before retry (attempt {retry_count}/{max_retries})")
                 time.sleep(sleep_duration_on_error)
                 if retry_count >= max_retries:
                     logger.error(f"Max retries reached. Moving on.")
-                    found_all_available_jobs_for_site = True 
+                    active_terms = []
                     break 
     
     logger.info(f"Finished scraping. Total jobs found: {len(site_all_jobs)}")
@@ -127,21 +168,32 @@ def _scrape_single_site(
 @click.option('--search-term', required=True, multiple=True, help='Job search query (can be specified multiple times)')
 @click.option('--location', required=True, help='Job location')
 @click.option('--site', multiple=True, type=click.Choice(['linkedin', 'indeed', 'glassdoor', 'zip_recruiter', 'google']), default=['linkedin'], help='Job sites to search')
-@click.option('--results-wanted', default=15, help='Total number of results to fetch per site')
+@click.option('--results-wanted', default=15, help='Total number of results to fetch per site and search term')
 @click.option('--distance', default=50, help='Distance radius for job search')
 @click.option('--job-type', type=click.Choice(['fulltime', 'parttime', 'contract', 'internship']), default=None, help='Type of job')
 @click.option('--indeed-country', default='usa', help='Country code for Indeed search')
 @click.option('--fetch-description/--no-fetch-description', default=False, help='Fetch full job description for LinkedIn')
+@click.option('--linkedin-detail-concurrency', default=5, type=click.IntRange(min=1), help='With --fetch-description, LinkedIn job pages fetched at once')
 @click.option('--proxies', multiple=True, default=None, help="Proxy addresses to use. Can be specified multiple times. E.g. --proxies '208.195.175.46:65095' --proxies '208.195.175.45:65095'")
 @click.option('--batch-size', default=30, help='Number of results to fetch in each batch')
-@click.option('--sleep-time', default=100, help='Base sleep time between batches in seconds')
+@click.option('--sleep-time', default=0, help='Extra sleep time between batches in seconds (requests are paced by --rate-limit)')
+@click.option('--rate-limit', multiple=True, callback=_parse_rate_limits, help="Search page requests per minute for a site, shared by all concurrent scrapes of it; 0 disables pacing. Can be specified multiple times. E.g. --rate-limit linkedin=12 --rate-limit indeed=60")
 @click.option('--max-retries', default=3, help='Maximum retry attempts per batch')
 @click.option('--hours-old', default=None, type=int, help='Hours old for job search')
-@click.option('--output-dir', default='data', help='Directory to save output CSV')
+@click.option('--output-dir', default='data', help='Directory to save output files')
+@click.option('--format', 'output_format', type=click.Choice(['csv', 'parquet']), default='csv', help='Output file format; parquet keeps column types and needs pyarrow')
+@click.option('--partition/--no-partition', default=False, help='With --format parquet, add the jobs to a dataset under OUTPUT_DIR/jobs partitioned by site and scrape date instead of writing a new file')
 @click.option('--linkedin-experience-level', multiple=True, type=click.Choice([level.value for level in LinkedInExperienceLevel]), default=None, help='Experience levels for LinkedIn')
+@click.option('--cpu-workers', default=None, type=click.IntRange(min=1), help='Parse pages and convert descriptions in this many worker processes shared by all sites, instead of in the scraping threads')
+@click.option('--indeed-projection', type=click.Choice(['listing', 'full']), default='full', help='Fields to ask Indeed for: "listing" leaves out descriptions and employer details for much smaller pages')
+@click.option('--indeed-page-size', default=100, type=click.IntRange(1, 100), help='Jobs per Indeed search page request')
+@click.option('--site-concurrency', default=2, type=click.IntRange(min=1), help='Search terms searched at once on each site')
+@click.option('--deduplicate/--no-deduplicate', default=False, help='Merge the listings of the same job across sites and search terms into one row; by default only repeated job URLs are dropped')
 @click.option('-v', '--verbose', count=True, help="Verbosity: -v for DEBUG, default INFO for this script's logs.", default=0)
 def main(search_term, location, site, results_wanted, distance, job_type, indeed_country,
-         fetch_description, proxies, batch_size, sleep_time, max_retries, hours_old, output_dir, linkedin_experience_level, verbose):
+         fetch_description, proxies, batch_size, sleep_time, rate_limit, max_retries, hours_old, output_dir,
+         output_format, partition, linkedin_experience_level, cpu_workers, indeed_projection, indeed_page_size,
+         linkedin_detail_concurrency, site_concurrency, deduplicate, verbose):
     """Scrape jobs from various job sites with customizable parameters."""
     
     # Determine overall log level for this script's loggers
@@ -150,13 +202,21 @@ def main(search_term, location, site, results_wanted, distance, job_type, indeed
     elif verbose >= 1: # -v or -vv etc
         cli_log_level = logging.DEBUG
 
+    configure_rate_limits({**CLI_RATE_LIMITS, **rate_limit})
+
+    if partition and output_format != 'parquet':
+        raise click.UsageError("--partition requires --format parquet")
+
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate unique filename
-    counter = 0
-    while os.path.exists(f"{output_dir}/jobs_{counter}.csv"):
-        counter += 1
-    csv_filename = f"{output_dir}/jobs_{counter}.csv"
+    if partition:
+        output_filename = f"{output_dir}/jobs"
+    else:
+        counter = 0
+        while os.path.exists(f"{output_dir}/jobs_{counter}.{output_format}"):
+            counter += 1
+        output_filename = f"{output_dir}/jobs_{counter}.{output_format}"
 
     all_jobs_collected = []
     
@@ -179,65 +239,64 @@ def main(search_term, location, site, results_wanted, distance, job_type, indeed
 
     root_logger.info("Starting job scraping...")
 
-    # Process each search term sequentially
-    for idx, current_search_term in enumerate(search_term):
-        if idx > 0:  # Skip sleep before first search term
-            root_logger.info(f"Sleeping for {sleep_time} seconds before next search term...")
-            time.sleep(sleep_time)
+    root_logger.info(f"Processing search terms: {', '.join(search_term)}")
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(site)) as executor:
+        future_to_site_logger_map = {}
+        for i, site_name_str in enumerate(site):
+            color_index = i % len(site_colors)
+            current_color = site_colors[color_index]
+            prefix = f"[{site_name_str.upper()}] "
             
-        root_logger.info(f"Processing search term: {current_search_term}")
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(site)) as executor:
-            future_to_site_logger_map = {}
-            for i, site_name_str in enumerate(site):
-                color_index = i % len(site_colors)
-                current_color = site_colors[color_index]
-                prefix = f"[{site_name_str.upper()}] "
-                
-                # Create and configure a logger for this specific site
-                site_logger_name = f"jobsparser.cli.{site_name_str}"
-                site_logger = logging.getLogger(site_logger_name)
-                site_logger.setLevel(cli_log_level) # Set level based on verbosity
+            # Create and configure a logger for this specific site
+            site_logger_name = f"jobsparser.cli.{site_name_str}"
+            site_logger = logging.getLogger(site_logger_name)
+            site_logger.setLevel(cli_log_level) # Set level based on verbosity
 
-                # Clear existing handlers to prevent duplication if re-run
-                if site_logger.hasHandlers():
-                    site_logger.handlers.clear()
+            # Clear existing handlers to prevent duplication if re-run
+            if site_logger.hasHandlers():
+                site_logger.handlers.clear()
 
-                handler = ClickColorHandler(prefix=prefix, color=current_color)
-                handler.setFormatter(formatter)
-                site_logger.addHandler(handler)
-                site_logger.propagate = False # Don't send to root logger if we have specific handling
+            handler = ClickColorHandler(prefix=prefix, color=current_color)
+            handler.setFormatter(formatter)
+            site_logger.addHandler(handler)
+            site_logger.propagate = False # Don't send to root logger if we have specific handling
 
-                site_logger.info(f"Submitting task to scrape {results_wanted} jobs.")
-                
-                future = executor.submit(
-                    _scrape_single_site,
-                    site_name=site_name_str,
-                    search_term=current_search_term,
-                    location=location,
-                    distance=distance,
-                    linkedin_fetch_description=fetch_description,
-                    job_type=job_type,
-                    country_indeed=indeed_country,
-                    results_wanted_for_site=results_wanted,
-                    proxies=list(proxies) if proxies else None,
-                    hours_old=hours_old,
-                    linkedin_experience_levels=list(linkedin_experience_level) if linkedin_experience_level else None,
-                    logger=site_logger,
-                    batch_size=batch_size,
-                    sleep_time=sleep_time,
-                    max_retries=max_retries,
-                )
-                future_to_site_logger_map[future] = site_logger
+            site_logger.info(f"Submitting task to scrape {results_wanted} jobs per search term.")
+            
+            future = executor.submit(
+                _scrape_single_site,
+                site_name=site_name_str,
+                search_terms=list(search_term),
+                location=location,
+                distance=distance,
+                linkedin_fetch_description=fetch_description,
+                job_type=job_type,
+                country_indeed=indeed_country,
+                results_wanted_for_site=results_wanted,
+                proxies=list(proxies) if proxies else None,
+                hours_old=hours_old,
+                linkedin_experience_levels=list(linkedin_experience_level) if linkedin_experience_level else None,
+                logger=site_logger,
+                batch_size=batch_size,
+                sleep_time=sleep_time,
+                max_retries=max_retries,
+                cpu_workers=cpu_workers,
+                indeed_projection=indeed_projection,
+                indeed_page_size=indeed_page_size,
+                linkedin_detail_concurrency=linkedin_detail_concurrency,
+                site_concurrency=site_concurrency,
+            )
+            future_to_site_logger_map[future] = site_logger
 
-            for future in concurrent.futures.as_completed(future_to_site_logger_map):
-                completed_site_logger = future_to_site_logger_map[future]
-                try:
-                    jobs_from_site = future.result()
-                    all_jobs_collected.extend(jobs_from_site)
-                    completed_site_logger.info(f"Completed. Found {len(jobs_from_site)} jobs.")
-                except Exception as exc:
-                    completed_site_logger.error(f"Task generated an exception: {exc}", exc_info=True)
+        for future in concurrent.futures.as_completed(future_to_site_logger_map):
+            completed_site_logger = future_to_site_logger_map[future]
+            try:
+                jobs_from_site = future.result()
+                all_jobs_collected.extend(jobs_from_site)
+                completed_site_logger.info(f"Completed. Found {len(jobs_from_site)} jobs.")
+            except Exception as exc:
+                completed_site_logger.error(f"Task generated an exception: {exc}", exc_info=True)
 
     if not all_jobs_collected:
         root_logger.warning("No jobs found after scraping all sites. Check parameters or site availability.")
@@ -245,9 +304,15 @@ def main(search_term, location, site, results_wanted, distance, job_type, indeed
 
     # Convert to DataFrame and remove duplicates
     jobs_df = pd.DataFrame(all_jobs_collected)
-    jobs_df = jobs_df.drop_duplicates(subset=['job_url'], keep='first')
-    jobs_df.to_csv(csv_filename, index=False)
-    root_logger.info(f"Successfully saved {len(jobs_df)} unique jobs from {len(site)} site(s) to {csv_filename}")
+    if deduplicate:
+        jobs_df = deduplicate_jobs(jobs_df)
+    else:
+        jobs_df = jobs_df.drop_duplicates(subset=['job_url'], keep='first')
+    if output_format == 'parquet':
+        write_parquet(jobs_df, output_filename, partition_by=['site', 'date'] if partition else None)
+    else:
+        jobs_df.to_csv(output_filename, index=False)
+    root_logger.info(f"Successfully saved {len(jobs_df)} unique jobs from {len(site)} site(s) to {output_filename}")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
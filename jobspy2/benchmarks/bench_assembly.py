@@ -0,0 +1,127 @@
+"""
+Compares the columnar DataFrame assembly in scrape_jobs against the original one-frame-per-job concat, and building
+the job records from the JobPosts' fields against dumping each JobPost to a dict first.
+
+Usage: python benchmarks/bench_assembly.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Any
+
+import pandas as pd
+
+from jobspy2 import (
+    DESIRED_COLUMNS,
+    Country,
+    _description_salaries,
+    _job_to_record,
+    _JobsFrameBuilder,
+    _process_job_data,
+)
+from jobspy2.jobs import Compensation, CompensationInterval, JobPost, Location
+from jobspy2.scrapers.salary import Salary
+
+SITES = ["linkedin", "indeed", "zip_recruiter", "glassdoor", "google"]
+
+
+def make_jobs(n: int, seed: int = 0) -> list[tuple[str, JobPost]]:
+    rng = random.Random(seed)  # noqa: S311
+    jobs = []
+    for i in range(n):
+        site = SITES[i % len(SITES)]
+        has_comp = rng.random() < 0.4
+        job = JobPost(
+            id=f"{site[:2]}-{i}",
+            title=f"Software Engineer {i}",
+            company_name=f"Company {rng.randint(0, 500)}",
+            job_url=f"https://example.com/{site}/{i}",
+            location=Location(city="Austin", state="TX", country=Country.USA),
+            date_posted=date(2024, 5, 1) - timedelta(days=rng.randint(0, 30)),
+            description="Build things. " * rng.randint(50, 200) + ("Pay $120k - $150k" if rng.random() < 0.3 else ""),
+            compensation=Compensation(interval=CompensationInterval.YEARLY, min_amount=100000, max_amount=150000)
+            if has_comp
+            else None,
+            is_remote=rng.random() < 0.2 if site != "linkedin" else None,
+            company_industry="Software" if site in ("linkedin", "indeed") else None,
+        )
+        jobs.append((site, job))
+    return jobs
+
+
+def with_salaries(jobs: list[tuple[str, JobPost]]) -> list[tuple[str, JobPost, Salary | None]]:
+    """The jobs with their description salaries, extracted for all of them at once as scrape_jobs does"""
+    salaries = _description_salaries([job for _, job in jobs], False, Country.USA)
+    return [(site, job, salary) for (site, job), salary in zip(jobs, salaries)]
+
+
+def dumped_records(jobs: list[tuple[str, JobPost, Salary | None]]) -> list[dict]:
+    records = []
+    for site, job, salary in jobs:
+        job_data = job.model_dump()
+        job_data["site"] = site
+        records.append(_process_job_data(job_data, False, Country.USA, salary))
+    return records
+
+
+def read_records(jobs: list[tuple[str, JobPost, Salary | None]]) -> list[dict]:
+    return [_job_to_record(job, site, False, Country.USA, salary) for site, job, salary in jobs]
+
+
+def legacy_assembly(records: list[dict]) -> pd.DataFrame:
+    jobs_df = pd.concat([pd.DataFrame([record]).dropna(axis=1, how="all") for record in records], ignore_index=True)
+    for column in DESIRED_COLUMNS:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[DESIRED_COLUMNS]
+    return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False]).reset_index(drop=True)
+
+
+def columnar_assembly(records: list[dict]) -> pd.DataFrame:
+    builder = _JobsFrameBuilder()
+    for record in records:
+        builder.append(record)
+    return builder.build()
+
+
+def measure(fn, data: list) -> tuple[float, float, Any]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, result
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'rows':>8} {'dumped s':>10} {'read s':>11} {'speedup':>8} {'dumped MiB':>11} {'read MiB':>13}")
+    for n in sizes:
+        jobs = with_salaries(make_jobs(n))
+        dumped_s, dumped_mb, dumped = measure(dumped_records, jobs)
+        read_s, read_mb, read = measure(read_records, jobs)
+        if read != dumped:
+            raise SystemExit(1)
+        print(
+            f"{n:>8} {dumped_s:>10.3f} {read_s:>11.3f} {dumped_s / read_s:>7.1f}x {dumped_mb:>11.1f} {read_mb:>13.1f}"
+        )
+
+    print(f"{'rows':>8} {'legacy s':>10} {'columnar s':>11} {'speedup':>8} {'legacy MiB':>11} {'columnar MiB':>13}")
+    for n in sizes:
+        records = read_records(with_salaries(make_jobs(n)))
+        legacy_s, legacy_mb, legacy_df = measure(legacy_assembly, records)
+        columnar_s, columnar_mb, columnar_df = measure(columnar_assembly, records)
+        pd.testing.assert_frame_equal(legacy_df, columnar_df)
+        print(
+            f"{n:>8} {legacy_s:>10.3f} {columnar_s:>11.3f} {legacy_s / columnar_s:>7.1f}x"
+            f" {legacy_mb:>11.1f} {columnar_mb:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
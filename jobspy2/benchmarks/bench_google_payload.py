@@ -0,0 +1,101 @@
+"""
+Compares extracting the job info arrays of recorded Google Jobs pages by decoding whole payloads (json.loads of every
+entry and a recursive search for the job info key, or a lazy regex over the search page, as the scraper did before)
+with the targeted extraction that scans for the key and decodes only the arrays after it: CPU time and peak memory
+allocated per page, and whether both find the same arrays.
+
+Usage: python benchmarks/bench_google_payload.py [--fixture PATH] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from jobspy2.scrapers.google.payload import JOB_INFO_KEY, initial_page_job_infos, results_page_job_infos
+from jobspy2.scrapers.replay import load_fixture
+
+DEFAULT_FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "google.json.gz"
+INITIAL_PAGE_PATTERN = re.compile(f'{JOB_INFO_KEY}":' + r"(\[.*?\]\s*])\s*}\s*]\s*]\s*]")
+
+
+def find_job_info(data: Any) -> list[Any] | None:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == JOB_INFO_KEY and isinstance(value, list):
+                return value
+            if result := find_job_info(value):
+                return result
+    elif isinstance(data, list):
+        for item in data:
+            if result := find_job_info(item):
+                return result
+    return None
+
+
+def entries(page: str) -> list[str]:
+    payload = json.loads(page[page.find("[[[") : page.rindex("]]]") + 3])[0]
+    return [entry for _, entry in payload if entry.startswith("[[[")]
+
+
+def decoded_initial_page(page: str) -> list[Any]:
+    return [json.loads(match.group(1)) for match in INITIAL_PAGE_PATTERN.finditer(page)]
+
+
+def decoded_results_page(page: str) -> list[Any]:
+    return [job_info for entry in entries(page) if (job_info := find_job_info(json.loads(entry)))]
+
+
+def measure(extract: Callable[[str], Any], pages: list[str], repeat: int) -> tuple[float, float]:
+    """Median CPU seconds and mean peak bytes allocated per page"""
+    runs = []
+    for _ in range(repeat):
+        start = time.process_time()
+        for page in pages:
+            extract(page)
+        runs.append(time.process_time() - start)
+    peaks = []
+    for page in pages:
+        tracemalloc.start()
+        extract(page)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(runs) / len(pages), statistics.mean(peaks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    pages: dict[str, list[str]] = {"search": [], "results": []}
+    for exchange in load_fixture(args.fixture)["exchanges"]:
+        pages["results" if "/async/" in exchange["url"] else "search"].append(exchange["body"])
+    extractors = {
+        "search": (decoded_initial_page, initial_page_job_infos),
+        "results": (decoded_results_page, results_page_job_infos),
+    }
+
+    print(f"{'pages':<8} {'count':>6} {'decoded us':>11} {'targeted us':>12} {'decoded KiB':>12} {'targeted KiB':>13}")
+    for kind, (decoded, targeted) in extractors.items():
+        if not pages[kind]:
+            continue
+        identical = all(decoded(page) == targeted(page) for page in pages[kind])
+        decoded_cpu, decoded_peak = measure(decoded, pages[kind], args.repeat)
+        targeted_cpu, targeted_peak = measure(targeted, pages[kind], args.repeat)
+        print(
+            f"{kind:<8} {len(pages[kind]):>6} {decoded_cpu * 1e6:>11.1f} {targeted_cpu * 1e6:>12.1f}"
+            f" {decoded_peak / 1024:>12.1f} {targeted_peak / 1024:>13.1f}"
+            f"  {decoded_cpu / targeted_cpu:.1f}x faster, {'identical' if identical else 'DIFFERENT'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares finding the job types and remote keywords of job descriptions with one substring check per keyword (as
+extract_job_type and the remote checks did before) with the single-pass keyword matcher, one description at a time
+and for the whole result set at once, on the descriptions of the recorded scrapes repeated to a realistic result set
+size.
+
+Usage: python benchmarks/bench_keywords.py [--fixtures DIR] [--jobs N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from jobspy2 import scrape_jobs
+from jobspy2.jobs import JobType
+from jobspy2.scrapers.keywords import classify_description, classify_descriptions
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def load_descriptions(directory: Path) -> list[str]:
+    descriptions = []
+    for path in sorted(directory.glob("*.json.gz")):
+        fixture = load_fixture(path)
+        with replaying(fixture):
+            jobs = scrape_jobs(**fixture["meta"])
+        descriptions += [description for description in jobs["description"] if isinstance(description, str)]
+    return descriptions
+
+
+def substring_checks(description: str) -> tuple[list[JobType], bool]:
+    job_types = [
+        job_type for job_type in JobType if any(keyword.lower() in description.lower() for keyword in job_type.value)
+    ]
+    return job_types, "remote" in description.lower() or "wfh" in description.lower()
+
+
+def time_run(run: Callable[[], Any], repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    descriptions = list(itertools.islice(itertools.cycle(load_descriptions(args.fixtures)), args.jobs))
+
+    runs = {
+        "substring": lambda: [substring_checks(description) for description in descriptions],
+        "matcher": lambda: [classify_description(description) for description in descriptions],
+        "batch": lambda: classify_descriptions(descriptions),
+    }
+    timings = {name: time_run(run, args.repeat) for name, run in runs.items()}
+    print(f"{'matching':<12} {'jobs':>6} {'total ms':>9} {'us/job':>8}")
+    for name, seconds in timings.items():
+        print(f"{name:<12} {len(descriptions):>6} {seconds * 1e3:>9.1f} {seconds / len(descriptions) * 1e6:>8.1f}")
+    print(
+        f"speedup: {timings['substring'] / timings['matcher']:.1f}x, batch {timings['substring'] / timings['batch']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
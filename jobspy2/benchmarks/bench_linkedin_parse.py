@@ -0,0 +1,65 @@
+"""
+Compares the LinkedIn parser backends on recorded search and job pages: parse time per page for each backend, and
+whether they extract exactly the same cards and details.
+
+Usage: python benchmarks/bench_linkedin_parse.py [--fixture PATH] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from jobspy2.scrapers import ParserBackend
+from jobspy2.scrapers.linkedin.parsers import PARSERS
+from jobspy2.scrapers.replay import load_fixture
+
+DEFAULT_FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "linkedin.json.gz"
+
+
+def load_pages(path: Path) -> dict[str, list[str]]:
+    pages: dict[str, list[str]] = {"job_cards": [], "job_details": []}
+    for exchange in load_fixture(path)["exchanges"]:
+        kind = "job_details" if "/jobs/view/" in exchange["url"] else "job_cards"
+        pages[kind].append(exchange["body"])
+    return pages
+
+
+def time_pages(backend: ParserBackend, kind: str, pages: list[str], repeat: int) -> float:
+    parse = getattr(PARSERS[backend], kind)
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            parse(page)
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs) / len(pages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    pages = load_pages(args.fixture)
+
+    print(f"{'pages':<12} {'count':>6} {'bs4 ms':>9} {'lxml ms':>9} {'speedup':>8} {'identical':>10}")
+    for kind, kind_pages in pages.items():
+        if not kind_pages:
+            continue
+        bs4 = time_pages(ParserBackend.BS4, kind, kind_pages, args.repeat)
+        lxml = time_pages(ParserBackend.LXML, kind, kind_pages, args.repeat)
+        identical = all(
+            getattr(PARSERS[ParserBackend.BS4], kind)(page) == getattr(PARSERS[ParserBackend.LXML], kind)(page)
+            for page in kind_pages
+        )
+        print(
+            f"{kind:<12} {len(kind_pages):>6} {bs4 * 1e3:>9.2f} {lxml * 1e3:>9.2f} {bs4 / lxml:>7.1f}x"
+            f" {'yes' if identical else 'NO':>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
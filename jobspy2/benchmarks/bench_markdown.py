@@ -0,0 +1,75 @@
+"""
+Compares markdownify with the description converter on the descriptions of the recorded scrapes: conversion time
+per description, with a cold and a warm cache, and whether the markdown is exactly the same.
+
+Usage: python benchmarks/bench_markdown.py [--fixtures DIR] [--repeat N] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from markdownify import markdownify as md
+
+from jobspy2 import MarkdownCache, scrape_jobs, set_markdown_cache
+from jobspy2.scrapers.markdown import convert_descriptions, html_to_markdown
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def load_descriptions(directory: Path) -> list[str]:
+    descriptions = []
+    for path in sorted(directory.glob("*.json.gz")):
+        fixture = load_fixture(path)
+        with replaying(fixture):
+            jobs = scrape_jobs(**{**fixture["meta"], "description_format": "html"})
+        descriptions += [description for description in jobs["description"] if isinstance(description, str)]
+    return descriptions
+
+
+def time_batch(convert: Callable[[list[str]], Any], descriptions: list[str], repeat: int, warm: bool) -> float:
+    runs = []
+    for _ in range(repeat):
+        set_markdown_cache(MarkdownCache(max_entries=len(descriptions)))
+        if warm:
+            convert(descriptions)
+        start = time.perf_counter()
+        convert(descriptions)
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs) / len(descriptions)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    descriptions = load_descriptions(args.fixtures)
+
+    converters: dict[str, tuple[Callable[[list[str]], Any], bool]] = {
+        "markdownify": (lambda htmls: [md(html) for html in htmls], False),
+        "converter": (lambda htmls: [html_to_markdown(html) for html in htmls], False),
+        f"{args.workers} processes": (lambda htmls: convert_descriptions(htmls, workers=args.workers), False),
+        "warm cache": (convert_descriptions, True),
+    }
+    baseline = None
+    print(f"{'conversion':<14} {'descriptions':>12} {'ms':>8} {'speedup':>8}")
+    for name, (convert, warm) in converters.items():
+        seconds = time_batch(convert, descriptions, args.repeat, warm)
+        baseline = baseline or seconds
+        print(f"{name:<14} {len(descriptions):>12} {seconds * 1e3:>8.3f} {baseline / seconds:>7.1f}x")
+    identical = all(html_to_markdown(html) == md(html) for html in descriptions)
+    print(f"identical markdown: {'yes' if identical else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
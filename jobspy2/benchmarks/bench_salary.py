@@ -0,0 +1,67 @@
+"""
+Compares extracting salaries from job descriptions one at a time (extract_salary, as jobs were assembled before)
+with extracting them for the whole result set at once (extract_salaries), on the descriptions of the recorded
+scrapes repeated to a realistic result set size.
+
+Usage: python benchmarks/bench_salary.py [--fixtures DIR] [--jobs N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from jobspy2 import extract_salaries, scrape_jobs
+from jobspy2.scrapers.replay import load_fixture, replaying
+from jobspy2.scrapers.utils import extract_salary
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def load_descriptions(directory: Path) -> list[str]:
+    descriptions = []
+    for path in sorted(directory.glob("*.json.gz")):
+        fixture = load_fixture(path)
+        with replaying(fixture):
+            jobs = scrape_jobs(**fixture["meta"])
+        descriptions += [description for description in jobs["description"] if isinstance(description, str)]
+    return descriptions
+
+
+def time_run(run: Callable[[], Any], repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    descriptions = pd.Series(list(itertools.islice(itertools.cycle(load_descriptions(args.fixtures)), args.jobs)))
+
+    single = time_run(lambda: [extract_salary(description) for description in descriptions], args.repeat)
+    batch = time_run(lambda: extract_salaries(descriptions), args.repeat)
+    found = extract_salaries(descriptions)["min_amount"].notna().sum()
+    print(f"{'extraction':<12} {'jobs':>6} {'total ms':>9} {'us/job':>8}")
+    for name, seconds in (("per job", single), ("batch", batch)):
+        print(f"{name:<12} {len(descriptions):>6} {seconds * 1e3:>9.1f} {seconds / len(descriptions) * 1e6:>8.1f}")
+    print(f"speedup: {single / batch:.1f}x, salaries found: {found}")
+
+
+if __name__ == "__main__":
+    main()
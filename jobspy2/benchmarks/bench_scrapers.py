@@ -0,0 +1,116 @@
+"""
+Runs every scraper's scrape() end to end offline against replay fixtures and reports jobs/sec, parse time (wall time
+minus the time spent serving recorded responses), the part of it spent converting markdown, and peak allocations.
+
+Usage:
+    python benchmarks/bench_scrapers.py [--fixtures DIR] [--repeat N] [site ...]
+    python benchmarks/bench_scrapers.py --record DIR --search-term TERM [--location LOC] [--results-wanted N] [site ...]
+
+Without --fixtures the synthetic fixtures in tests/fixtures are used (regenerate them with
+tests/fixtures/generate.py). --record scrapes the live sites once and saves their exchanges as fixtures.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from jobspy2 import _build_scraper_input, _run_scraper
+from jobspy2.jobs import ScrapeStats
+from jobspy2.scrapers import Site
+from jobspy2.scrapers.exceptions import ReplayMissError
+from jobspy2.scrapers.replay import Replay, load_fixture, recording, using_transport
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+SITES = [site.value for site in Site]
+
+logger = logging.getLogger("jobspy2.bench")
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+
+def run_once(fixture: dict[str, Any]) -> tuple[int, float, float, ScrapeStats]:
+    """Replays one scrape. Returns jobs scraped, wall seconds, seconds spent inside the replay transport and stats."""
+    replay = Replay(fixture)
+    meta = fixture["meta"]
+    scraper_input = _build_scraper_input(**meta)
+    with using_transport(replay):
+        start = time.perf_counter()
+        response = _run_scraper(Site(meta["site_name"]), scraper_input, logger, None, None)
+        elapsed = time.perf_counter() - start
+    if replay.misses:
+        raise ReplayMissError(*replay.misses[0])
+    return len(response.jobs), elapsed, replay.elapsed, response.stats
+
+
+def peak_allocations(fixture: dict[str, Any]) -> float:
+    tracemalloc.start()
+    run_once(fixture)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def bench(fixtures_dir: Path, sites: list[str], repeat: int) -> None:
+    print(
+        f"{'site':<14} {'jobs':>5} {'jobs/s':>9} {'wall ms':>9} {'parse ms':>9} {'markdown ms':>12} {'replay ms':>10}"
+        f" {'peak MiB':>9}"
+    )
+    for site in sites:
+        path = fixtures_dir / f"{site}.json.gz"
+        if not path.exists():
+            print(f"{site:<14} no fixture at {path}")
+            continue
+        fixture = load_fixture(path)
+        run_once(fixture)  # warm up imports, regex caches and the session pool
+        runs = [run_once(fixture) for _ in range(repeat)]
+        jobs = runs[0][0]
+        wall = statistics.median(run[1] for run in runs)
+        parse = statistics.median(run[1] - run[2] for run in runs)
+        replay = statistics.median(run[2] for run in runs)
+        markdown = statistics.median(run[3].timings.get("markdown", 0.0) for run in runs)
+        print(
+            f"{site:<14} {jobs:>5} {jobs / wall:>9.0f} {wall * 1e3:>9.1f} {parse * 1e3:>9.1f} {markdown * 1e3:>12.1f}"
+            f" {replay * 1e3:>10.1f} {peak_allocations(fixture):>9.1f}"
+        )
+
+
+def record(out_dir: Path, sites: list[str], scrape_kwargs: dict[str, Any]) -> None:
+    for site in sites:
+        kwargs = {"site_name": site, **scrape_kwargs}
+        path = out_dir / f"{site}.json.gz"
+        with recording(path, meta=kwargs) as recorder:
+            _run_scraper(Site(site), _build_scraper_input(**kwargs), None, None, None)
+        print(f"{site}: recorded {len(recorder.exchanges)} exchanges to {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sites", nargs="*", metavar="site", help=f"any of {', '.join(SITES)} (default: all)")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--record", type=Path, metavar="DIR")
+    parser.add_argument("--search-term", default="software engineer")
+    parser.add_argument("--location", default=None)
+    parser.add_argument("--results-wanted", type=int, default=30)
+    args = parser.parse_args()
+    sites = args.sites or SITES
+    if unknown := set(sites) - set(SITES):
+        parser.error(f"unknown sites: {', '.join(sorted(unknown))}")
+    if args.record:
+        record(
+            args.record,
+            sites,
+            {"search_term": args.search_term, "location": args.location, "results_wanted": args.results_wanted},
+        )
+    else:
+        bench(args.fixtures, sites, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
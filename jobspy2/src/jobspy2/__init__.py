@@ -1,12 +1,35 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import contextlib
+import functools
+import itertools
 import logging
+import math
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Union
 
+import numpy as np
 import pandas as pd
 
-from .jobs import JobType, Location
-from .scrapers import Country, JobResponse, LinkedInExperienceLevel, SalarySource, ScraperInput, Site
+from .dedup import DUPLICATE_IDS, QUERY_COLUMNS, QUERY_SEPARATOR, deduplicate_records
+from .dedup import deduplicate_jobs as deduplicate_jobs
+from .jobs import Compensation, JobPost, JobType, Location, ScrapeStats
+from .output import OUTPUT_FORMATS, OutputFormatError, to_arrow
+from .output import write_parquet as write_parquet
+from .scrapers import Country, JobResponse, LinkedInExperienceLevel, SalarySource, Scraper, ScraperInput, Site
+from .scrapers.cache import ResponseCache as ResponseCache
+from .scrapers.cache import set_response_cache as set_response_cache
+from .scrapers.cpu import shutdown_cpu_pools as shutdown_cpu_pools
+from .scrapers.cpu import using_cpu_pool
+from .scrapers.descriptions import DescriptionHandle
+from .scrapers.descriptions import DescriptionHandleError as DescriptionHandleError
 from .scrapers.exceptions import (
     GlassdoorException as GlassdoorException,
 )
@@ -23,11 +46,38 @@ from .scrapers.exceptions import (
     ZipRecruiterException as ZipRecruiterException,
 )
 from .scrapers.glassdoor import GlassdoorScraper
+from .scrapers.glassdoor.lookups import configure_glassdoor_lookups as configure_glassdoor_lookups
 from .scrapers.google import GoogleJobsScraper
 from .scrapers.indeed import IndeedScraper
 from .scrapers.linkedin import LinkedInScraper
+from .scrapers.markdown import MarkdownCache as MarkdownCache
+from .scrapers.markdown import set_markdown_cache as set_markdown_cache
+from .scrapers.proxy_health import proxy_stats as proxy_stats
+from .scrapers.ratelimit import configure_rate_limits as configure_rate_limits
+from .scrapers.salary import ANNUAL_MULTIPLIER_BY_INTERVAL, Salary, salary_rows
+from .scrapers.salary import extract_salaries as extract_salaries
+from .scrapers.session_pool import configure_session_pool as configure_session_pool
+from .scrapers.stats import ASSEMBLY, PARSE, add_time, collecting, stage
 from .scrapers.utils import create_logger, extract_salary
+from .scrapers.workers import configure_workers as configure_workers
 from .scrapers.ziprecruiter import ZipRecruiterScraper
+from .state import IncrementalRun
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# The search term and location of one of the searches of a scrape
+Query = tuple[Union[str, None], Union[str, None]]
+DEFAULT_SITE_CONCURRENCY = 2
+_failed_queries_lock = threading.Lock()
+
+SCRAPER_MAPPING: dict[Site, type[Scraper]] = {
+    Site.LINKEDIN: LinkedInScraper,
+    Site.INDEED: IndeedScraper,
+    Site.ZIP_RECRUITER: ZipRecruiterScraper,
+    Site.GLASSDOOR: GlassdoorScraper,
+    Site.GOOGLE: GoogleJobsScraper,
+}
 
 
 class JobTypeError(Exception):
@@ -38,6 +88,23 @@ class JobTypeError(Exception):
         super().__init__(self.message)
 
 
+class SiteConcurrencyError(ValueError):
+    def __init__(self, site: Site, limit: int) -> None:
+        self.message = f"site_concurrency for {site.value} must be a positive number of scrapes, got {limit!r}"
+        super().__init__(self.message)
+
+
+class QueryListError(TypeError):
+    def __init__(self, function: str) -> None:
+        self.message = f"{function} searches a single search term and location; use scrape_jobs to search lists of them"
+        super().__init__(self.message)
+
+
+def _check_single_query(function: str, kwargs: dict[str, Any]) -> None:
+    if isinstance(kwargs.get("search_term"), list) or isinstance(kwargs.get("location"), list):
+        raise QueryListError(function)
+
+
 def _get_enum_from_value(value_str: str | None) -> JobType | None:
     if not value_str:
         return None
@@ -59,16 +126,21 @@ def _get_site_type(site_name: str | list[str] | Site | list[Site] | None) -> lis
 
 
 def _convert_to_annual(job_data: dict) -> None:
-    multipliers = {"hourly": 2080, "monthly": 12, "weekly": 52, "daily": 260}
     interval = job_data["interval"]
-    if interval in multipliers:
-        multiplier = multipliers[interval]
+    if interval in ANNUAL_MULTIPLIER_BY_INTERVAL:
+        multiplier = ANNUAL_MULTIPLIER_BY_INTERVAL[interval]
         job_data["min_amount"] *= multiplier
         job_data["max_amount"] *= multiplier
         job_data["interval"] = "yearly"
 
 
-def _process_job_data(job_data: dict, enforce_annual_salary: bool, country_enum: Country) -> dict:
+def _process_job_data(
+    job_data: dict, enforce_annual_salary: bool, country_enum: Country, salary: Salary | None = None
+) -> dict:
+    """
+    Normalizes a job's fields (as _job_to_record collects them, or as JobPost.model_dump() returns them) into its
+    record. salary is the job's description salary, if it was already extracted with the rest of its site's jobs.
+    """
     job_url = job_data["job_url"]
     job_data["job_url_hyper"] = f'<a href="{job_url}">{job_url}</a>'
     job_data["company"] = job_data["company_name"]
@@ -79,10 +151,13 @@ def _process_job_data(job_data: dict, enforce_annual_salary: bool, country_enum:
     if job_data["emails"]:
         job_data["emails"] = ", ".join(job_data["emails"])
 
-    if job_data["location"]:
-        job_data["location"] = Location(**job_data["location"]).display_location()
+    location = job_data["location"]
+    if location:
+        job_data["location"] = (location if isinstance(location, Location) else Location(**location)).display_location()
 
     compensation_obj = job_data.get("compensation")
+    if isinstance(compensation_obj, Compensation):
+        compensation_obj = job_data["compensation"] = dict(vars(compensation_obj))
     if compensation_obj and isinstance(compensation_obj, dict):
         job_data["interval"] = compensation_obj.get("interval").value if compensation_obj.get("interval") else None
         job_data["min_amount"] = compensation_obj.get("min_amount")
@@ -99,17 +174,123 @@ def _process_job_data(job_data: dict, enforce_annual_salary: bool, country_enum:
         ):
             _convert_to_annual(job_data)
     elif country_enum == Country.USA:
-        job_data["interval"], job_data["min_amount"], job_data["max_amount"], job_data["currency"] = extract_salary(
-            job_data["description"],
-            enforce_annual_salary=enforce_annual_salary,
-        )
+        if salary is None:
+            salary = extract_salary(job_data["description"], enforce_annual_salary=enforce_annual_salary)
+        job_data["interval"], job_data["min_amount"], job_data["max_amount"], job_data["currency"] = salary
         job_data["salary_source"] = SalarySource.DESCRIPTION.value
 
     job_data["salary_source"] = job_data["salary_source"] if job_data.get("min_amount") else None
     return job_data
 
 
-def scrape_jobs(
+DESIRED_COLUMNS = [
+    "id",
+    "site",
+    "job_url",
+    "job_url_direct",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_type",
+    "salary_source",
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "is_remote",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "emails",
+    "description",
+    "company_industry",
+    "company_url",
+    "company_logo",
+    "company_url_direct",
+    "company_addresses",
+    "company_num_employees",
+    "company_revenue",
+    "company_description",
+]
+
+
+DESCRIPTION_HANDLE = "description_handle"
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _column_values(values: list[Any]) -> list[Any]:
+    """A column's cells as _JobsFrameBuilder stores them: NaN for missing cells if any has a value, else all None"""
+    if all(_is_missing(value) for value in values):
+        return [None] * len(values)
+    return [np.nan if _is_missing(value) else value for value in values]
+
+
+class _JobsFrameBuilder:
+    """
+    Accumulates processed job dicts straight into per-column lists and builds the final DataFrame once.
+    Produces the same frame as concatenating one-row frames with their all-NA columns dropped:
+    a column with at least one value gets NaN for missing cells, a column with none is all None.
+    """
+
+    def __init__(
+        self,
+        hyperlinks: bool = False,
+        description_handles: bool = False,
+        duplicate_ids: bool = False,
+        query_columns: bool = False,
+    ) -> None:
+        self.columns = ["job_url_hyper" if hyperlinks and column == "job_url" else column for column in DESIRED_COLUMNS]
+        if query_columns:
+            self.columns[self.columns.index("site") + 1 : self.columns.index("site") + 1] = QUERY_COLUMNS
+        if description_handles:
+            self.columns.insert(self.columns.index("description") + 1, DESCRIPTION_HANDLE)
+        if duplicate_ids:
+            self.columns.insert(self.columns.index("id") + 1, DUPLICATE_IDS)
+        self._data: dict[str, list[Any]] = {column: [] for column in self.columns}
+        self._has_value: dict[str, bool] = dict.fromkeys(self.columns, False)
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, job_data: dict[str, Any]) -> None:
+        for column in self.columns:
+            value = job_data.get(column)
+            if _is_missing(value):
+                value = None
+            else:
+                self._has_value[column] = True
+            self._data[column].append(value)
+        self._rows += 1
+
+    def build(self) -> pd.DataFrame:
+        if not self._rows:
+            return pd.DataFrame()
+        data = {
+            column: [np.nan if value is None else value for value in values] if self._has_value[column] else values
+            for column, values in self._data.items()
+        }
+        jobs_df = pd.DataFrame(data, columns=self.columns)
+        return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False]).reset_index(drop=True)
+
+    def build_arrow(self) -> pa.Table:
+        """Builds a typed Arrow table (see output.to_arrow) in the same row order as build(), without pandas."""
+        if not self._rows:
+            return to_arrow({})
+        sites, dates = self._data["site"], self._data["date_posted"]
+        # Stable sort by site, then newest first with undated jobs last, as pandas sorts the frame
+        order = sorted(
+            range(self._rows),
+            key=lambda row: (sites[row], dates[row] is None, -dates[row].toordinal() if dates[row] else 0),
+        )
+        return to_arrow({column: [values[row] for row in order] for column, values in self._data.items()})
+
+
+def _build_scraper_input(
     site_name: str | list[str] | Site | list[Site] | None = None,
     search_term: str | None = None,
     google_search_term: str | None = None,
@@ -120,6 +301,108 @@ def scrape_jobs(
     easy_apply: bool | None = None,
     results_wanted: int = 15,
     country_indeed: str = "usa",
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    linkedin_experience_levels: list[LinkedInExperienceLevel] | None = None,
+    linkedin_parser: str = "bs4",
+    linkedin_detail_concurrency: int = 5,
+    indeed_projection: str = "full",
+    indeed_page_size: int = 100,
+    offset: int | None = 0,
+    hours_old: int | None = None,
+    logger: logging.Logger | None = None,
+    cpu_workers: int | None = None,
+    defer_descriptions: bool = False,
+    **kwargs: Any,
+) -> ScraperInput:
+    return ScraperInput(
+        site_type=_get_site_type(site_name),
+        country=Country.from_string(country_indeed),
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=_get_enum_from_value(job_type),
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        linkedin_experience_levels=linkedin_experience_levels,
+        linkedin_parser=linkedin_parser,
+        linkedin_detail_concurrency=linkedin_detail_concurrency,
+        indeed_projection=indeed_projection,
+        indeed_page_size=indeed_page_size,
+        offset=offset,
+        hours_old=hours_old,
+        logger=logger,
+        cpu_workers=cpu_workers,
+        defer_descriptions=defer_descriptions,
+    )
+
+
+def _run_scraper(
+    site: Site,
+    scraper_input: ScraperInput,
+    logger: logging.Logger | None,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    page_callback: Callable[[list[JobPost]], None] | None = None,
+    stats: ScrapeStats | None = None,
+) -> JobResponse:
+    """Runs the site's scraper; stats collects its timings and counters, added to those of earlier scrapes if given"""
+    site_logger = logger if logger else create_logger(site.value)
+    if stats is None:
+        stats = ScrapeStats(site=site.value)
+    with collecting(stats, PARSE), using_cpu_pool(scraper_input.cpu_workers):
+        scraper = SCRAPER_MAPPING[site](logger=site_logger, proxies=proxies, ca_cert=ca_cert)
+        scraper.page_callback = page_callback
+        try:
+            response = scraper.scrape(scraper_input)
+        finally:
+            scraper.close()
+    response.stats = stats
+    return response
+
+
+def _job_to_record(
+    job: JobPost, site: str, enforce_annual_salary: bool, country_enum: Country, salary: Salary | None = None
+) -> dict:
+    # The field values themselves: the nested models are read directly rather than dumped to dicts and rebuilt
+    job_data = dict(vars(job))
+    job_data["site"] = site
+    return _process_job_data(job_data, enforce_annual_salary, country_enum, salary)
+
+
+def _description_salaries(
+    jobs: list[JobPost], enforce_annual_salary: bool, country_enum: Country
+) -> list[Salary | None]:
+    """Extracts the salaries of all jobs without compensation data at once (for USA searches, as _process_job_data)."""
+    if country_enum != Country.USA:
+        return [None] * len(jobs)
+    without_compensation = [index for index, job in enumerate(jobs) if not job.compensation]
+    salaries: list[Salary | None] = [None] * len(jobs)
+    rows = salary_rows(
+        (jobs[index].description for index in without_compensation), enforce_annual_salary=enforce_annual_salary
+    )
+    for index, salary in zip(without_compensation, rows):
+        salaries[index] = salary
+    return salaries
+
+
+def scrape_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | list[str] | None = None,
+    google_search_term: str | None = None,
+    location: str | list[str] | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
     hyperlinks: bool = False,
     proxies: list[str] | str | None = None,
     ca_cert: str | None = None,
@@ -127,116 +410,521 @@ def scrape_jobs(
     linkedin_fetch_description: bool | None = False,
     linkedin_company_ids: list[int] | None = None,
     linkedin_experience_levels: list[LinkedInExperienceLevel] | None = None,
+    linkedin_parser: str = "bs4",
+    linkedin_detail_concurrency: int = 5,
+    indeed_projection: str = "full",
+    indeed_page_size: int = 100,
     offset: int | None = 0,
     hours_old: int | None = None,
     enforce_annual_salary: bool = False,
     logger: logging.Logger | None = None,
+    stats_callback: Callable[[dict[str, ScrapeStats]], None] | None = None,
+    output_format: str = "pandas",
+    cpu_workers: int | None = None,
+    defer_descriptions: bool = False,
+    deduplicate: bool = False,
+    since_last_run: bool = False,
+    state_path: str | Path | None = None,
+    site_concurrency: int | dict[str, int] = DEFAULT_SITE_CONCURRENCY,
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | pa.Table:
     """
     Simultaneously scrapes job data from multiple job sites.
+    :param search_term: a search term, or a list of them to search every one (in every location) in one scrape
+    :param location: a location, or a list of them to search each in
+    :param linkedin_parser: HTML parser for LinkedIn pages: "bs4" (html.parser) or the faster "lxml"; both give the
+        same jobs
+    :param linkedin_detail_concurrency: with linkedin_fetch_description, how many of a search page's job pages are
+        fetched at once (1 fetches them one after another)
+    :param indeed_projection: fields to ask Indeed for: "full", or "listing" for title, company, location, salary
+        and job type only, without descriptions and employer details (much smaller pages)
+    :param indeed_page_size: jobs per Indeed search page request, 1 to 100
+    :param stats_callback: called with each site's ScrapeStats (timings per stage and request counts) once the
+        dataframe is built
+    :param output_format: "pandas" for a DataFrame, or "arrow" for a typed pyarrow Table (see output.to_arrow;
+        needs pyarrow)
+    :param cpu_workers: parse pages and convert descriptions in a pool of this many worker processes, shared by
+        all sites and reused by later calls (see shutdown_cpu_pools), instead of in the threads scraping them
+    :param defer_descriptions: skip fetching each job's detail page (LinkedIn, ZipRecruiter and Glassdoor) and
+        return the jobs with a description_handle column instead; resolve_descriptions fetches the descriptions of
+        the jobs that are still wanted
+    :param deduplicate: merge the listings of the same job on several sites into one row (see dedup.deduplicate_jobs),
+        with the ids of the listings merged into it in a duplicate_ids column
+    :param since_last_run: scrape incrementally (see state.py): each site searches only the hours since the newest
+        job its last run of this search term and location found (or hours_old, if fewer), stops paging at a page of
+        jobs found before, and returns only the jobs not found before
+    :param state_path: JSON file the incremental scrapes' state is kept in (state.DEFAULT_STATE_PATH by default)
+    :param site_concurrency: with several search terms or locations, how many of a site's searches run at once,
+        for every site or per site name (2 for the sites not named). All sites' searches share one pool of threads;
+        a job found by several searches is returned once, with the searches that found it in its search_term and
+        search_location columns. A search that fails is logged and finds no jobs (the others' jobs are still
+        returned), and is listed in its site's ScrapeStats.failed_queries (see stats_callback)
     :return: pandas dataframe containing job data
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedInScraper,
-        Site.INDEED: IndeedScraper,
-        Site.ZIP_RECRUITER: ZipRecruiterScraper,
-        Site.GLASSDOOR: GlassdoorScraper,
-        Site.GOOGLE: GoogleJobsScraper,
-    }
-
-    job_type_enum = _get_enum_from_value(job_type)
-    country_enum = Country.from_string(country_indeed)
-    site_types = _get_site_type(site_name)
-
-    scraper_input = ScraperInput(
-        site_type=site_types,
-        country=country_enum,
-        search_term=search_term,
+    if output_format not in OUTPUT_FORMATS:
+        raise OutputFormatError(output_format)
+    queries = _queries(search_term, location)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        # set per query by _scrape_queries
+        search_term=None,
         google_search_term=google_search_term,
-        location=location,
+        location=None,
         distance=distance,
         is_remote=is_remote,
-        job_type=job_type_enum,
+        job_type=job_type,
         easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
         description_format=description_format,
         linkedin_fetch_description=linkedin_fetch_description,
-        results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
         linkedin_experience_levels=linkedin_experience_levels,
+        linkedin_parser=linkedin_parser,
+        linkedin_detail_concurrency=linkedin_detail_concurrency,
+        indeed_projection=indeed_projection,
+        indeed_page_size=indeed_page_size,
         offset=offset,
         hours_old=hours_old,
         logger=logger,
+        cpu_workers=cpu_workers,
+        defer_descriptions=defer_descriptions,
     )
 
-    def scrape_site(site: Site) -> tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        site_logger = logger if logger else create_logger(site.value)
-        scraper = scraper_class(logger=site_logger, proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        site_name_display = site.value.capitalize().replace("_", "") # e.g. ZipRecruiter
-        site_logger.info(f"{site_name_display} scrape processing completed by scrape_site wrapper.")
-        return site.value, scraped_data
+    tag_queries = isinstance(search_term, list) or isinstance(location, list)
+    site_to_jobs_dict = _scrape_queries(
+        scraper_input,
+        queries,
+        site_concurrency,
+        tag_queries,
+        IncrementalRun(state_path) if since_last_run else None,
+        logger,
+        proxies,
+        ca_cert,
+    )
 
-    site_to_jobs_dict = {}
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {executor.submit(scrape_site, site): site for site in scraper_input.site_type}
+    return _build_jobs_frame(
+        site_to_jobs_dict,
+        hyperlinks,
+        enforce_annual_salary,
+        scraper_input.country,
+        stats_callback,
+        output_format,
+        scraper_input.defer_descriptions,
+        deduplicate,
+        tag_queries,
+    )
+
+
+def _queries(search_term: str | list[str] | None, location: str | list[str] | None) -> list[Query]:
+    """The searches of a scrape: every search term in every location, without repeats"""
+    terms = search_term if isinstance(search_term, list) else [search_term]
+    locations = location if isinstance(location, list) else [location]
+    return list(dict.fromkeys(itertools.product(terms, locations)))
+
+
+def _site_lanes(site: Site, site_concurrency: int | dict[str, int], queries: int) -> int:
+    if isinstance(site_concurrency, dict):
+        limit = site_concurrency.get(site.value, DEFAULT_SITE_CONCURRENCY)
+    else:
+        limit = site_concurrency
+    if limit < 1:
+        raise SiteConcurrencyError(site, limit)
+    return min(limit, queries)
+
+
+def _scrape_queries(
+    scraper_input: ScraperInput,
+    queries: list[Query],
+    site_concurrency: int | dict[str, int],
+    tag_queries: bool,
+    incremental: IncrementalRun | None,
+    logger: logging.Logger | None,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+) -> dict[str, JobResponse]:
+    """
+    Scrapes every site for every query on one pool of threads, each site working through the queries in at most
+    site_concurrency lanes of one scrape at a time. Each site's scrapes are merged into one response with the stats
+    of them all (see _merge_query_jobs). With several queries, a scrape that fails is logged, finds no jobs and is
+    listed in its site's stats.failed_queries, so one failing query or site doesn't lose the jobs of the others; the
+    scrape of a single query raises its error.
+    """
+    sites = scraper_input.site_type
+    lanes = [site for site in sites for _ in range(_site_lanes(site, site_concurrency, len(queries)))]
+    query_inputs = [
+        scraper_input.model_copy(update={"search_term": term, "location": location}) for term, location in queries
+    ]
+    pending = {site: deque(enumerate(query_inputs)) for site in sites}
+    stats = {site: ScrapeStats(site=site.value) for site in sites}
+
+    def scrape_lane(site: Site) -> list[tuple[int, JobResponse | None]]:
+        responses = []
+        while True:
+            try:
+                index, query_input = pending[site].popleft()
+            except IndexError:
+                return responses
+            site_input = incremental.site_input(site, query_input) if incremental else query_input
+            job_response = _scrape_query(site, site_input, len(queries), logger, proxies, ca_cert, stats[site])
+            responses.append((index, job_response))
+
+    site_responses: dict[Site, dict[int, JobResponse | None]] = {site: {} for site in sites}
+    with ThreadPoolExecutor(max_workers=max(len(lanes), 1)) as executor:
+        future_to_site = {executor.submit(scrape_lane, site): site for site in lanes}
         for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
+            site_responses[future_to_site[future]].update(future.result())
 
-    jobs_dfs = []
-    for site, job_response in site_to_jobs_dict.items():
+    site_to_jobs_dict = {}
+    for site, responses in site_responses.items():
+        ordered = [responses[index] for index in range(len(queries))]
+        if incremental:
+            # The watermarks of failed scrapes are left where they were
+            for query_input, job_response in zip(query_inputs, ordered):
+                if job_response is not None:
+                    incremental.advance(site, query_input, job_response)
+        jobs = _merge_query_jobs([response or JobResponse() for response in ordered], queries, tag_queries)
+        site_to_jobs_dict[site.value] = JobResponse(jobs=jobs, stats=stats[site])
+    if incremental:
+        incremental.save()
+    return site_to_jobs_dict
+
+
+def _scrape_query(
+    site: Site,
+    query_input: ScraperInput,
+    query_count: int,
+    logger: logging.Logger | None,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    stats: ScrapeStats,
+) -> JobResponse | None:
+    """One of the query_count scrapes of a site, or None if it failed and isn't the only one (which raises)"""
+    site_logger = logger or create_logger(site.value)
+    site_name_display = site.value.capitalize().replace("_", "")  # e.g. ZipRecruiter
+    query = (query_input.search_term, query_input.location)
+    try:
+        job_response = _run_scraper(site, query_input, logger, proxies, ca_cert, stats=stats)
+    except Exception:
+        if query_count == 1:
+            raise
+        site_logger.exception(f"{site_name_display} search for {query[0]!r} in {query[1]!r} failed")
+        with _failed_queries_lock:
+            stats.failed_queries.append(query)
+        return None
+    site_logger.info(
+        f"{site_name_display} search for {query[0]!r} in {query[1]!r} finished with {len(job_response.jobs)} jobs."
+    )
+    return job_response
+
+
+def _joined(values: Iterator[str | None]) -> str | None:
+    return QUERY_SEPARATOR.join(dict.fromkeys(value for value in values if value)) or None
+
+
+def _merge_query_jobs(responses: list[JobResponse], queries: list[Query], tag_queries: bool) -> list[JobPost]:
+    """
+    A site's jobs over all its queries' scrapes, each job once (as the first query found it). With tag_queries, each
+    job's search_term and search_location list those of the queries that found it.
+    """
+    if len(responses) == 1 and not tag_queries:
+        return responses[0].jobs
+    found: dict[str, tuple[JobPost, list[Query]]] = {}
+    for job_response, query in zip(responses, queries):
         for job in job_response.jobs:
-            job_data = job.dict()
-            job_data["site"] = site
-            processed_job = _process_job_data(job_data, enforce_annual_salary, country_enum)
-            jobs_dfs.append(pd.DataFrame([processed_job]))
-
-    if not jobs_dfs:
-        return pd.DataFrame()
-
-    # Filter out all-NA columns from each DataFrame before concatenation
-    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-    # Desired column order
-    desired_order = [
-        "id",
-        "site",
-        "job_url_hyper" if hyperlinks else "job_url",
-        "job_url_direct",
-        "title",
-        "company",
-        "location",
-        "date_posted",
-        "job_type",
-        "salary_source",
-        "interval",
-        "min_amount",
-        "max_amount",
-        "currency",
-        "is_remote",
-        "job_level",
-        "job_function",
-        "listing_type",
-        "emails",
-        "description",
-        "company_industry",
-        "company_url",
-        "company_logo",
-        "company_url_direct",
-        "company_addresses",
-        "company_num_employees",
-        "company_revenue",
-        "company_description",
+            job_queries = found.setdefault(job.id or str(id(job)), (job, []))[1]
+            job_queries.append(query)
+    if not tag_queries:
+        return [job for job, _ in found.values()]
+    return [
+        job.model_copy(
+            update={
+                "search_term": _joined(term for term, _ in job_queries),
+                "search_location": _joined(location for _, location in job_queries),
+            }
+        )
+        for job, job_queries in found.values()
     ]
 
-    # Ensure all desired columns are present, adding missing ones as empty
-    for column in desired_order:
-        if column not in jobs_df.columns:
-            jobs_df[column] = None
 
-    # Reorder and sort the DataFrame
-    jobs_df = jobs_df[desired_order]
-    return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False]).reset_index(drop=True)
+async def scrape_jobs_async(
+    *,
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    hyperlinks: bool = False,
+    enforce_annual_salary: bool = False,
+    logger: logging.Logger | None = None,
+    max_concurrency: int = 8,
+    stats_callback: Callable[[dict[str, ScrapeStats]], None] | None = None,
+    output_format: str = "pandas",
+    deduplicate: bool = False,
+    since_last_run: bool = False,
+    state_path: str | Path | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame | pa.Table:
+    """
+    asyncio counterpart of scrape_jobs, taking the same search arguments for a single search term and location
+    (lists of them raise QueryListError). Every site is a coroutine on the running event loop, so many searches
+    can be awaited together (e.g. with asyncio.gather) from one worker.
+    The scrapers' HTTP clients are blocking, so each site coroutine drives its scraper in a worker thread;
+    at most max_concurrency site scrapes of this call hold a thread at any time.
+    :return: pandas dataframe containing job data
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise OutputFormatError(output_format)
+    _check_single_query("scrape_jobs_async", kwargs)
+    scraper_input = _build_scraper_input(logger=logger, **kwargs)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    incremental = IncrementalRun(state_path) if since_last_run else None
+
+    async def scrape_site(site: Site) -> tuple[str, JobResponse]:
+        site_input = incremental.site_input(site, scraper_input) if incremental else scraper_input
+        async with semaphore:
+            scraped_data = await asyncio.to_thread(_run_scraper, site, site_input, logger, proxies, ca_cert)
+        return site.value, scraped_data
+
+    site_to_jobs_dict = dict(await asyncio.gather(*(scrape_site(site) for site in scraper_input.site_type)))
+    if incremental:
+        for site, job_response in site_to_jobs_dict.items():
+            incremental.advance(Site(site), scraper_input, job_response)
+        incremental.save()
+    return _build_jobs_frame(
+        site_to_jobs_dict,
+        hyperlinks,
+        enforce_annual_salary,
+        scraper_input.country,
+        stats_callback,
+        output_format,
+        scraper_input.defer_descriptions,
+        deduplicate,
+    )
+
+
+def _fetch_descriptions(
+    handles: list[DescriptionHandle],
+    concurrency: int,
+    logger: logging.Logger | None,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+) -> dict[DescriptionHandle, dict[str, Any]]:
+    """The fields fetched for each handle, with one scraper per site, country and description format"""
+    scrapers: dict[tuple[Site, Country, Any], Scraper] = {}
+    try:
+        for handle in handles:
+            group = (handle.site, handle.country, handle.description_format)
+            if group not in scrapers:
+                scraper = SCRAPER_MAPPING[handle.site](
+                    logger=logger or create_logger(handle.site.value), proxies=proxies, ca_cert=ca_cert
+                )
+                scrapers[group] = scraper
+                scraper.start_description_fetch(
+                    ScraperInput(
+                        site_type=[handle.site], country=handle.country, description_format=handle.description_format
+                    )
+                )
+
+        def fetch(handle: DescriptionHandle) -> dict[str, Any]:
+            return scrapers[handle.site, handle.country, handle.description_format].fetch_description(handle.key)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return dict(zip(handles, executor.map(fetch, handles)))
+    finally:
+        for scraper in scrapers.values():
+            scraper.close()
+
+
+def _description_fields(fields: dict[str, Any]) -> dict[str, Any]:
+    """Fetched JobPost fields as _process_job_data writes them into records"""
+    record = dict(fields)
+    if record.get("job_type"):
+        record["job_type"] = ", ".join(job_type.value[0] for job_type in record["job_type"])
+    if record.get("emails"):
+        record["emails"] = ", ".join(record["emails"])
+    return record
+
+
+SALARY_COLUMNS = ("interval", "min_amount", "max_amount", "currency", "salary_source")
+
+
+def _fill_description_salaries(columns: dict[str, list[Any]], rows: list[int], enforce_annual_salary: bool) -> None:
+    salaries = salary_rows((columns["description"][row] for row in rows), enforce_annual_salary=enforce_annual_salary)
+    for row, salary in zip(rows, salaries):
+        values = (*salary, SalarySource.DESCRIPTION.value if salary[1] else None)
+        for column, value in zip(SALARY_COLUMNS, values):
+            columns.setdefault(column, [None] * len(columns["description"]))[row] = value
+
+
+def resolve_descriptions(
+    jobs: pd.DataFrame,
+    concurrency: int = 8,
+    enforce_annual_salary: bool = False,
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    logger: logging.Logger | None = None,
+) -> pd.DataFrame:
+    """
+    Fetches the descriptions scrape_jobs(defer_descriptions=True) deferred, for the jobs left in its (filtered)
+    dataframe. Returns a copy with the descriptions and the other fields from the same pages filled in as a full scrape
+    fills them, including salaries found in USA descriptions, and their handles cleared. Each distinct job is fetched
+    once, at most concurrency at a time, and detail pages are served from the response cache when one is set (see
+    set_response_cache). Jobs whose description could not be fetched keep their handle, so a later call retries them.
+    """
+    jobs = jobs.copy()
+    if DESCRIPTION_HANDLE not in jobs.columns:
+        return jobs
+    handles = {value: DescriptionHandle.decode(value) for value in jobs[DESCRIPTION_HANDLE] if isinstance(value, str)}
+    fetched = _fetch_descriptions(list(dict.fromkeys(handles.values())), concurrency, logger, proxies, ca_cert)
+
+    columns = {column: list(jobs[column]) for column in jobs.columns}
+    touched = {DESCRIPTION_HANDLE}
+    needs_salary = []
+    for row, value in enumerate(columns[DESCRIPTION_HANDLE]):
+        if not isinstance(value, str):
+            continue
+        fields = fetched[handles[value]]
+        if fields.get("description") is None:
+            continue
+        for field, field_value in _description_fields(fields).items():
+            columns.setdefault(field, [None] * len(jobs))[row] = field_value
+            touched.add(field)
+        columns[DESCRIPTION_HANDLE][row] = None
+        # As _process_job_data: jobs without compensation data get the salary of their description
+        if handles[value].country == Country.USA and "currency" in columns and _is_missing(columns["currency"][row]):
+            needs_salary.append(row)
+
+    if needs_salary:
+        _fill_description_salaries(columns, needs_salary, enforce_annual_salary)
+        touched.update(SALARY_COLUMNS)
+
+    for column in touched:
+        jobs[column] = pd.Series(_column_values(columns[column]), index=jobs.index)
+    return jobs
+
+
+def _build_jobs_frame(
+    site_to_jobs_dict: dict[str, JobResponse],
+    hyperlinks: bool,
+    enforce_annual_salary: bool,
+    country_enum: Country,
+    stats_callback: Callable[[dict[str, ScrapeStats]], None] | None = None,
+    output_format: str = "pandas",
+    description_handles: bool = False,
+    deduplicate: bool = False,
+    query_columns: bool = False,
+) -> pd.DataFrame | pa.Table:
+    builder = _JobsFrameBuilder(
+        hyperlinks=hyperlinks,
+        description_handles=description_handles,
+        duplicate_ids=deduplicate,
+        query_columns=query_columns,
+    )
+    records = []
+    for site, job_response in site_to_jobs_dict.items():
+        if job_response.stats is None:
+            job_response.stats = ScrapeStats(site=site)
+        with collecting(job_response.stats, ASSEMBLY):
+            salaries = _description_salaries(job_response.jobs, enforce_annual_salary, country_enum)
+            for job, salary in zip(job_response.jobs, salaries):
+                record = _job_to_record(job, site, enforce_annual_salary, country_enum, salary)
+                if deduplicate:
+                    records.append(record)
+                else:
+                    builder.append(record)
+    start = time.perf_counter()
+    # Duplicates are found across all sites' jobs, so deduplicating is charged to the sites like building the frame
+    if deduplicate:
+        for record in deduplicate_records(records):
+            builder.append(record)
+    jobs = builder.build_arrow() if output_format == "arrow" else builder.build()
+    elapsed = time.perf_counter() - start
+    # The frame is built for all sites at once, so each site is charged its share of the rows
+    total_jobs = sum(len(job_response.jobs) for job_response in site_to_jobs_dict.values())
+    for job_response in site_to_jobs_dict.values():
+        if total_jobs:
+            add_time(job_response.stats, ASSEMBLY, elapsed * len(job_response.jobs) / total_jobs)
+    if stats_callback is not None:
+        stats_callback({site: job_response.stats for site, job_response in site_to_jobs_dict.items()})
+    return jobs
+
+
+class _StreamClosed(BaseException):
+    """Raised inside scraper threads to stop them once the iter_jobs consumer has gone away."""
+
+
+class _JobStream:
+    """Queue shared by the iter_jobs scraper threads (producers) and the caller (consumer)."""
+
+    _SITE_DONE = object()
+
+    def __init__(self, max_queue_size: int | None, country: Country) -> None:
+        self.country = country
+        self.jobs_queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size or 0)
+        self.closed = threading.Event()
+
+    def put(self, item: Any) -> None:
+        while not self.closed.is_set():
+            try:
+                self.jobs_queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                return
+        raise _StreamClosed
+
+    def produce(self, site: Site, run_scraper: Callable[..., JobResponse], enforce_annual_salary: bool) -> None:
+        def on_page(jobs: list[JobPost]) -> None:
+            for job in jobs:
+                with stage(ASSEMBLY):
+                    record = _job_to_record(job, site.value, enforce_annual_salary, self.country)
+                self.put(record)
+
+        try:
+            run_scraper(page_callback=on_page)
+            self.put(self._SITE_DONE)
+        except _StreamClosed:
+            return
+        except Exception as e:
+            with contextlib.suppress(_StreamClosed):
+                self.put(e)
+
+    def consume(self, producers: int) -> Iterator[dict[str, Any]]:
+        while producers:
+            item = self.jobs_queue.get()
+            if item is self._SITE_DONE:
+                producers -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+
+
+def iter_jobs(
+    *,
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    enforce_annual_salary: bool = False,
+    logger: logging.Logger | None = None,
+    max_queue_size: int | None = None,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Streaming counterpart of scrape_jobs: scrapes all sites concurrently and yields each job as soon as
+    its page has been parsed, as the normalized dict _process_job_data produces (plus "site").
+    Takes the same search arguments as scrape_jobs, for a single search term and location (lists of them raise
+    QueryListError).
+    :param max_queue_size: bound on jobs waiting to be consumed; when full, scrapers block until the caller
+        catches up. Unbounded by default.
+    :return: iterator of job dicts, in page order per site and arrival order across sites
+    """
+    _check_single_query("iter_jobs", kwargs)
+    scraper_input = _build_scraper_input(logger=logger, **kwargs)
+    stream = _JobStream(max_queue_size, scraper_input.country)
+    executor = ThreadPoolExecutor(max_workers=len(scraper_input.site_type))
+    try:
+        for site in scraper_input.site_type:
+            run_scraper = functools.partial(_run_scraper, site, scraper_input, logger, proxies, ca_cert)
+            executor.submit(stream.produce, site, run_scraper, enforce_annual_salary)
+        yield from stream.consume(len(scraper_input.site_type))
+    finally:
+        stream.closed.set()
+        executor.shutdown(wait=False)
@@ -0,0 +1,319 @@
+"""
+jobspy2.dedup
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the deduplication of scraped jobs across sites. The same posting is usually listed on several
+sites under different urls; its listings are found by a canonical fingerprint of their normalized title, company and
+location, and by MinHash signatures of their descriptions banded into locality-sensitive hash buckets, so only jobs
+sharing a bucket are ever compared and the work grows linearly with the number of jobs. Listings alike on one site
+under different ids are separate openings and are kept apart. Each cluster of listings is merged into its most
+complete record.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Column of a merged record listing the ids of the other records merged into it
+DUPLICATE_IDS = "duplicate_ids"
+DEFAULT_THRESHOLD = 0.8
+NUM_PERM = 64
+BANDS = 16
+SHINGLE_WORDS = 3
+# Shorter descriptions (e.g. search result snippets) say too little to tell postings apart
+MIN_DESCRIPTION_WORDS = 20
+# Filled from a single record together, so a merged salary never mixes the amounts of one listing with the
+# interval or currency of another
+SALARY_COLUMNS = ("interval", "min_amount", "max_amount", "currency", "salary_source")
+# The searches of a multi-query scrape that found a job, kept for all the records merged. Locations have commas
+# of their own, so the searches are separated by semicolons.
+QUERY_COLUMNS = ("search_term", "search_location")
+QUERY_SEPARATOR = "; "
+
+WORD = re.compile(r"[^\W_]+")
+COMPANY_SUFFIXES = frozenset({
+    "the",
+    "inc",
+    "llc",
+    "ltd",
+    "limited",
+    "corp",
+    "corporation",
+    "co",
+    "company",
+    "plc",
+    "gmbh",
+    "lp",
+    "llp",
+})
+_rng = np.random.default_rng(20240501)
+# The multipliers (odd) and increments of the permutations' hashes, seeded so signatures are stable across runs
+_A = _rng.integers(1, 1 << 63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 1 << 63, size=NUM_PERM, dtype=np.uint64)
+_SHINGLE_MULTIPLIERS = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F))
+
+Fingerprint = tuple[str, str, str]
+
+
+class DeduplicationError(ValueError):
+    def __init__(self, threshold: float) -> None:
+        self.message = f"threshold must be a description similarity above 0 and at most 1, got {threshold!r}"
+        super().__init__(self.message)
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return True
+    return isinstance(value, (str, list, tuple)) and not value
+
+
+def _words(text: Any) -> list[str]:
+    return WORD.findall(text.lower()) if isinstance(text, str) else []
+
+
+def normalize_company(company: Any) -> str:
+    return " ".join(word for word in _words(company) if word not in COMPANY_SUFFIXES)
+
+
+def normalize_location(location: Any) -> str:
+    """City and state, without the country some sites add ("Austin, TX, US" and "Austin, TX" are the same place)"""
+    if not isinstance(location, str):
+        return ""
+    return " ".join(_words(",".join(location.split(",")[:2])))
+
+
+def fingerprint(record: Mapping[str, Any]) -> Fingerprint | None:
+    """
+    The record's normalized title, company and location, or None without all three (jobs with the same title at
+    the same company are only the same job in the same place)
+    """
+    title, company = " ".join(_words(record.get("title"))), normalize_company(record.get("company"))
+    location = normalize_location(record.get("location"))
+    if not title or not company or not location:
+        return None
+    return title, company, location
+
+
+class _WordHashes(dict):
+    """The hash of each distinct word, computed on first lookup"""
+
+    def __missing__(self, word: str) -> int:
+        hashed = self[word] = zlib.crc32(word.encode()) + 1
+        return hashed
+
+
+def shingle_hashes(description: Any, word_hashes: dict[str, int] | None = None) -> np.ndarray | None:
+    """
+    The distinct hashes of the description's runs of SHINGLE_WORDS words, or None for a description shorter than
+    MIN_DESCRIPTION_WORDS. word_hashes (a _WordHashes shared by the descriptions hashed together) saves hashing
+    each word again.
+    """
+    words = _words(description)
+    if len(words) < MIN_DESCRIPTION_WORDS:
+        return None
+    if word_hashes is None:
+        word_hashes = _WordHashes()
+    hashes = np.fromiter(map(word_hashes.__getitem__, words), dtype=np.uint64, count=len(words))
+    # uint64 arithmetic wraps around, which is what mixes the words of a shingle into one hash
+    shingles = hashes[SHINGLE_WORDS - 1 :].copy()
+    for offset, multiplier in enumerate(_SHINGLE_MULTIPLIERS[: SHINGLE_WORDS - 1]):
+        shingles += hashes[offset : len(hashes) - SHINGLE_WORDS + 1 + offset] * multiplier
+    return np.unique(shingles)
+
+
+def minhash(shingles: np.ndarray) -> np.ndarray:
+    """The NUM_PERM minimum hashes of a set of shingle hashes; equal entries estimate their sets' Jaccard similarity"""
+    # Multiply-shift hashing: the high bits of a * x + b (mod 2**64) for each permutation's a and b
+    hashes = np.multiply.outer(_A, shingles)
+    hashes += _B[:, None]
+    hashes >>= np.uint64(32)
+    return hashes.min(axis=1)
+
+
+class _UnionFind:
+    """
+    Clusters of records, with the ids each cluster holds per site: a site lists each of its jobs once, so two of its
+    records with different ids are different jobs, and clusters holding them are never joined by a likeness alone
+    """
+
+    def __init__(self, records: Sequence[Mapping[str, Any]]) -> None:
+        self.parent = list(range(len(records)))
+        self.site_ids: list[dict[Any, set[Any]]] = [
+            {record.get("site"): {index if _is_missing(record.get("id")) else record.get("id")}}
+            for index, record in enumerate(records)
+        ]
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int, across_sites: bool = False) -> bool:
+        """
+        Joins the clusters of two records and returns whether they are now one. across_sites only joins clusters
+        without a site listing different ids in them.
+        """
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return True
+        if across_sites and self._listed_apart(first, second):
+            return False
+        # The earliest record stays the root, so clusters come out in the order of their first record
+        root, child = min(first, second), max(first, second)
+        self.parent[child] = root
+        for site, ids in self.site_ids[child].items():
+            self.site_ids[root].setdefault(site, set()).update(ids)
+        self.site_ids[child] = {}
+        return True
+
+    def _listed_apart(self, first: int, second: int) -> bool:
+        first_ids, second_ids = self.site_ids[first], self.site_ids[second]
+        return any(len(ids | first_ids[site]) > 1 for site, ids in second_ids.items() if site in first_ids)
+
+
+def duplicate_clusters(records: Sequence[Mapping[str, Any]], threshold: float = DEFAULT_THRESHOLD) -> list[list[int]]:
+    """
+    Groups the indices of records listing the same job: records with the same job url, and records with the same
+    fingerprint or of the same (or an unknown) company with descriptions whose estimated Jaccard similarity is at
+    least threshold, as long as that doesn't put two records of one site with different ids together. Each cluster
+    is in record order, and clusters are ordered by their first record.
+    """
+    if not 0 < threshold <= 1:
+        raise DeduplicationError(threshold)
+    clusters = _UnionFind(records)
+    first_by_url: dict[Any, int] = {}
+    by_fingerprint: dict[Fingerprint, list[int]] = {}
+    for index, record in enumerate(records):
+        job_url = record.get("job_url")
+        if not _is_missing(job_url):
+            clusters.union(first_by_url.setdefault(job_url, index), index)
+        key = fingerprint(record)
+        if key is None:
+            continue
+        # Joined with the first earlier record of the fingerprint it may be joined with, if any
+        candidates = by_fingerprint.setdefault(key, [])
+        if not any(clusters.union(candidate, index, across_sites=True) for candidate in candidates):
+            candidates.append(index)
+
+    word_hashes = _WordHashes()
+    signed: list[int] = []
+    signatures = []
+    for index, record in enumerate(records):
+        shingles = shingle_hashes(record.get("description"), word_hashes)
+        if shingles is not None:
+            signed.append(index)
+            signatures.append(minhash(shingles))
+    if signatures:
+        _join_similar(records, signed, np.vstack(signatures), threshold, clusters)
+
+    members: dict[int, list[int]] = {}
+    for index in range(len(records)):
+        members.setdefault(clusters.find(index), []).append(index)
+    return list(members.values())
+
+
+def _join_similar(
+    records: Sequence[Mapping[str, Any]],
+    signed: list[int],
+    signatures: np.ndarray,
+    threshold: float,
+    clusters: _UnionFind,
+) -> None:
+    """
+    Joins the signed records whose signatures share a band with a record they are similar enough to. Each record is
+    compared with the first record of each of its buckets only, so a bucket of many similar records costs one
+    comparison per record.
+    """
+    companies = [normalize_company(records[index].get("company")) for index in signed]
+    rows = NUM_PERM // BANDS
+    for band in range(BANDS):
+        first_in_bucket: dict[bytes, int] = {}
+        band_rows = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        for position in range(len(signed)):
+            first = first_in_bucket.setdefault(band_rows[position].tobytes(), position)
+            if first == position or (
+                companies[first] and companies[position] and companies[first] != companies[position]
+            ):
+                continue
+            if np.count_nonzero(signatures[first] == signatures[position]) >= threshold * NUM_PERM:
+                clusters.union(signed[first], signed[position], across_sites=True)
+
+
+def _completeness(record: Mapping[str, Any]) -> tuple[int, int]:
+    description = record.get("description")
+    return (
+        sum(not _is_missing(value) for value in record.values()),
+        len(description) if isinstance(description, str) else 0,
+    )
+
+
+def merge_cluster(records: Sequence[Mapping[str, Any]], cluster: Sequence[int]) -> dict[str, Any]:
+    """
+    The cluster's most complete record (the one with the most fields, then the longest description, then the
+    earliest), with its missing fields taken from the others in record order and the others' ids in DUPLICATE_IDS.
+    """
+    primary = max(cluster, key=lambda index: (_completeness(records[index]), -index))
+    merged = dict(records[primary])
+    others = [records[index] for index in cluster if index != primary]
+    for column in QUERY_COLUMNS:
+        if column in merged:
+            merged[column] = _joined(records[index].get(column) for index in cluster)
+    for column in {column for record in others for column in record}:
+        if column in SALARY_COLUMNS or column in QUERY_COLUMNS or not _is_missing(merged.get(column)):
+            continue
+        merged[column] = next(
+            (record[column] for record in others if not _is_missing(record.get(column))), merged.get(column)
+        )
+    if not _has_salary(merged):
+        salaried = next((record for record in others if _has_salary(record)), None)
+        if salaried is not None:
+            merged.update({column: salaried.get(column) for column in SALARY_COLUMNS})
+    # Records merged by an earlier deduplication bring the ids merged into them along
+    merged_ids = [records[primary].get(DUPLICATE_IDS)]
+    for record in others:
+        merged_ids += [record.get("id"), record.get(DUPLICATE_IDS)]
+    # A listing found twice on its site has the primary record's id, which isn't a duplicate of itself
+    ids = list(dict.fromkeys(str(value) for value in merged_ids if not _is_missing(value)))
+    ids = [value for value in ids if value != str(merged.get("id"))]
+    merged[DUPLICATE_IDS] = ", ".join(ids) if ids else None
+    return merged
+
+
+def _joined(lists: Iterable[Any]) -> str | None:
+    """The distinct values of QUERY_SEPARATOR separated lists, as one list"""
+    values = [value for joined in lists if not _is_missing(joined) for value in str(joined).split(QUERY_SEPARATOR)]
+    return QUERY_SEPARATOR.join(dict.fromkeys(values)) or None
+
+
+def _has_salary(record: Mapping[str, Any]) -> bool:
+    return not (_is_missing(record.get("min_amount")) and _is_missing(record.get("max_amount")))
+
+
+def deduplicate_records(
+    records: Sequence[Mapping[str, Any]], threshold: float = DEFAULT_THRESHOLD
+) -> list[dict[str, Any]]:
+    """One merged record per cluster of duplicate_clusters, in the order of the clusters' first records"""
+    return [merge_cluster(records, cluster) for cluster in duplicate_clusters(records, threshold)]
+
+
+def deduplicate_jobs(jobs: pd.DataFrame, threshold: float = DEFAULT_THRESHOLD) -> pd.DataFrame:
+    """
+    Collapses the listings of the same job in a jobs DataFrame (e.g. the frames of several scrape_jobs calls
+    concatenated) into one row each, with a DUPLICATE_IDS column holding the ids of the rows merged into it.
+    :param threshold: how similar (0 to 1, as estimated Jaccard similarity of their word shingles) two
+        descriptions must be for their jobs to count as the same
+    """
+    if jobs.empty:
+        return jobs.copy()
+    columns = [*jobs.columns, *([DUPLICATE_IDS] if DUPLICATE_IDS not in jobs.columns else [])]
+    merged = deduplicate_records(jobs.to_dict("records"), threshold)
+    return pd.DataFrame(merged, columns=columns)
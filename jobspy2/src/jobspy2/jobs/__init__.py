@@ -242,6 +242,11 @@ class JobPost(BaseModel):
     location: Location | None
 
     description: str | None = None
+    # set instead of description by deferred scrapes, see scrapers.descriptions
+    description_handle: str | None = None
+    # the search terms and locations of a multi-query scrape that found the job, separated by "; "
+    search_term: str | None = None
+    search_location: str | None = None
     company_url: str | None = None
     company_url_direct: str | None = None
 
@@ -270,8 +275,32 @@ class JobPost(BaseModel):
     job_function: str | None = None
 
 
+class ScrapeStats(BaseModel):
+    """
+    Where one site's scrape spent its time and what it fetched. timings holds seconds per stage ("network", "sleep",
+    "parse", "markdown", "salary", "assembly"); each stage excludes the stages nested in it, and time spent in
+    worker threads is summed per thread, so the stages can add up to more than the wall time. failed_queries lists
+    the (search term, location) of the searches of a multi-query scrape that failed and found no jobs.
+    """
+
+    site: str | None = None
+    timings: dict[str, float] = {}
+    requests: int = 0
+    pages: int = 0
+    detail_pages: int = 0
+    cache_hits: int = 0
+    bytes: int = 0
+    retries: int = 0
+    failed_queries: list[tuple[str | None, str | None]] = []
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
+    stats: ScrapeStats | None = None
 
 
 class CountryError(Exception):
@@ -0,0 +1,134 @@
+"""
+jobspy2.output
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the typed Arrow table and Parquet writers for scraped jobs. pyarrow is an optional dependency
+(pip install 'jobspy2[parquet]') that is only imported when one of them is used.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+OUTPUT_FORMATS = ("pandas", "arrow")
+# Few distinct values repeated across many rows, so they are stored as indices into a dictionary of values
+DICTIONARY_COLUMNS = frozenset({"site", "company", "location"})
+FLOAT_COLUMNS = frozenset({"min_amount", "max_amount"})
+BOOL_COLUMNS = frozenset({"is_remote"})
+DATE_COLUMNS = frozenset({"date_posted"})
+# Partition column holding the day the jobs were written, for nightly pulls
+SCRAPE_DATE = "date"
+
+JobsData = Union[pd.DataFrame, Mapping[str, Sequence[Any]]]
+
+
+class MissingDependencyError(ImportError):
+    def __init__(self, feature: str) -> None:
+        self.message = f"{feature} requires pyarrow; install it with: pip install 'jobspy2[parquet]'"
+        super().__init__(self.message)
+
+
+class OutputFormatError(ValueError):
+    def __init__(self, output_format: str) -> None:
+        self.message = f"Invalid output format: {output_format!r}. Valid formats: {', '.join(OUTPUT_FORMATS)}"
+        super().__init__(self.message)
+
+
+def _import_pyarrow(feature: str) -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise MissingDependencyError(feature) from e
+    return pyarrow
+
+
+def column_type(column: str) -> pa.DataType:
+    """The Arrow type jobs are stored with in column; columns that are not job fields are strings."""
+    pa = _import_pyarrow("Arrow output")
+    if column in DICTIONARY_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    if column in FLOAT_COLUMNS:
+        return pa.float64()
+    if column in BOOL_COLUMNS:
+        return pa.bool_()
+    if column in DATE_COLUMNS:
+        return pa.date32()
+    return pa.string()
+
+
+def jobs_schema(columns: Sequence[str]) -> pa.Schema:
+    pa = _import_pyarrow("Arrow output")
+    return pa.schema([pa.field(column, column_type(column)) for column in columns])
+
+
+def _text(value: Any) -> str | None:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    return value if isinstance(value, str) else str(value)
+
+
+def _column_array(pa: Any, column: str, values: Any) -> pa.Array:
+    data_type = column_type(column)
+    if pa.types.is_dictionary(data_type):
+        return _column_array(pa, "", values).dictionary_encode()
+    try:
+        return pa.array(values, type=data_type, from_pandas=True)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        if not pa.types.is_string(data_type):
+            raise
+    # Some text fields can hold enums (e.g. a salary interval) or numbers, which are stored as their text
+    return pa.array([_text(value) for value in values], type=data_type)
+
+
+def to_arrow(jobs: JobsData) -> pa.Table:
+    """
+    Converts scraped jobs, either a scrape_jobs DataFrame or a mapping of column name to values, into an Arrow table
+    with typed columns: dates as date32, salaries as float64, is_remote as bool, site, company and location
+    dictionary-encoded and everything else as strings. Missing values (None or NaN) become nulls.
+    """
+    pa = _import_pyarrow("Arrow output")
+    columns = list(jobs.columns) if isinstance(jobs, pd.DataFrame) else list(jobs)
+    arrays = [_column_array(pa, column, jobs[column]) for column in columns]
+    return pa.Table.from_arrays(arrays, schema=jobs_schema(columns))
+
+
+def write_parquet(
+    jobs: JobsData | pa.Table,
+    path: str | Path,
+    partition_by: Sequence[str] | None = None,
+    scrape_date: datetime.date | None = None,
+    compression: str = "zstd",
+) -> None:
+    """
+    Writes scraped jobs to Parquet. Without partition_by, path is a single file. With it, path is the root of a
+    hive-partitioned dataset (e.g. path/site=linkedin/date=2024-05-01/<uuid>-0.parquet) that repeated writes add
+    files to. partition_by may name "date", the day the jobs were scraped (scrape_date, today by default).
+    """
+    pa = _import_pyarrow("Parquet output")
+    import pyarrow.parquet as pq
+
+    table = jobs if isinstance(jobs, pa.Table) else to_arrow(jobs)
+    if not partition_by:
+        pq.write_table(table, str(path), compression=compression)
+        return
+    if SCRAPE_DATE in partition_by and SCRAPE_DATE not in table.column_names:
+        day = (scrape_date or datetime.date.today()).isoformat()
+        table = table.append_column(SCRAPE_DATE, pa.array([day] * table.num_rows, type=pa.string()))
+    # Partition values are path segments, so dictionary-encoded columns are written as their plain values
+    for column in partition_by:
+        index = table.column_names.index(column)
+        if pa.types.is_dictionary(table.schema.field(index).type):
+            table = table.set_column(index, column, table.column(index).cast(pa.string()))
+    pq.write_to_dataset(table, str(path), partition_cols=list(partition_by), compression=compression)
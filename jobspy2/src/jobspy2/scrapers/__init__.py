@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 import logging
-from .utils import create_logger 
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import requests
 
 from ..jobs import (
     BaseModel,
     Country,
     DescriptionFormat,
     Enum,
+    JobPost,
     JobResponse,
     JobType,
 )
+from .proxy_health import proxy_health
+from .ratelimit import rate_limiter
+from .session_pool import SessionKey, session_key, session_pool
+from .utils import create_logger, create_session
 
 
 class Site(Enum):
@@ -36,6 +45,16 @@ class LinkedInExperienceLevel(Enum):
     EXECUTIVE = "executive"
 
 
+class ParserBackend(Enum):
+    BS4 = "bs4"
+    LXML = "lxml"
+
+
+class IndeedProjection(Enum):
+    LISTING = "listing"
+    FULL = "full"
+
+
 class ScraperInput(BaseModel):
     site_type: list[Site]
     search_term: str | None = None
@@ -52,9 +71,17 @@ class ScraperInput(BaseModel):
     linkedin_company_ids: list[int] | None = None
     linkedin_experience_levels: list[LinkedInExperienceLevel] | None = None
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
+    linkedin_parser: ParserBackend = ParserBackend.BS4
+    linkedin_detail_concurrency: int = 5
+    indeed_projection: IndeedProjection = IndeedProjection.FULL
+    indeed_page_size: int = 100
+    cpu_workers: int | None = None
+    defer_descriptions: bool = False
 
     results_wanted: int = 15
     hours_old: int | None = None
+    # ids of the jobs earlier runs of an incremental scrape found (see state.py); a page of only those ends the search
+    seen_job_ids: frozenset[str] | None = None
 
     logger: logging.Logger | None = None
 
@@ -65,6 +92,82 @@ class Scraper(ABC):
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.logger = logger
+        self.page_callback: Callable[[list[JobPost]], None] | None = None
+        self._published = 0
+        self._leased_sessions: list[tuple[SessionKey, requests.Session]] = []
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def _acquire_session(self, **session_kwargs: Any) -> requests.Session:
+        """
+        Leases a session for this scraper's site, proxies and ca_cert from the shared pool, creating one with
+        create_session(**session_kwargs) when none is idle. Leases are handed back by close().
+        """
+        key = session_key(self.site.value, self.proxies, self.ca_cert)
+
+        def factory() -> requests.Session:
+            session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                pool_maxsize=session_pool.pool_maxsize,
+                proxy_pool=proxy_health.get(self.site.value, self.proxies),
+                **session_kwargs,
+            )
+            session.throttle = partial(rate_limiter.acquire, self.site.value, self.proxies)
+            session.initial_headers = dict(session.headers)
+            return session
+
+        session = session_pool.acquire(key, factory)
+        self._leased_sessions.append((key, session))
+        return session
+
+    def start_description_fetch(self, scraper_input: ScraperInput) -> None:
+        """Prepares the scraper to fetch descriptions deferred by a scrape with scraper_input."""
+        self.scraper_input = scraper_input
+
+    def fetch_description(self, key: str) -> dict[str, Any]:
+        """
+        The JobPost fields a deferred job's detail page fills in (its description and what comes with it), by the key
+        of its description handle. Sites whose search results carry full descriptions never defer them.
+        """
+        return {}
+
+    def close(self) -> None:
+        """
+        Returns the scraper's sessions to the shared pool so later scrapes reuse their connections. The cookies and
+        headers the scrape set are dropped first, so the next scrape starts its site session afresh instead of
+        reusing cookies that may have expired or been blocked.
+        """
+        while self._leased_sessions:
+            key, session = self._leased_sessions.pop()
+            session.cookies.clear()
+            session.headers.clear()
+            session.headers.update(session.initial_headers)
+            session_pool.release(key, session)
+
+    def _seen_job(self, job_id: str | None) -> bool:
+        """
+        Whether an earlier run of an incremental scrape found the job. It is left out of the results, so its detail
+        page need not be fetched.
+        """
+        seen = self.scraper_input.seen_job_ids if self.scraper_input else None
+        return bool(seen) and job_id in seen
+
+    def _seen_page(self, jobs: list[JobPost]) -> bool:
+        """Whether every job of a search page was found by an earlier run, so the pages after it need not be fetched"""
+        return bool(jobs) and all(self._seen_job(job.id) for job in jobs)
+
+    def _publish(self, job_list: list[JobPost], start: int = 0, stop: int | None = None) -> None:
+        """
+        Hands jobs parsed since the last call to page_callback, as soon as a page is done.
+        start/stop are the bounds scrape() slices its final job list with, so a streaming consumer
+        receives exactly the jobs scrape() would return, in the same order.
+        """
+        if self.page_callback is None:
+            return
+        window = job_list[start:stop]
+        new_jobs = window[self._published :]
+        if new_jobs:
+            self._published += len(new_jobs)
+            self.page_callback(new_jobs)
@@ -0,0 +1,188 @@
+"""
+jobspy2.scrapers.cache
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the on-disk HTTP response cache used by the scrapers' sessions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+SEARCH = "search"
+DETAIL = "detail"
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: Any = None,
+    data: Any = None,
+    json_body: Any = None,
+    headers: Mapping[str, str] | None = None,
+) -> str:
+    """
+    Hashes everything that identifies a request: method, url with query params, body and the headers passed for
+    this request only (e.g. Indeed's country header), so identical requests share one key.
+    """
+    query = urlencode(params, doseq=True) if isinstance(params, (Mapping, list)) else (params or "")
+    if json_body is not None:
+        body = json.dumps(json_body, sort_keys=True, default=str)
+    elif isinstance(data, Mapping):
+        body = urlencode(data, doseq=True)
+    elif isinstance(data, bytes):
+        body = data.decode("utf-8", "replace")
+    else:
+        body = data or ""
+    request_headers = json.dumps(sorted((k.lower(), v) for k, v in headers.items())) if headers else ""
+    raw = f"{method.upper()} {url}?{query}\n{request_headers}\n{body}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def build_response(status_code: int, url: str, headers: Mapping[str, str], content: bytes) -> requests.Response:
+    """Builds a requests.Response from stored parts, so callers can't tell a cached response from a live one."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+    return response
+
+
+class ResponseStore(Protocol):
+    """What a session needs from a response cache; implement it to plug in another backend."""
+
+    def get(self, key: str) -> requests.Response | None: ...
+
+    def put(self, key: str, kind: str, response: Any) -> None: ...
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of HTTP responses in a SQLite file. Search pages and detail pages expire after their own
+    TTL (detail pages change rarely, so they are kept much longer); once the stored bodies exceed max_bytes the
+    least recently read entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        search_ttl: float = 3600,
+        detail_ttl: float = 7 * 24 * 3600,
+        max_bytes: int = 512 * 2**20,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {SEARCH: search_ttl, DETAIL: detail_ttl}
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(("hits", "misses", "stores", "expired", "evictions"), 0)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                status_code INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def get(self, key: str) -> requests.Response | None:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires_at, status_code, url, headers, content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+            expires_at, status_code, url, headers, content = row
+            if expires_at < now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._counters["hits"] += 1
+        return build_response(status_code, url, json.loads(headers), content)
+
+    def put(self, key: str, kind: str, response: Any) -> None:
+        content: bytes = response.content or b""
+        now = time.time()
+        row = (
+            key,
+            kind,
+            now + self.ttls.get(kind, self.ttls[SEARCH]),
+            now,
+            response.status_code,
+            str(response.url),
+            json.dumps(dict(response.headers or {})),
+            content,
+            len(content),
+        )
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self._counters["stores"] += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._counters["evictions"] += len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/store/expiry/eviction counters for this process, plus the entries and bytes on disk."""
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            return {**self._counters, "entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_response_cache: ResponseStore | None = None
+
+
+def set_response_cache(cache: ResponseStore | None) -> None:
+    """Installs the cache consulted by every scraper session; None turns caching off (the default)."""
+    global _response_cache
+    _response_cache = cache
+
+
+def get_response_cache() -> ResponseStore | None:
+    return _response_cache
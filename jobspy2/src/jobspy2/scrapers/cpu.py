@@ -0,0 +1,83 @@
+"""
+jobspy2.scrapers.cpu
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the opt-in pools of worker processes that parse pages and convert descriptions for the threads
+scraping the sites, so that the CPU work of concurrent scrapes is spread over cores instead of taking turns on the
+interpreter lock. Pools are started on first use and reused by later scrapes.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+_lock = threading.Lock()
+_active: ContextVar[ProcessPoolExecutor | None] = ContextVar("jobspy2_cpu_pool", default=None)
+
+
+class CpuWorkersError(ValueError):
+    def __init__(self, workers: int) -> None:
+        self.message = f"cpu_workers must be a positive number of processes, got {workers!r}"
+        super().__init__(self.message)
+
+
+def cpu_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared pool of worker processes. Workers are spawned rather than forked from the threads scraping."""
+    if workers < 1:
+        raise CpuWorkersError(workers)
+    with _lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        return pool
+
+
+def shutdown_cpu_pools() -> None:
+    """Stops the worker processes of every pool; a later scrape asking for workers starts a new pool."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+@contextmanager
+def using_cpu_pool(workers: int | None) -> Iterator[None]:
+    """
+    Runs the CPU work of the scrape in this context, and of the threads it submits to, in the shared pool of workers
+    processes; with workers None it runs in the scraping threads themselves.
+    """
+    token = _active.set(cpu_pool(workers) if workers is not None else None)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def run(fn: Callable[..., T], *args: Any) -> T:
+    """
+    fn(*args) in a worker process of the pool in use, or in this thread without one. fn must be a module-level
+    function, and its arguments and result picklable. A pool whose worker died is dropped (the next scrape starts a
+    new one) and fn is run here instead.
+    """
+    pool = _active.get()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        with _lock:
+            for workers, shared in list(_pools.items()):
+                if shared is pool:
+                    del _pools[workers]
+        return fn(*args)
@@ -0,0 +1,52 @@
+"""
+jobspy2.scrapers.descriptions
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the description handles of deferred scrapes: what a job's detail page fetch needs, kept in its
+description_handle column so the description can be fetched later, for the jobs that are still wanted.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from ..jobs import Country, CountryError, DescriptionFormat
+from . import ScraperInput, Site
+
+SEPARATOR = ":"
+
+
+class DescriptionHandleError(ValueError):
+    def __init__(self, handle: str) -> None:
+        self.message = f"Invalid description handle: {handle!r}"
+        super().__init__(self.message)
+
+
+class DescriptionHandle(NamedTuple):
+    """
+    A job's site, the key its site fetches the description by (a job id or job page url), and the country and
+    description format of the scrape it came from. Stored encoded as "site:country:format:key".
+    """
+
+    site: Site
+    country: Country
+    description_format: DescriptionFormat
+    key: str
+
+    @classmethod
+    def for_job(cls, site: Site, scraper_input: ScraperInput, key: str) -> str:
+        """The encoded handle of a job scraped with scraper_input"""
+        description_format = scraper_input.description_format or DescriptionFormat.MARKDOWN
+        return cls(site, scraper_input.country, description_format, key).encode()
+
+    def encode(self) -> str:
+        country = self.country.value[0].split(",")[0]
+        return SEPARATOR.join((self.site.value, country, self.description_format.value, self.key))
+
+    @classmethod
+    def decode(cls, handle: str) -> DescriptionHandle:
+        try:
+            site, country, description_format, key = handle.split(SEPARATOR, 3)
+            return cls(Site(site), Country.from_string(country), DescriptionFormat(description_format), key)
+        except (ValueError, CountryError) as e:
+            raise DescriptionHandleError(handle) from e
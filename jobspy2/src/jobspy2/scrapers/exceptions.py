@@ -42,3 +42,20 @@ class GlassdoorLocationError(Exception):
     def __init__(self, location: str) -> None:
         self.message = f"Location {location!r} not found on Glassdoor"
         super().__init__(self.message)
+
+
+class RateLimitError(ValueError):
+    """Raised when a rate limit is configured with a rate that is not positive."""
+
+    def __init__(self, rate: float, site: str | None = None) -> None:
+        target = f" for {site!r}" if site else ""
+        self.message = f"Rate limit{target} must be positive, got {rate}"
+        super().__init__(self.message)
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed scrape sends a request that is not in the fixture."""
+
+    def __init__(self, method: str, url: str) -> None:
+        self.message = f"No recorded response for {method.upper()} {url}"
+        super().__init__(self.message)
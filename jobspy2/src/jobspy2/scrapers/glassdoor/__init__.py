@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from typing import Any
 from urllib.parse import urlencode
@@ -27,13 +27,16 @@ from ...jobs import (
     Location,
 )
 from .. import Scraper, ScraperInput, Site
+from ..cache import DETAIL, SEARCH
+from ..descriptions import DescriptionHandle
 from ..exceptions import GlassdoorException, GlassdoorLocationError
 from ..utils import (
     create_logger,
-    create_session,
     extract_emails_from_text,
     markdown_converter,
 )
+from ..workers import job_results, submit_jobs
+from . import lookups
 from .constants import fallback_token, headers, query_template
 
 
@@ -75,10 +78,7 @@ class GlassdoorScraper(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
-        self.session = create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=True, has_retry=True)
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        self.session.headers.update(headers)
+        self._start_session()
 
         location_id, location_type = self._get_location(scraper_input.location, scraper_input.is_remote)
         if location_type is None:
@@ -90,19 +90,64 @@ class GlassdoorScraper(Scraper):
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
-        for page in range(range_start, range_end):
-            self.logger.info(f"search page: {page} / {range_end - 1}")
-            try:
-                jobs, cursor = self._fetch_jobs_page(scraper_input, location_id, location_type, page, cursor)
+        page = range_start
+        try:
+            if page < range_end:
+                self.logger.info(f"search page: {page} / {range_end - 1}")
+                jobs_data, cursor = self._fetch_jobs_page(scraper_input, location_id, location_type, page, cursor)
+            while page < range_end:
+                results = submit_jobs(self._process_job, jobs_data)
+                has_next_page = page + 1 < range_end
+                next_page = None
+                if (
+                    has_next_page
+                    and jobs_data
+                    and len(job_list) + len(jobs_data) < scraper_input.results_wanted
+                    and not scraper_input.seen_job_ids
+                ):
+                    # Every job of this page is wanted, so the next page is too: fetch it while this one is processed
+                    self.logger.info(f"search page: {page + 1} / {range_end - 1}")
+                    next_page = self._fetch_jobs_page(scraper_input, location_id, location_type, page + 1, cursor)
+                jobs = self._job_posts(results)
                 job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
+                self._publish(job_list, 0, scraper_input.results_wanted)
+                if not jobs or len(job_list) >= scraper_input.results_wanted or self._seen_page(jobs):
                     job_list = job_list[: scraper_input.results_wanted]
                     break
-            except Exception:
-                self.logger.exception("Glassdoor error")
-                break
+                page += 1
+                if has_next_page and next_page is None:
+                    self.logger.info(f"search page: {page} / {range_end - 1}")
+                    next_page = self._fetch_jobs_page(scraper_input, location_id, location_type, page, cursor)
+                if next_page is not None:
+                    jobs_data, cursor = next_page
+        except Exception:
+            self.logger.exception("Glassdoor error")
         return JobResponse(jobs=job_list)
 
+    def _start_session(self) -> None:
+        """
+        Leases a session and sets it up with the csrf token the API needs, fetched once per domain while it is cached
+        """
+        self.session = self._acquire_session(is_tls=True, has_retry=True)
+        token = lookups.token_cache.get(self.base_url, self._get_csrf_token)
+        self.session.headers.update({**headers, "gd-csrf-token": token if token else fallback_token})
+
+    def start_description_fetch(self, scraper_input: ScraperInput) -> None:
+        super().start_description_fetch(scraper_input)
+        self.base_url = scraper_input.country.get_glassdoor_url()
+        self._start_session()
+
+    def fetch_description(self, key: str) -> dict[str, Any]:
+        """
+        The JobPost fields filled in from a job's details, by its listing id
+        """
+        description = None
+        try:
+            description = self._fetch_job_description(int(key))
+        except Exception:
+            self.logger.exception("Failed to fetch job description")
+        return {"description": description, "emails": extract_emails_from_text(description) if description else None}
+
     def _raise_for_status(self, response: requests.Response) -> dict[str, Any]:
         """Handle error responses from Glassdoor API."""
         if response.status_code != 200:
@@ -119,11 +164,12 @@ class GlassdoorScraper(Scraper):
         location_type: str,
         page_num: int,
         cursor: str | None,
-    ) -> tuple[list[JobPost], str | None]:
+    ) -> tuple[list[dict[str, Any]], str | None]:
         """
-        Scrapes a page of Glassdoor for jobs with scraper_input criteria
+        Searches a page of Glassdoor for jobs with scraper_input criteria. Returns the page's jobs, to be processed
+        with _process_job, and the cursor of the next page.
         """
-        jobs: list[JobPost] = []
+        jobs: list[dict[str, Any]] = []
         self.scraper_input = scraper_input
         try:
             payload = self._add_payload(location_id, location_type, page_num, cursor)
@@ -131,25 +177,27 @@ class GlassdoorScraper(Scraper):
                 f"{self.base_url}/graph",
                 timeout=15,
                 data=payload,
+                cache_kind=SEARCH,
             )
             res_json = self._raise_for_status(response)
         except Exception:
             self.logger.exception("Glassdoor error")
+            # A cached token may have expired early; the next scrape fetches a new one
+            lookups.token_cache.invalidate(self.base_url)
             return jobs, None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        return jobs_data, self.get_cursor_for_page(res_json["data"]["jobListings"]["paginationCursors"], page_num + 1)
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {executor.submit(self._process_job, job): job for job in jobs_data}
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(GlassdoorException.JOB_PROCESSING_FAILED) from exc
-
-        return jobs, self.get_cursor_for_page(res_json["data"]["jobListings"]["paginationCursors"], page_num + 1)
+    @staticmethod
+    def _job_posts(results: list[Future[JobPost | None]]) -> list[JobPost]:
+        """
+        The jobs _process_job made of a page, in page order
+        """
+        try:
+            return list(filter(None, job_results(results)))
+        except Exception as exc:
+            raise GlassdoorException(GlassdoorException.JOB_PROCESSING_FAILED) from exc
 
     def _get_csrf_token(self) -> str | None:
         """
@@ -193,11 +241,14 @@ class GlassdoorScraper(Scraper):
             location = self.parse_location(location_name)
 
         compensation = self.parse_compensation(job["header"])
-        description = None
-        try:
-            description = self._fetch_job_description(job_id)
-        except Exception:
-            self.logger.exception("Failed to fetch job description")
+        description = description_handle = None
+        if self.scraper_input and self.scraper_input.defer_descriptions:
+            description_handle = DescriptionHandle.for_job(self.site, self.scraper_input, str(job_id))
+        elif not self._seen_job(f"gd-{job_id}"):
+            try:
+                description = self._fetch_job_description(job_id)
+            except Exception:
+                self.logger.exception("Failed to fetch job description")
 
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -213,6 +264,7 @@ class GlassdoorScraper(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
+            description_handle=description_handle,
             emails=extract_emails_from_text(description) if description else None,
             company_logo=company_logo,
             listing_type=listing_type,
@@ -249,7 +301,7 @@ class GlassdoorScraper(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers, timeout=10)
+        res = self.session.post(url, json=body, timeout=10, cache_kind=DETAIL)
         if res.status_code != 200:
             return None
         data = res.json()[0]
@@ -260,7 +312,7 @@ class GlassdoorScraper(Scraper):
 
     def _get_location(self, location: str | None, is_remote: bool) -> tuple[int, str]:
         """
-        Gets the location ID and type from Glassdoor.
+        Gets the location ID and type from Glassdoor, or from the locations it resolved before.
         """
         if not self.base_url or not self.session:
             raise GlassdoorException("Session not initialized")
@@ -268,6 +320,9 @@ class GlassdoorScraper(Scraper):
             return 0, "REMOTE"
         if not location:
             return 0, "ANYWHERE"
+        resolved = lookups.location_cache.get(self.base_url, location)
+        if resolved is not None:
+            return resolved
         try:
             params = {"term": location}
             query_string = urlencode(params)
@@ -282,9 +337,11 @@ class GlassdoorScraper(Scraper):
             locations = response.json()
             if not locations:
                 raise GlassdoorLocationError(location)
-            return locations[0]["locationId"], locations[0]["locationType"]
+            resolved = locations[0]["locationId"], locations[0]["locationType"]
         except Exception as e:
             raise GlassdoorException() from e
+        lookups.location_cache.put(self.base_url, location, resolved)
+        return resolved
 
     def _add_payload(
         self,
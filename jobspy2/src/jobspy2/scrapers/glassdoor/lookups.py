@@ -0,0 +1,127 @@
+"""
+jobspy2.scrapers.glassdoor.lookups
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the process-wide caches of the lookups a Glassdoor search starts with: the csrf token of each
+Glassdoor domain and the location id and type of each location string, so repeated and concurrent searches go
+straight to their job listings.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+Resolved = tuple[int, str]
+
+
+class TokenCache:
+    """
+    csrf tokens per Glassdoor domain, reused for ttl seconds. Scrapes of a domain wait for the one fetching its token
+    rather than each fetching their own; a token the API rejects is dropped with invalidate().
+    """
+
+    def __init__(self, ttl: float = 3600.0) -> None:
+        self.ttl = ttl
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._fetching: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(("hits", "fetches"), 0)
+
+    def get(self, domain: str, fetch: Callable[[], str | None]) -> str | None:
+        """The domain's cached token, or fetch()'s (cached when it found one)"""
+        with self._lock:
+            fetching = self._fetching.setdefault(domain, threading.Lock())
+        with fetching:
+            with self._lock:
+                cached = self._tokens.get(domain)
+                if cached is not None and cached[1] > time.monotonic():
+                    self._counters["hits"] += 1
+                    return cached[0]
+                self._counters["fetches"] += 1
+            token = fetch()
+            if token:
+                with self._lock:
+                    self._tokens[domain] = (token, time.monotonic() + self.ttl)
+            return token
+
+    def invalidate(self, domain: str) -> None:
+        with self._lock:
+            self._tokens.pop(domain, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._counters, "tokens": len(self._tokens)}
+
+
+class LocationCache:
+    """
+    Resolved locations (id and type) per Glassdoor domain and location string, ignoring case and surrounding spaces.
+    With a path they are also kept in a JSON file, loaded on creation and rewritten whenever a location is added.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._locations: dict[str, dict[str, Resolved]] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+            self._locations = {
+                domain: {location: (resolved[0], resolved[1]) for location, resolved in locations.items()}
+                for domain, locations in stored.items()
+            }
+
+    @staticmethod
+    def _normalize(location: str) -> str:
+        return location.strip().lower()
+
+    def get(self, domain: str, location: str) -> Resolved | None:
+        with self._lock:
+            return self._locations.get(domain, {}).get(self._normalize(location))
+
+    def put(self, domain: str, location: str, resolved: Resolved) -> None:
+        with self._lock:
+            self._locations.setdefault(domain, {})[self._normalize(location)] = resolved
+            if self.path is not None:
+                self._save()
+
+    def _save(self) -> None:
+        # Written next to the file and swapped in, so a concurrent reader never sees it half written
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(self._locations, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._locations.clear()
+            if self.path is not None:
+                self._save()
+
+
+token_cache = TokenCache()
+location_cache = LocationCache()
+
+
+def configure_glassdoor_lookups(
+    token_ttl: float | None = None, locations_path: str | Path | None = None
+) -> tuple[TokenCache, LocationCache]:
+    """
+    Tunes the caches of Glassdoor csrf tokens and locations.
+    :param token_ttl: seconds a domain's csrf token is reused
+    :param locations_path: JSON file the resolved locations are kept in across runs (loaded now)
+    """
+    global location_cache
+    if token_ttl is not None:
+        token_cache.ttl = token_ttl
+    if locations_path is not None:
+        location_cache = LocationCache(locations_path)
+    return token_cache, location_cache
@@ -24,13 +24,15 @@ from ...jobs import (
     Location,
 )
 from .. import Scraper, ScraperInput, Site
+from ..cache import SEARCH
+from ..cpu import run
+from ..keywords import classify_description
 from ..utils import (
     create_logger,
-    create_session,
     extract_emails_from_text,
-    extract_job_type,
 )
 from .constants import async_param, headers_initial, headers_jobs
+from .payload import initial_page_job_infos, results_page_job_infos
 
 
 
@@ -59,11 +61,16 @@ class GoogleJobsScraper(Scraper):
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
-        self.session = create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True)
+        self.session = self._acquire_session(is_tls=False, has_retry=True)
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        self._publish(job_list, scraper_input.offset, scraper_input.offset + scraper_input.results_wanted)
         if forward_cursor is None:
             self.logger.warning("initial cursor not found, try changing your query or there was at most 10 results")
             return JobResponse(jobs=job_list)
+        if self._seen_page(job_list):
+            return JobResponse(
+                jobs=job_list[scraper_input.offset : scraper_input.offset + scraper_input.results_wanted]
+            )
 
         page = 1
 
@@ -78,6 +85,9 @@ class GoogleJobsScraper(Scraper):
                 self.logger.info(f"found no jobs on page: {page}")
                 break
             job_list += jobs
+            self._publish(job_list, scraper_input.offset, scraper_input.offset + scraper_input.results_wanted)
+            if self._seen_page(jobs):
+                break
             page += 1
         return JobResponse(jobs=job_list[scraper_input.offset : scraper_input.offset + scraper_input.results_wanted])
 
@@ -133,7 +143,7 @@ class GoogleJobsScraper(Scraper):
         full_url = f"{self.url}?{urlencode(params)}"
         self.logger.debug(f"Visiting initial search URL: {full_url}")
         
-        response = self.session.get(self.url, headers=headers_initial, params=params)
+        response = self.session.get(self.url, headers=headers_initial, params=params, cache_kind=SEARCH)
 
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
@@ -156,31 +166,20 @@ class GoogleJobsScraper(Scraper):
         full_url = f"{self.jobs_url}?{urlencode(params, doseq=True)}"
         self.logger.debug(f"Visiting next page URL: {full_url}")
         
-        response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
+        response = self.session.get(self.jobs_url, headers=headers_jobs, params=params, cache_kind=SEARCH)
         return self._parse_jobs(response.text)
 
     def _parse_jobs(self, job_data: str) -> tuple[list[JobPost], str | None]:
         """
         Parses jobs on a page with next page cursor
         """
-        start_idx = job_data.find("[[[")
-        end_idx = job_data.rindex("]]]") + 3
-        s = job_data[start_idx:end_idx]
-        parsed = json.loads(s)[0]
+        job_infos = run(results_page_job_infos, job_data)
 
         pattern_fc = r'data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, job_data)
         data_async_fc = match_fc.group(1) if match_fc else None
         jobs_on_page: list[JobPost] = []
-        for array in parsed:
-            _, job_data = array
-            if not job_data.startswith("[[["):
-                continue
-            job_d = json.loads(job_data)
-
-            job_info = self._find_job_info(job_d)
-            if not job_info:
-                continue
+        for job_info in job_infos:
             job_post = self._parse_job(job_info)
             if job_post:
                 jobs_on_page.append(job_post)
@@ -206,6 +205,7 @@ class GoogleJobsScraper(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date() if days_ago else None
 
         description = job_info[19]
+        keywords = classify_description(description)
 
         return JobPost(
             id=f"go-{job_info[28]}",
@@ -214,32 +214,17 @@ class GoogleJobsScraper(Scraper):
             location=Location(city=city, state=state, country=country[0] if country else None),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote=keywords.is_remote,
             description=description,
             emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            job_type=keywords.job_types,
         )
 
-    @staticmethod
-    def _find_job_info(jobs_data: list[Any] | dict[str, Any]) -> list[Any] | None:
-        """Iterates through the JSON data to find the job listings"""
-        if isinstance(jobs_data, dict):
-            for key, value in jobs_data.items():
-                if key == "520084652" and isinstance(value, list):
-                    return value
-                else:
-                    result = GoogleJobsScraper._find_job_info(value)
-                    if result:
-                        return result
-        elif isinstance(jobs_data, list):
-            for item in jobs_data:
-                result = GoogleJobsScraper._find_job_info(item)
-                if result:
-                    return result
-        return None
-
     @staticmethod
     def _find_job_info_initial_page(html_text: str, logger: logging.Logger) -> list[Any]:
+        job_infos = run(initial_page_job_infos, html_text)
+        if job_infos is not None:
+            return job_infos
         pattern = '520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]"
         results: list[Any] = []
         matches = re.finditer(pattern, html_text)
@@ -0,0 +1,68 @@
+"""
+jobspy2.scrapers.google.payload
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the targeted extraction of job info arrays (the values of the "520084652" key) from Google Jobs
+pages: the keys are found by scanning the text and only the arrays after them are decoded.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+JOB_INFO_KEY = "520084652"
+_decoder = json.JSONDecoder()
+# A key is the only place a JSON string can be followed by a colon, and an unescaped quote always delimits a string,
+# so this matches exactly the job info keys of a JSON text, in document order
+KEY = re.compile(rf'"{JOB_INFO_KEY}"\s*:\s*')
+# The search page embeds the arrays in a script; each is followed by the brackets closing its callback data
+INITIAL_PAGE_KEY = f'{JOB_INFO_KEY}":'
+INITIAL_PAGE_ARRAY_END = re.compile(r"(\]\s*])\s*}\s*]\s*]\s*]")
+
+
+def first_job_info(payload: str) -> list[Any] | None:
+    """
+    The first non-empty array under a job info key in a JSON text (a job entry of a results page), or None. Only the
+    values of the keys are decoded, rather than the whole entry.
+    """
+    for key in KEY.finditer(payload):
+        value, _ = _decoder.raw_decode(payload, key.end())
+        if isinstance(value, list) and value:
+            return value
+    return None
+
+
+def results_page_job_infos(page: str) -> list[list[Any]]:
+    """The job info arrays of a results page: the first one of each job entry that has one."""
+    entries = json.loads(page[page.find("[[[") : page.rindex("]]]") + 3])[0]
+    job_infos = []
+    for _, entry in entries:
+        if entry.startswith("[[[") and (job_info := first_job_info(entry)):
+            job_infos.append(job_info)
+    return job_infos
+
+
+def initial_page_job_infos(html: str) -> list[Any] | None:
+    """
+    The job info arrays of the search page, found where each key is followed by an array closing its callback data
+    (as `520084652":(\\[.*?\\]\\s*])\\s*}\\s*]\\s*]\\s*]` matches them). None if the page has an array that pattern
+    would cut differently (one spanning lines, or containing the closing brackets), so it can be matched the old way.
+    """
+    job_infos = []
+    position = html.find(INITIAL_PAGE_KEY)
+    while position != -1:
+        start = position + len(INITIAL_PAGE_KEY)
+        if not html.startswith("[", start):
+            return None
+        try:
+            value, end = _decoder.raw_decode(html, start)
+        except json.JSONDecodeError:
+            return None
+        closing = INITIAL_PAGE_ARRAY_END.search(html, start + 1)
+        if closing is None or closing.end(1) != end or "\n" in html[start : closing.start()]:
+            return None
+        job_infos.append(value)
+        position = html.find(INITIAL_PAGE_KEY, closing.end())
+    return job_infos
@@ -21,15 +21,16 @@ from ...jobs import (
     JobType,
     Location,
 )
-from .. import Scraper, ScraperInput, Site
+from .. import IndeedProjection, Scraper, ScraperInput, Site
+from ..cache import SEARCH
+from ..keywords import classify_description
 from ..utils import (
     create_logger,
-    create_session,
     extract_emails_from_text,
     get_enum_from_job_type,
     markdown_converter,
 )
-from .constants import api_headers, job_search_query
+from .constants import api_headers, full_job_fields, job_search_query, listing_job_fields
 
 
 
@@ -42,6 +43,19 @@ class IntervalError(ValueError):
         super().__init__(self.message)
 
 
+class IndeedPageSizeError(ValueError):
+    def __init__(self, page_size: int) -> None:
+        self.message = f"indeed_page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size!r}"
+        super().__init__(self.message)
+
+
+MAX_PAGE_SIZE = 100
+job_fields: dict[IndeedProjection, str] = {
+    IndeedProjection.LISTING: listing_job_fields,
+    IndeedProjection.FULL: full_job_fields,
+}
+
+
 class IndeedScraper(Scraper):
     def __init__(self, logger: logging.Logger, proxies: list[str] | str | None = None, ca_cert: str | None = None) -> None:
         """
@@ -49,9 +63,9 @@ class IndeedScraper(Scraper):
         """
         super().__init__(Site.INDEED, logger=logger, proxies=proxies, ca_cert=ca_cert)
 
-        self.session = create_session(proxies=self.proxies, ca_cert=ca_cert, is_tls=False)
+        self.session = self._acquire_session(is_tls=False)
         self.scraper_input: ScraperInput | None = None
-        self.jobs_per_page: int = 100
+        self.jobs_per_page: int = MAX_PAGE_SIZE
         self.num_workers: int = 10
         self.seen_urls: set[str] = set()
         self.headers: dict[str, str] | None = None
@@ -65,7 +79,10 @@ class IndeedScraper(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        if not 1 <= scraper_input.indeed_page_size <= MAX_PAGE_SIZE:
+            raise IndeedPageSizeError(scraper_input.indeed_page_size)
         self.scraper_input = scraper_input
+        self.jobs_per_page = scraper_input.indeed_page_size
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
@@ -82,12 +99,16 @@ class IndeedScraper(Scraper):
                 self.logger.info(f"found no jobs on page: {page}")
                 break
             job_list += jobs
+            self._publish(job_list, scraper_input.offset, scraper_input.offset + scraper_input.results_wanted)
+            if self._seen_page(jobs):
+                break
             page += 1
         return JobResponse(jobs=job_list[scraper_input.offset : scraper_input.offset + scraper_input.results_wanted])
 
     def _scrape_page(self, cursor: str | None) -> tuple[list[JobPost], str | None]:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Scrapes a page of Indeed for jobs with scraper_input criteria, asking for jobs_per_page jobs with the fields
+        of the scrape's projection
         :param cursor:
         :return: jobs found on page, next page cursor
         """
@@ -105,8 +126,10 @@ class IndeedScraper(Scraper):
                 else ""
             ),
             dateOnIndeed=self.scraper_input.hours_old,
+            limit=self.jobs_per_page,
             cursor=f'cursor: "{cursor}"' if cursor else "",
             filters=filters,
+            job_fields=job_fields[self.scraper_input.indeed_projection],
         )
         payload = {
             "query": query,
@@ -128,6 +151,7 @@ class IndeedScraper(Scraper):
             headers=api_headers_temp,
             json=payload,
             timeout=10,
+            cache_kind=SEARCH,
         )
         if not response.ok:
             self.logger.info(
@@ -206,7 +230,8 @@ class IndeedScraper(Scraper):
 
     def _process_job(self, job: dict[str, Any]) -> JobPost | None:
         """
-        Parses the job dict into JobPost model
+        Parses the job dict into JobPost model. Only key and title are required, so that the fields a projection
+        leaves out are just missing from the job.
         :param job: dict to parse
         :return: JobPost if it's a new job
         """
@@ -216,30 +241,33 @@ class IndeedScraper(Scraper):
         if job_url in self.seen_urls:
             return None
         self.seen_urls.add(job_url)
-        description = job["description"]["html"]
+        description = (job.get("description") or {}).get("html")
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
 
-        job_type = self._get_job_type(job["attributes"])
-        timestamp_seconds = job["datePublished"] / 1000
-        date_posted = datetime.fromtimestamp(timestamp_seconds).date()
-        employer = job["employer"].get("dossier") if job["employer"] else None
-        employer_details = employer.get("employerDetails", {}) if employer else {}
-        rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
+        job_type = self._get_job_type(job.get("attributes") or [])
+        date_posted = None
+        if job.get("datePublished"):
+            date_posted = datetime.fromtimestamp(job["datePublished"] / 1000).date()
+        employer_data = job.get("employer")
+        employer = employer_data.get("dossier") if employer_data else None
+        employer_details = (employer.get("employerDetails") or {}) if employer else {}
+        rel_url = employer_data.get("relativeCompanyPageUrl") if employer_data else None
+        location = job.get("location") or {}
         return JobPost(
             id=f"in-{job['key']}",
             title=job["title"],
             description=description,
-            company_name=job["employer"].get("name") if job.get("employer") else None,
-            company_url=(f"{self.base_url}{rel_url}" if job["employer"] else None),
-            company_url_direct=(employer["links"]["corporateWebsite"] if employer else None),
+            company_name=employer_data.get("name") if employer_data else None,
+            company_url=(f"{self.base_url}{rel_url}" if employer_data else None),
+            company_url_direct=((employer.get("links") or {}).get("corporateWebsite") if employer else None),
             location=Location(
-                city=job.get("location", {}).get("city"),
-                state=job.get("location", {}).get("admin1Code"),
-                country=job.get("location", {}).get("countryCode"),
+                city=location.get("city"),
+                state=location.get("admin1Code"),
+                country=location.get("countryCode"),
             ),
             job_type=job_type,
-            compensation=self._get_compensation(job["compensation"]),
+            compensation=self._get_compensation(job.get("compensation")),
             date_posted=date_posted,
             job_url=job_url,
             job_url_direct=(job["recruit"].get("viewJobUrl") if job.get("recruit") else None),
@@ -292,7 +320,7 @@ class IndeedScraper(Scraper):
         )
 
     @staticmethod
-    def _is_job_remote(job: dict[str, Any], description: str) -> bool:
+    def _is_job_remote(job: dict[str, Any], description: str | None) -> bool:
         """
         Checks if job is remote
         :param job:
@@ -301,9 +329,7 @@ class IndeedScraper(Scraper):
         """
         if job.get("workplaceType") == "REMOTE":
             return True
-        if description and ("remote" in description.lower() or "wfh" in description.lower()):
-            return True
-        return False
+        return classify_description(description).is_remote
 
     @staticmethod
     def _get_compensation_interval(interval: str) -> CompensationInterval:
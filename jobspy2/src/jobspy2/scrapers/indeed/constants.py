@@ -3,7 +3,7 @@ job_search_query = """
         jobSearch(
         {what}
         {location}
-        limit: 100
+        limit: {limit}
         {cursor}
         sort: RELEVANCE
         {filters}
@@ -13,62 +13,71 @@ job_search_query = """
         }}
         results {{
             trackingKey
-            job {{
-            source {{
-                name
+            job {{{job_fields}
             }}
+        }}
+        }}
+    }}
+    """
+
+# The job fields each projection asks for: a listing has what the search results show, without the description
+# and the employer dossier, which make up most of a full payload
+full_job_fields = """
+            source {
+                name
+            }
             key
             title
             datePublished
             dateOnIndeed
-            description {{
+            description {
                 html
-            }}
-            location {{
+            }
+            location {
                 countryName
                 countryCode
                 admin1Code
                 city
                 postalCode
                 streetAddress
-                formatted {{
+                formatted {
                 short
                 long
-                }}
-            }}
-            compensation {{
-                estimated {{
+                }
+            }
+            compensation {
+                estimated {
                 currencyCode
-                baseSalary {{
+                baseSalary {
                     unitOfWork
-                    range {{
-                    ... on Range {{
+                    range {
+                    ... on Range {
                         min
                         max
-                    }}
-                    }}
-                }}
-                }}
-                baseSalary {{
+                    }
+                    }
+                }
+                }
+                baseSalary {
                 unitOfWork
-                range {{
-                    ... on Range {{
+                range {
+                    ... on Range {
                     min
                     max
-                    }}
-                }}
-                }}
+                    }
+                }
+                }
                 currencyCode
-            }}
-            attributes {{
+            }
+            attributes {
                 key
                 label
-            }}
-            employer {{
+            }
+            employer {
                 relativeCompanyPageUrl
                 name
-                dossier {{
-                    employerDetails {{
+                dossier {
+                    employerDetails {
                     addresses
                     industry
                     employeesLocalizedLabel
@@ -76,26 +85,66 @@ job_search_query = """
                     briefDescription
                     ceoName
                     ceoPhotoUrl
-                    }}
-                    images {{
+                    }
+                    images {
                         headerImageUrl
                         squareLogoUrl
-                    }}
-                    links {{
+                    }
+                    links {
                     corporateWebsite
-                }}
-                }}
-            }}
-            recruit {{
+                }
+                }
+            }
+            recruit {
                 viewJobUrl
                 detailedSalary
                 workSchedule
-            }}
-            }}
-        }}
-        }}
-    }}
-    """
+            }"""
+
+listing_job_fields = """
+            key
+            title
+            datePublished
+            location {
+                countryCode
+                admin1Code
+                city
+            }
+            compensation {
+                estimated {
+                currencyCode
+                baseSalary {
+                    unitOfWork
+                    range {
+                    ... on Range {
+                        min
+                        max
+                    }
+                    }
+                }
+                }
+                baseSalary {
+                unitOfWork
+                range {
+                    ... on Range {
+                    min
+                    max
+                    }
+                }
+                }
+                currencyCode
+            }
+            attributes {
+                key
+                label
+            }
+            employer {
+                relativeCompanyPageUrl
+                name
+            }
+            recruit {
+                viewJobUrl
+            }"""
 
 api_headers = {
     "Host": "apis.indeed.com",
@@ -0,0 +1,104 @@
+"""
+jobspy2.scrapers.keywords
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the keyword matcher that finds the job types and remote keywords of job descriptions, one
+description at a time or a whole result set at once.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any, NamedTuple
+
+from ..jobs import JobType
+
+REMOTE = "remote"
+REMOTE_KEYWORDS = ("remote", "wfh")
+# Separates descriptions scanned together; no keyword contains it, so no match spans two descriptions
+SEPARATOR = "\x00"
+
+
+class KeywordMatcher:
+    """
+    Finds which categories of keywords occur in a text, like checking `keyword in text.lower()` for every keyword of
+    every category. The keyword table is built once: keywords are lowercased, duplicates and keywords containing
+    another keyword of their category are dropped, and non-ascii keywords are only looked for in non-ascii text. The
+    text is lowercased once and each category stops at its first keyword found.
+    """
+
+    def __init__(self, categories: Mapping[Hashable, Iterable[str]]) -> None:
+        self.categories: list[tuple[Hashable, tuple[str, ...], tuple[str, ...]]] = []
+        for category, category_keywords in categories.items():
+            keywords = list(dict.fromkeys(keyword.lower() for keyword in category_keywords))
+            keywords = [
+                keyword for keyword in keywords if not any(other != keyword and other in keyword for other in keywords)
+            ]
+            ascii_keywords = tuple(keyword for keyword in keywords if keyword.isascii())
+            self.categories.append((category, tuple(keywords), ascii_keywords))
+
+    def find(self, text: str | None) -> list[Hashable]:
+        """The categories with a keyword in text, in the order they were given"""
+        if not text:
+            return []
+        text = text.lower()
+        is_ascii = text.isascii()
+        found = []
+        for category, keywords, ascii_keywords in self.categories:
+            for keyword in ascii_keywords if is_ascii else keywords:
+                if keyword in text:
+                    found.append(category)
+                    break
+        return found
+
+    def find_many(self, texts: Iterable[Any]) -> list[list[Hashable]]:
+        """
+        find() for many texts at once: they are lowercased and joined, and each keyword is searched for through all of
+        them, skipping to the next text after a match. Texts that aren't strings have no categories.
+        """
+        # Lowercased before the offsets are taken, as lowercasing can lengthen a text ("İ" becomes two characters)
+        texts = [text.lower() if isinstance(text, str) else "" for text in texts]
+        starts, offset = [], 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(SEPARATOR)
+        starts.append(offset)
+        joined = SEPARATOR.join(texts)
+        is_ascii = joined.isascii()
+        found: list[list[Hashable]] = [[] for _ in texts]
+        for category, keywords, ascii_keywords in self.categories:
+            matched = set()
+            for keyword in ascii_keywords if is_ascii else keywords:
+                position = joined.find(keyword)
+                while position != -1:
+                    index = bisect_right(starts, position) - 1
+                    matched.add(index)
+                    position = joined.find(keyword, starts[index + 1])
+            for index in sorted(matched):
+                found[index].append(category)
+        return found
+
+
+class DescriptionKeywords(NamedTuple):
+    job_types: list[JobType]
+    is_remote: bool
+
+
+DESCRIPTION_MATCHER = KeywordMatcher({**{job_type: job_type.value for job_type in JobType}, REMOTE: REMOTE_KEYWORDS})
+
+
+def _description_keywords(found: list[Hashable]) -> DescriptionKeywords:
+    if found and found[-1] == REMOTE:
+        return DescriptionKeywords(found[:-1], True)
+    return DescriptionKeywords(found, False)
+
+
+def classify_description(description: str | None) -> DescriptionKeywords:
+    """The job types (in JobType order) named in description and whether it mentions remote work ("remote", "wfh")"""
+    return _description_keywords(DESCRIPTION_MATCHER.find(description))
+
+
+def classify_descriptions(descriptions: Iterable[Any]) -> list[DescriptionKeywords]:
+    """classify_description for a whole result set at once"""
+    return [_description_keywords(found) for found in DESCRIPTION_MATCHER.find_many(descriptions)]
@@ -8,17 +8,14 @@ This module contains routines to scrape LinkedIn.
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime
 from typing import Any
 from urllib.parse import unquote, urlparse, urlunparse, urlencode
 import logging
+import threading
 
 import regex as re
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 
 from ...jobs import (
     Compensation,
@@ -29,18 +26,21 @@ from ...jobs import (
     JobType,
     Location,
 )
-from .. import LinkedInExperienceLevel, Scraper, ScraperInput, Site
+from .. import LinkedInExperienceLevel, ParserBackend, Scraper, ScraperInput, Site
+from ..cache import DETAIL, SEARCH
+from ..cpu import run
+from ..descriptions import DescriptionHandle
 from ..exceptions import LinkedInException
 from ..utils import (
     create_logger,
-    create_session,
     currency_parser,
     extract_emails_from_text,
     get_enum_from_job_type,
     markdown_converter,
-    remove_attributes,
 )
+from ..workers import job_results, submit_jobs
 from .constants import headers
+from .parsers import parse_job_cards, parse_job_details
 
 
 # Map from experience level to the number
@@ -56,8 +56,6 @@ experience_level_map: dict[LinkedInExperienceLevel, str] = {
 
 class LinkedInScraper(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
 
     def __init__(self, logger: logging.Logger, proxies: list[str] | str | None = None, ca_cert: str | None = None) -> None:
@@ -66,24 +64,50 @@ class LinkedInScraper(Scraper):
         """
         super().__init__(Site.LINKEDIN, logger=logger, proxies=proxies, ca_cert=ca_cert)
 
-        self.session = create_session(
-            proxies=self.proxies,
-            ca_cert=ca_cert,
+        self.session = self._new_session()
+        # Sessions of the threads fetching job pages at once, as each request clears the cookies of its session
+        self._owner_thread = threading.get_ident()
+        self._thread_sessions: dict[int, requests.Session] = {}
+        self._thread_sessions_lock = threading.Lock()
+        self.scraper_input: ScraperInput | None = None
+        self.parser_backend = ParserBackend.BS4
+        self.country: str = "worldwide"
+        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+
+    def _new_session(self) -> requests.Session:
+        session = self._acquire_session(
             is_tls=False,
             has_retry=True,
             delay=5,
             clear_cookies=True,
         )
-        self.session.headers.update(headers)
-        self.scraper_input: ScraperInput | None = None
-        self.country: str = "worldwide"
-        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+        session.headers.update(headers)
+        return session
+
+    def _thread_session(self) -> requests.Session:
+        """The session of the calling thread: the scraper's own on the thread that created it, else one leased for it"""
+        thread = threading.get_ident()
+        if thread == self._owner_thread:
+            return self.session
+        with self._thread_sessions_lock:
+            session = self._thread_sessions.get(thread)
+        if session is None:
+            session = self._new_session()
+            with self._thread_sessions_lock:
+                self._thread_sessions[thread] = session
+        return session
+
+    def close(self) -> None:
+        with self._thread_sessions_lock:
+            self._thread_sessions.clear()
+        super().close()
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
         Scrapes LinkedIn for jobs with scraper_input criteria
         """
         self.scraper_input = scraper_input
+        self.parser_backend = scraper_input.linkedin_parser
         job_list: list[JobPost] = []
         seen_ids: set[str] = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
@@ -102,11 +126,13 @@ class LinkedInScraper(Scraper):
             if not job_cards:
                 return JobResponse(jobs=job_list)
 
-            if not self._process_job_cards(job_cards, job_list, seen_ids):
+            page_start = len(job_list)
+            keep_searching = self._process_job_cards(job_cards, job_list, seen_ids)
+            self._publish(job_list, 0, scraper_input.results_wanted)
+            if not keep_searching or self._seen_page(job_list[page_start:]):
                 break
 
             if self._should_continue_search(job_list, start):
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))  # noqa: S311
                 start += len(job_list)
 
         job_list = job_list[: self.scraper_input.results_wanted]
@@ -130,6 +156,7 @@ class LinkedInScraper(Scraper):
                 f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search",
                 params=params,
                 timeout=10,
+                cache_kind=SEARCH,
             )
             if response.status_code not in range(200, 400):
                 err = (
@@ -175,21 +202,21 @@ class LinkedInScraper(Scraper):
             params["f_TPR"] = f"r{seconds_old}"
         return {k: v for k, v in params.items() if v is not None}
 
-    def _get_job_cards(self, response: requests.Response) -> list[Tag]:
-        soup = BeautifulSoup(response.text, "html.parser")
-        return soup.find_all("div", class_="base-search-card")
+    def _get_job_cards(self, response: requests.Response) -> list[dict[str, Any]]:
+        return run(parse_job_cards, self.parser_backend, response.text)
 
-    def _process_job_cards(self, job_cards: list[Tag], job_list: list[JobPost], seen_ids: set[str]) -> bool:
+    def _process_job_cards(
+        self, job_cards: list[dict[str, Any]], job_list: list[JobPost], seen_ids: set[str]
+    ) -> bool:
         if not self.scraper_input:
             return False
+        new_jobs: list[tuple[JobPost, str]] = []
+        keep_searching = True
         for job_card in job_cards:
-            href_tag = job_card.find("a", class_="base-card__full-link")
-            if not href_tag or not isinstance(href_tag, Tag):
-                continue
-            if "href" not in href_tag.attrs:
+            if not job_card["href"]:
                 continue
 
-            href = href_tag.attrs["href"].split("?")[0]
+            href = job_card["href"].split("?")[0]
             job_id = href.split("-")[-1]
 
             if job_id in seen_ids:
@@ -197,22 +224,44 @@ class LinkedInScraper(Scraper):
             seen_ids.add(job_id)
 
             try:
-                fetch_desc = self.scraper_input.linkedin_fetch_description
-                job_post = self._process_job(job_card, job_id, fetch_desc)
-                if job_post:
-                    job_list.append(job_post)
-                if not self._should_continue_search(job_list, 0):
-                    return False
+                job_post = self._process_job(job_card, job_id)
             except Exception as err:
                 raise LinkedInException() from err
-        return True
+            if job_post:
+                new_jobs.append((job_post, job_id))
+            if len(job_list) + len(new_jobs) >= self.scraper_input.results_wanted:
+                keep_searching = False
+                break
 
-    def _process_job(self, job_card: Tag, job_id: str, full_descr: bool) -> JobPost | None:
-        salary_tag = job_card.find("span", class_="job-search-card__salary-info")
+        if self.scraper_input.linkedin_fetch_description and not self.scraper_input.defer_descriptions:
+            unseen = [job_id for job_post, job_id in new_jobs if not self._seen_job(job_post.id)]
+            try:
+                job_details = dict(zip(unseen, self._fetch_descriptions(unseen)))
+            except Exception as err:
+                raise LinkedInException() from err
+            new_jobs = [
+                (job_post.model_copy(update=job_details[job_id]) if job_id in job_details else job_post, job_id)
+                for job_post, job_id in new_jobs
+            ]
+        job_list.extend(job_post for job_post, _ in new_jobs)
+        return keep_searching
+
+    def _fetch_descriptions(self, job_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        fetch_description for the jobs kept from a page, at most linkedin_detail_concurrency at a time, in order
+        """
+        limit = self.scraper_input.linkedin_detail_concurrency if self.scraper_input else 1
+        if limit <= 1:
+            return [self.fetch_description(job_id) for job_id in job_ids]
+        return job_results(submit_jobs(self.fetch_description, job_ids, limit))
 
+    def _process_job(self, job_card: dict[str, Any], job_id: str) -> JobPost | None:
+        """
+        The job of a search card; its page's fields are filled in by _process_job_cards, or deferred to a handle
+        """
         compensation = None
-        if salary_tag:
-            salary_text = salary_tag.get_text(separator=" ").strip()
+        salary_text = job_card["salary"]
+        if salary_text is not None:
             salary_values = [currency_parser(value) for value in salary_text.split("-")]
             salary_min = salary_values[0]
             salary_max = salary_values[1]
@@ -224,30 +273,24 @@ class LinkedInScraper(Scraper):
                 currency=currency,
             )
 
-        title_tag = job_card.find("span", class_="sr-only")
-        title = title_tag.get_text(strip=True) if title_tag else "N/A"
+        title = job_card["title"] if job_card["title"] is not None else "N/A"
 
-        company_tag = job_card.find("h4", class_="base-search-card__subtitle")
-        company_a_tag = company_tag.find("a") if company_tag else None
-        if not company_a_tag or not isinstance(company_a_tag, Tag):
+        company = job_card["company"]
+        if company is None:
             return None
-        company_url = urlunparse(urlparse(href)._replace(query="")) if (href := company_a_tag.get("href")) else ""
-        company = company_a_tag.get_text(strip=True) if company_a_tag else "N/A"
+        company_url = urlunparse(urlparse(href)._replace(query="")) if (href := job_card["company_href"]) else ""
 
-        metadata_card = job_card.find("div", class_="base-search-card__metadata")
-        location = self._get_location(metadata_card)
+        location = self._get_location(job_card["location"])
 
-        datetime_tag = metadata_card.find("time", class_="job-search-card__listdate") if metadata_card else None
         date_posted = None
-        if datetime_tag and "datetime" in datetime_tag.attrs:
-            datetime_str = datetime_tag["datetime"]
+        if (datetime_str := job_card["datetime"]) is not None:
             try:
                 date_posted = self._parse_date(datetime_str)
             except ValueError as e:
                 self.logger.warning(f"Failed to parse date {datetime_str}: {e}")
-        job_details: dict[str, Any] = {}
-        if full_descr:
-            job_details = self._get_job_details(job_id)
+        description_handle = None
+        if self.scraper_input and self.scraper_input.defer_descriptions:
+            description_handle = DescriptionHandle.for_job(self.site, self.scraper_input, job_id)
 
         return JobPost(
             id=f"li-{job_id}",
@@ -258,14 +301,24 @@ class LinkedInScraper(Scraper):
             date_posted=date_posted,
             job_url=f"{self.base_url}/jobs/view/{job_id}",
             compensation=compensation,
-            job_type=job_details.get("job_type"),
-            job_level=job_details.get("job_level", "").lower(),
-            company_industry=job_details.get("company_industry"),
-            description=job_details.get("description"),
-            job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(job_details.get("description")),
+            job_level="",
+            description_handle=description_handle,
         )
 
+    def fetch_description(self, key: str) -> dict[str, Any]:
+        """
+        The JobPost fields filled in from a job's page, by its job id
+        """
+        job_details = self._get_job_details(key)
+        return {
+            "job_type": job_details.get("job_type"),
+            "job_level": job_details.get("job_level", "").lower(),
+            "company_industry": job_details.get("company_industry"),
+            "description": job_details.get("description"),
+            "job_url_direct": job_details.get("job_url_direct"),
+            "emails": extract_emails_from_text(job_details.get("description")),
+        }
+
     def _get_job_details(self, job_id: str) -> dict[str, Any]:
         """
         Retrieves job description and other job details by going to the job page url
@@ -275,7 +328,9 @@ class LinkedInScraper(Scraper):
         if not self.scraper_input:
             return {}
         try:
-            response = self.session.get(f"{self.base_url}/jobs/view/{job_id}", timeout=5)
+            response = self._thread_session().get(
+                f"{self.base_url}/jobs/view/{job_id}", timeout=5, cache_kind=DETAIL
+            )
             response.raise_for_status()
         except (requests.RequestException, TimeoutError) as e:
             self.logger.warning(f"Failed to get job details: {e}")
@@ -283,48 +338,29 @@ class LinkedInScraper(Scraper):
         if "linkedin.com/signup" in response.url:
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        div_content = soup.find("div", class_=lambda x: x and "show-more-less-html__markup" in x)
-        description = None
-        if div_content is not None:
-            div_content = remove_attributes(div_content)
-            description = div_content.prettify(formatter="html")
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
-
-        h3_tag = soup.find("h3", text=lambda text: text and "Job function" in text.strip())
-
-        job_function = None
-        if h3_tag:
-            job_function_span = h3_tag.find_next("span", class_="description__job-criteria-text")
-            if job_function_span:
-                job_function = job_function_span.text.strip()
-
-        company_logo = (
-            logo_image.get("data-delayed-url")
-            if (logo_image := soup.find("img", {"class": "artdeco-entity-image"}))
-            else None
-        )
+        details = run(parse_job_details, self.parser_backend, response.text)
+        description = details["description"]
+        if description is not None and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            description = markdown_converter(description)
+
         return {
             "description": description,
-            "job_level": self._parse_job_level(soup),
-            "company_industry": self._parse_company_industry(soup),
-            "job_type": self._parse_job_type(soup),
-            "job_url_direct": self._parse_job_url_direct(soup),
-            "company_logo": company_logo,
-            "job_function": job_function,
+            "job_level": details["job_level"],
+            "company_industry": details["company_industry"],
+            "job_type": self._parse_job_type(details["employment_type"]),
+            "job_url_direct": self._parse_job_url_direct(details["apply_url"]),
+            "company_logo": details["company_logo"],
+            "job_function": details["job_function"],
         }
 
-    def _get_location(self, metadata_card: Tag | None) -> Location:
+    def _get_location(self, location_string: str | None) -> Location:
         """
-        Extracts the location data from the job metadata card.
-        :param metadata_card
+        Extracts the location data from the job card's location text.
+        :param location_string
         :return: location
         """
         location = Location(country=Country.from_string(self.country))
-        if metadata_card is not None:
-            location_tag = metadata_card.find("span", class_="job-search-card__location")
-            location_string = location_tag.text.strip() if location_tag else "N/A"
+        if location_string is not None:
             parts = location_string.split(", ")
             if len(parts) == 2:
                 city, state = parts
@@ -340,86 +376,25 @@ class LinkedInScraper(Scraper):
         return location
 
     @staticmethod
-    def _parse_job_type(soup_job_type: BeautifulSoup) -> list[JobType]:
+    def _parse_job_type(employment_type: str | None) -> list[JobType]:
         """
-        Gets the job type from job page
-        :param soup_job_type:
+        Gets the job type from the job page's employment type
+        :param employment_type:
         :return: JobType
         """
-        h3_tag = soup_job_type.find(
-            "h3",
-            class_="description__job-criteria-subheader",
-            string=lambda text: "Employment type" in text,
-        )
-        employment_type = None
-        if h3_tag:
-            employment_type_span = h3_tag.find_next_sibling(
-                "span",
-                class_="description__job-criteria-text description__job-criteria-text--criteria",
-            )
-            if employment_type_span:
-                employment_type = employment_type_span.get_text(strip=True)
-                employment_type = employment_type.lower()
-                employment_type = employment_type.replace("-", "")
-
+        if employment_type:
+            employment_type = employment_type.lower().replace("-", "")
         return [get_enum_from_job_type(employment_type)] if employment_type else []
 
-    @staticmethod
-    def _parse_job_level(soup_job_level: BeautifulSoup) -> str | None:
-        """
-        Gets the job level from job page
-        :param soup_job_level:
-        :return: str
-        """
-        h3_tag = soup_job_level.find(
-            "h3",
-            class_="description__job-criteria-subheader",
-            string=lambda text: "Seniority level" in text,
-        )
-        job_level = None
-        if h3_tag:
-            job_level_span = h3_tag.find_next_sibling(
-                "span",
-                class_="description__job-criteria-text description__job-criteria-text--criteria",
-            )
-            if job_level_span:
-                job_level = job_level_span.get_text(strip=True)
-
-        return job_level
-
-    @staticmethod
-    def _parse_company_industry(soup_industry: BeautifulSoup) -> str | None:
-        """
-        Gets the company industry from job page
-        :param soup_industry:
-        :return: str
-        """
-        h3_tag = soup_industry.find(
-            "h3",
-            class_="description__job-criteria-subheader",
-            string=lambda text: "Industries" in text,
-        )
-        industry = None
-        if h3_tag:
-            industry_span = h3_tag.find_next_sibling(
-                "span",
-                class_="description__job-criteria-text description__job-criteria-text--criteria",
-            )
-            if industry_span:
-                industry = industry_span.get_text(strip=True)
-
-        return industry
-
-    def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
+    def _parse_job_url_direct(self, apply_url: str | None) -> str | None:
         """
-        Gets the job url direct from job page
-        :param soup:
+        Gets the job url direct from the contents of the job page's applyUrl tag
+        :param apply_url:
         :return: str
         """
         job_url_direct = None
-        job_url_direct_content = soup.find("code", id="applyUrl")
-        if job_url_direct_content:
-            job_url_direct_match = self.job_url_direct_regex.search(job_url_direct_content.decode_contents().strip())
+        if apply_url:
+            job_url_direct_match = self.job_url_direct_regex.search(apply_url)
             if job_url_direct_match:
                 job_url_direct = unquote(job_url_direct_match.group())
 
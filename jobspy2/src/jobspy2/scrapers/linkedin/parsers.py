@@ -0,0 +1,238 @@
+"""
+jobspy2.scrapers.linkedin.parsers
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the interchangeable HTML parser backends that extract LinkedIn job cards and job detail pages.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import lxml.html
+import regex as re
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from lxml import etree
+
+from .. import ParserBackend
+from ..utils import remove_attributes
+
+CRITERIA_TEXT_CLASS = "description__job-criteria-text description__job-criteria-text--criteria"
+EMPTY_DOCUMENT = "<html></html>"
+DESCRIPTION_START = re.compile(r"""<div\b[^>]*?\bclass\s*=\s*["']?[^"'>]*show-more-less-html__markup""", re.I)
+DIV_TAG = re.compile(r"<(/?)div\b", re.I)
+
+
+class SoupParser:
+    """
+    Extracts job cards and job details with BeautifulSoup's html.parser.
+    Cards are dicts of href, title, company, company_href, location, datetime and salary; details are dicts of
+    description (prettified html), job_function, company_logo, job_level, company_industry, employment_type and
+    apply_url (the contents of the applyUrl code tag). Missing values are None.
+    """
+
+    def job_cards(self, html: str) -> list[dict[str, Any]]:
+        soup = BeautifulSoup(html, "html.parser")
+        return [self._job_card(job_card) for job_card in soup.find_all("div", class_="base-search-card")]
+
+    @staticmethod
+    def _job_card(job_card: Tag) -> dict[str, Any]:
+        card: dict[str, Any] = dict.fromkeys(("href", "title", "company", "company_href", "location", "datetime"))
+        href_tag = job_card.find("a", class_="base-card__full-link")
+        if href_tag and isinstance(href_tag, Tag) and "href" in href_tag.attrs:
+            card["href"] = href_tag.attrs["href"]
+
+        salary_tag = job_card.find("span", class_="job-search-card__salary-info")
+        card["salary"] = salary_tag.get_text(separator=" ").strip() if salary_tag else None
+
+        title_tag = job_card.find("span", class_="sr-only")
+        card["title"] = title_tag.get_text(strip=True) if title_tag else None
+
+        company_tag = job_card.find("h4", class_="base-search-card__subtitle")
+        company_a_tag = company_tag.find("a") if company_tag else None
+        if company_a_tag and isinstance(company_a_tag, Tag):
+            card["company"] = company_a_tag.get_text(strip=True)
+            card["company_href"] = company_a_tag.get("href")
+
+        metadata_card = job_card.find("div", class_="base-search-card__metadata")
+        if metadata_card is not None:
+            location_tag = metadata_card.find("span", class_="job-search-card__location")
+            card["location"] = location_tag.text.strip() if location_tag else None
+            datetime_tag = metadata_card.find("time", class_="job-search-card__listdate")
+            if datetime_tag and "datetime" in datetime_tag.attrs:
+                card["datetime"] = datetime_tag["datetime"]
+        return card
+
+    def job_details(self, html: str) -> dict[str, Any]:
+        soup = BeautifulSoup(html, "html.parser")
+        div_content = soup.find("div", class_=lambda x: x and "show-more-less-html__markup" in x)
+        description = None
+        if div_content is not None:
+            description = remove_attributes(div_content).prettify(formatter="html")
+
+        h3_tag = soup.find("h3", text=lambda text: text and "Job function" in text.strip())
+        job_function = None
+        if h3_tag:
+            job_function_span = h3_tag.find_next("span", class_="description__job-criteria-text")
+            if job_function_span:
+                job_function = job_function_span.text.strip()
+
+        logo_image = soup.find("img", {"class": "artdeco-entity-image"})
+        apply_url_tag = soup.find("code", id="applyUrl")
+        return {
+            "description": description,
+            "job_function": job_function,
+            "company_logo": logo_image.get("data-delayed-url") if logo_image else None,
+            "job_level": self._criteria(soup, "Seniority level"),
+            "company_industry": self._criteria(soup, "Industries"),
+            "employment_type": self._criteria(soup, "Employment type"),
+            "apply_url": apply_url_tag.decode_contents().strip() if apply_url_tag else None,
+        }
+
+    @staticmethod
+    def _criteria(soup: BeautifulSoup, name: str) -> str | None:
+        """Gets the value of a job criteria item (e.g. "Seniority level") from the job page"""
+        h3_tag = soup.find(
+            "h3",
+            class_="description__job-criteria-subheader",
+            string=lambda text: name in text,
+        )
+        if h3_tag:
+            criteria_span = h3_tag.find_next_sibling("span", class_=CRITERIA_TEXT_CLASS)
+            if criteria_span:
+                return criteria_span.get_text(strip=True)
+        return None
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _stripped_text(element: Any) -> str:
+    """The element's text like bs4's get_text(strip=True): every text node stripped, empty ones dropped, joined."""
+    return "".join(text.strip() for text in element.itertext() if text.strip())
+
+
+def _description_source(html: str) -> str | None:
+    """
+    The source of the description div, up to the </div> that closes it. html.parser parses this slice exactly as
+    it parsed it within the whole page, so even malformed descriptions come out the same as with SoupParser.
+    """
+    start = DESCRIPTION_START.search(html)
+    if start is None:
+        return None
+    depth = 0
+    for div_tag in DIV_TAG.finditer(html, start.start()):
+        depth += -1 if div_tag.group(1) else 1
+        if depth == 0:
+            return html[start.start() : html.find(">", div_tag.end()) + 1]
+    return html[start.start() :]
+
+
+def _parse_document(html: str) -> Any:
+    try:
+        return lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        # An empty page, in which (as in an empty soup) nothing is found
+        return lxml.html.document_fromstring(EMPTY_DOCUMENT)
+    except ValueError:
+        # lxml refuses str input that declares its own encoding
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+
+
+class LxmlParser:
+    """
+    Extracts the same job cards and job details as SoupParser with lxml and precompiled XPath queries. Only the
+    description div, cut out of the page source, is handed to BeautifulSoup, so its prettified html (and markdown) is
+    unchanged.
+    """
+
+    _cards = etree.XPath(f"//div[{_has_class('base-search-card')}]")
+    _card_href = etree.XPath(f"(.//a[{_has_class('base-card__full-link')}])[1]/@href")
+    _card_salary = etree.XPath(f".//span[{_has_class('job-search-card__salary-info')}]")
+    _card_title = etree.XPath(f".//span[{_has_class('sr-only')}]")
+    _card_company = etree.XPath(f"(.//h4[{_has_class('base-search-card__subtitle')}])[1]//a")
+    _card_metadata = etree.XPath(f".//div[{_has_class('base-search-card__metadata')}]")
+    _card_location = etree.XPath(f".//span[{_has_class('job-search-card__location')}]")
+    _card_datetime = etree.XPath(f".//time[{_has_class('job-search-card__listdate')}]")
+
+    _job_function = etree.XPath(
+        "(//h3[count(node()) = 1 and contains(text(), 'Job function')])[1]"
+        f"/following::span[{_has_class('description__job-criteria-text')}][1]"
+    )
+    _criteria_span = etree.XPath(
+        f"(//h3[{_has_class('description__job-criteria-subheader')}"
+        " and count(node()) = 1 and contains(text(), $name)])[1]"
+        f"/following-sibling::span[normalize-space(@class) = '{CRITERIA_TEXT_CLASS}'][1]"
+    )
+    _logo = etree.XPath(f"//img[{_has_class('artdeco-entity-image')}]/@data-delayed-url")
+    _apply_url = etree.XPath("//code[@id = 'applyUrl']")
+
+    def job_cards(self, html: str) -> list[dict[str, Any]]:
+        return [self._job_card(job_card) for job_card in self._cards(_parse_document(html))]
+
+    def _job_card(self, job_card: Any) -> dict[str, Any]:
+        card: dict[str, Any] = dict.fromkeys(("href", "title", "company", "company_href", "location", "datetime"))
+        if href := self._card_href(job_card):
+            card["href"] = href[0]
+        salary = self._card_salary(job_card)
+        card["salary"] = " ".join(salary[0].itertext()).strip() if salary else None
+        if title := self._card_title(job_card):
+            card["title"] = _stripped_text(title[0])
+        if company := self._card_company(job_card):
+            card["company"] = _stripped_text(company[0])
+            card["company_href"] = company[0].get("href")
+        if metadata := self._card_metadata(job_card):
+            location = self._card_location(metadata[0])
+            card["location"] = location[0].text_content().strip() if location else None
+            listdate = self._card_datetime(metadata[0])
+            if listdate and listdate[0].get("datetime") is not None:
+                card["datetime"] = listdate[0].get("datetime")
+        return card
+
+    def job_details(self, html: str) -> dict[str, Any]:
+        document = _parse_document(html)
+        description = None
+        if (fragment := _description_source(html)) is not None:
+            div_tag = BeautifulSoup(fragment, "html.parser").div
+            description = remove_attributes(div_tag).prettify(formatter="html")
+
+        job_function = self._job_function(document)
+        logo = self._logo(document)
+        apply_url = self._apply_url(document)
+        return {
+            "description": description,
+            "job_function": job_function[0].text_content().strip() if job_function else None,
+            "company_logo": logo[0] if logo else None,
+            "job_level": self._criteria(document, "Seniority level"),
+            "company_industry": self._criteria(document, "Industries"),
+            "employment_type": self._criteria(document, "Employment type"),
+            "apply_url": self._inner_html(apply_url[0]).strip() if apply_url else None,
+        }
+
+    def _criteria(self, document: Any, name: str) -> str | None:
+        criteria_span = self._criteria_span(document, name=name)
+        return _stripped_text(criteria_span[0]) if criteria_span else None
+
+    @staticmethod
+    def _inner_html(element: Any) -> str:
+        return (element.text or "") + "".join(
+            lxml.html.tostring(child, encoding="unicode", with_tail=True) for child in element
+        )
+
+
+PARSERS: dict[ParserBackend, SoupParser | LxmlParser] = {
+    ParserBackend.BS4: SoupParser(),
+    ParserBackend.LXML: LxmlParser(),
+}
+
+
+def parse_job_cards(backend: ParserBackend, html: str) -> list[dict[str, Any]]:
+    """The job cards of a search page, with the backend's parser (a module-level function for cpu.run)"""
+    return PARSERS[backend].job_cards(html)
+
+
+def parse_job_details(backend: ParserBackend, html: str) -> dict[str, Any]:
+    """The details of a job page, with the backend's parser (a module-level function for cpu.run)"""
+    return PARSERS[backend].job_details(html)
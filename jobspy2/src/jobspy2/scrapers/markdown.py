@@ -0,0 +1,534 @@
+"""
+jobspy2.scrapers.markdown
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the conversion of job description html to markdown: a converter for the small subset of html
+job boards emit, a content-hash keyed cache of conversions and a process pool for converting many at once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Union
+
+from bs4.dammit import EntitySubstitution
+from markdownify import markdownify as md
+
+from .cpu import run
+from .stats import MARKDOWN, stage
+
+# The markdownify releases whose (default option) output html_to_markdown was checked to reproduce, for the subset
+# of tags it handles; with any other version installed the conversion is left to markdownify.
+EMULATED_MARKDOWNIFY = frozenset({"1.2.3"})
+
+# Tags after which markdownify drops adjacent whitespace (should_remove_whitespace_inside)
+BLOCK_TAGS = frozenset(
+    {"p", "blockquote", "article", "div", "section", "ol", "ul", "li", "dl", "dt", "dd"}
+    | {"table", "thead", "tbody", "tfoot", "tr", "td", "th"}
+    | {f"h{n}" for n in range(1, 7)}
+)
+HEADING_TAGS = frozenset(f"h{n}" for n in range(1, 7))
+# Tags BeautifulSoup's html.parser builder closes as soon as they open
+VOID_TAGS = frozenset({"br", "hr", "img", "wbr", "meta", "link"})
+# Tags without a markdownify conversion, whose content is kept as is
+PLAIN_TAGS = frozenset(
+    {"span", "u", "font", "small", "big", "mark", "center", "abbr", "cite", "ins", "strike", "time", "label"}
+    | {"html", "head", "title", "body", "header", "footer", "main", "nav", "aside", "wbr", "meta", "link"}
+)
+INLINE_MARKUP = {"b": "**", "strong": "**", "em": "*", "i": "*", "del": "~~", "s": "~~", "sub": "", "sup": ""}
+SUPPORTED_TAGS = (
+    BLOCK_TAGS - {"dl", "dt", "dd", "table", "thead", "tbody", "tfoot", "tr", "td", "th"}
+    | PLAIN_TAGS
+    | INLINE_MARKUP.keys()
+    | {"a", "br", "hr", "img", "q", "script", "style"}
+)
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+BULLETS = "*+-"
+
+WHITESPACE = re.compile(r"[\t ]+")
+ALL_WHITESPACE = re.compile(r"[\t \r\n]+")
+NEWLINE_WHITESPACE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+LINE_WITH_CONTENT = re.compile(r"^(.*)", flags=re.MULTILINE)
+EXTRACT_NEWLINES = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", flags=re.DOTALL)
+
+
+def _markdownify_version() -> str:
+    try:
+        return importlib.metadata.version("markdownify")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+FAST_CONVERSION = _markdownify_version() in EMULATED_MARKDOWNIFY
+
+
+class _Unsupported(Exception):
+    """Raised while parsing html the fast converter can't reproduce markdownify's output for."""
+
+
+class _Comment:
+    __slots__ = ()
+
+
+COMMENT = _Comment()
+
+
+class _Element:
+    __slots__ = ("attrs", "children", "name", "parent")
+
+    def __init__(self, name: str, attrs: dict[str, str], parent: _Element | None) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.children: list[_Node] = []
+
+
+_Node = Union[str, _Element, _Comment]
+
+
+class _TreeBuilder(HTMLParser):
+    """
+    Builds the tree BeautifulSoup's html.parser builder would: an end tag closes the nearest open tag of that name
+    (and everything opened after it), void tags close at once, text runs are split by tags and comments and
+    whitespace-only runs collapse to a single space or newline.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.root = _Element("[document]", {}, None)
+        self.current = self.root
+        self.data: list[str] = []
+        self.closed_void_tags: list[str] = []
+
+    def _open(self, tag: str, attrs: list[tuple[str, str | None]]) -> _Element:
+        if tag not in SUPPORTED_TAGS:
+            raise _Unsupported(tag)
+        self.end_data()
+        element = _Element(tag, {key: value or "" for key, value in attrs}, self.current)
+        self.current.children.append(element)
+        return element
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        element = self._open(tag, attrs)
+        if tag in VOID_TAGS:
+            self.closed_void_tags.append(tag)
+        else:
+            self.current = element
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._open(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.closed_void_tags:
+            self.closed_void_tags.remove(tag)
+            return
+        self.end_data()
+        element: _Element | None = self.current
+        while element is not None and element is not self.root:
+            if element.name == tag:
+                self.current = element.parent or self.root
+                return
+            element = element.parent
+
+    def handle_data(self, data: str) -> None:
+        self.data.append(data)
+
+    def handle_charref(self, name: str) -> None:
+        try:
+            code_point = int(name[1:], 16) if name[:1] in "xX" else int(name)
+        except ValueError:
+            raise _Unsupported(name) from None
+        # BeautifulSoup maps control and windows-1252 code points its own way
+        if not (0x20 <= code_point < 0x7F or 0xA0 <= code_point < 0xD800 or 0xE000 <= code_point < 0xFFFE):
+            raise _Unsupported(name)
+        self.data.append(chr(code_point))
+
+    def handle_entityref(self, name: str) -> None:
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.data.append(character if character is not None else f"&{name}")
+
+    def handle_comment(self, data: str) -> None:
+        self.end_data()
+        self.current.children.append(COMMENT)
+
+    def handle_decl(self, decl: str) -> None:
+        raise _Unsupported(decl)
+
+    def unknown_decl(self, data: str) -> None:
+        raise _Unsupported(data)
+
+    def handle_pi(self, data: str) -> None:
+        raise _Unsupported(data)
+
+    def end_data(self) -> None:
+        if not self.data:
+            return
+        text = "".join(self.data)
+        self.data = []
+        if not text.strip(ASCII_SPACES):
+            text = "\n" if "\n" in text else " "
+        self.current.children.append(text)
+
+    def close(self) -> None:
+        super().close()
+        self.end_data()
+
+
+def _is_block(node: _Node | None) -> bool:
+    return isinstance(node, _Element) and node.name in BLOCK_TAGS
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _title_part(title: str | None) -> str:
+    if not title:
+        return ""
+    escaped = title.replace('"', r"\"")
+    return f' "{escaped}"'
+
+
+def _indent(text: str, indent: str) -> str:
+    return LINE_WITH_CONTENT.sub(lambda match: indent + match.group(1) if match.group(1) else "", text)
+
+
+class _Renderer:
+    """markdownify's MarkdownConverter with its default options, for the tags in SUPPORTED_TAGS."""
+
+    def __init__(self) -> None:
+        self.converters: dict[str, Callable[[_Element, str, bool], str]] = {
+            **dict.fromkeys(("p", "div", "article", "section"), self.paragraph),
+            **dict.fromkeys(HEADING_TAGS, self.heading),
+            **dict.fromkeys(("script", "style"), self.dropped),
+            "li": self.list_item,
+            "a": self.link,
+            "br": self.line_break,
+            "blockquote": self.blockquote,
+            "hr": self.rule,
+            "img": self.image,
+            "q": self.quote,
+        }
+
+    def render(self, root: _Element) -> str:
+        return self.tag(root, False, False).strip("\n")
+
+    def tag(self, element: _Element, inline: bool, in_list_item: bool) -> str:
+        children = element.children
+        remove_inside = element.name in BLOCK_TAGS
+        child_inline = inline or element.name in HEADING_TAGS
+        child_in_list_item = in_list_item or element.name == "li"
+        last = len(children) - 1
+        strings = []
+        for index, child in enumerate(children):
+            if isinstance(child, str):
+                previous = children[index - 1] if index else None
+                following = children[index + 1] if index < last else None
+                if not child.strip() and (
+                    (remove_inside and (previous is None or following is None))
+                    or _is_block(previous)
+                    or _is_block(following)
+                ):
+                    continue
+                text = self.text(child, element, previous, following)
+            elif child is COMMENT:
+                continue
+            else:
+                text = self.tag(child, child_inline, child_in_list_item)
+                text = self.convert(child, index, text, child_inline, child_in_list_item)
+            if text:
+                strings.append(text)
+
+        # Collapse the newlines where children meet to the larger of the two counts, at most 2
+        collapsed = [""]
+        for string in strings:
+            leading, content, trailing = EXTRACT_NEWLINES.match(string).groups()  # type: ignore[union-attr]
+            if collapsed[-1] and leading:
+                leading = "\n" * min(2, max(len(collapsed.pop()), len(leading)))
+            collapsed += (leading, content, trailing)
+        return "".join(collapsed)
+
+    @staticmethod
+    def text(text: str, parent: _Element, previous: _Node | None, following: _Node | None) -> str:
+        text = WHITESPACE.sub(" ", NEWLINE_WHITESPACE.sub("\n", text))
+        text = text.replace("*", r"\*").replace("_", r"\_")
+        if _is_block(previous) or (previous is None and parent.name in BLOCK_TAGS):
+            text = text.lstrip(" \t\r\n")
+        if _is_block(following) or (following is None and parent.name in BLOCK_TAGS):
+            text = text.rstrip()
+        return text
+
+    def convert(self, element: _Element, index: int, text: str, inline: bool, in_list_item: bool) -> str:
+        """Applies markdownify's conversion for element's tag; inline and in_list_item tell where element sits."""
+        name = element.name
+        if name in INLINE_MARKUP:
+            prefix, suffix, text = _chomp(text)
+            markup = INLINE_MARKUP[name]
+            return f"{prefix}{markup}{text}{markup}{suffix}" if text else ""
+        if name in ("ul", "ol"):
+            return self.list_block(element, index, text, in_list_item)
+        converter = self.converters.get(name)
+        return converter(element, text, inline) if converter is not None else text
+
+    @staticmethod
+    def paragraph(element: _Element, text: str, inline: bool) -> str:
+        # <p> keeps unicode whitespace (e.g. nbsp) at its edges, <div> and friends don't
+        text = text.strip(" \t\r\n") if element.name == "p" else text.strip()
+        if inline:
+            return " " + text + " "
+        return f"\n\n{text}\n\n" if text else ""
+
+    @staticmethod
+    def heading(element: _Element, text: str, inline: bool) -> str:
+        if inline:
+            return text
+        text = text.strip()
+        if element.name in ("h1", "h2"):
+            return f"\n\n{text}\n{('=' if element.name == 'h1' else '-') * len(text)}\n\n" if text else ""
+        return f"\n\n{'#' * int(element.name[1])} {ALL_WHITESPACE.sub(' ', text)}\n\n"
+
+    @staticmethod
+    def line_break(element: _Element, text: str, inline: bool) -> str:
+        if inline:
+            return text + " " if text else " "
+        return "  \n" + text
+
+    @staticmethod
+    def blockquote(element: _Element, text: str, inline: bool) -> str:
+        text = text.strip(" \t\r\n")
+        if inline:
+            return " " + text + " "
+        if not text:
+            return "\n"
+        return (
+            "\n" + LINE_WITH_CONTENT.sub(lambda match: "> " + match.group(1) if match.group(1) else ">", text) + "\n\n"
+        )
+
+    @staticmethod
+    def rule(element: _Element, text: str, inline: bool) -> str:
+        return "\n\n---\n\n"
+
+    @staticmethod
+    def image(element: _Element, text: str, inline: bool) -> str:
+        alt = element.attrs.get("alt") or ""
+        if inline:
+            return alt
+        return f"![{alt}]({element.attrs.get('src') or ''}{_title_part(element.attrs.get('title'))})"
+
+    @staticmethod
+    def quote(element: _Element, text: str, inline: bool) -> str:
+        return '"' + text + '"'
+
+    @staticmethod
+    def dropped(element: _Element, text: str, inline: bool) -> str:
+        return ""
+
+    @staticmethod
+    def link(element: _Element, text: str, inline: bool) -> str:
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        href = element.attrs.get("href")
+        title = element.attrs.get("title")
+        if text.replace(r"\_", "_") == href and not title:
+            return f"<{href}>"
+        return f"{prefix}[{text}]({href}{_title_part(title)}){suffix}" if href else text
+
+    @staticmethod
+    def list_block(element: _Element, index: int, text: str, nested: bool) -> str:
+        if nested:
+            return "\n" + text.rstrip()
+        before_paragraph = False
+        for sibling in element.parent.children[index + 1 :]:  # type: ignore[union-attr]
+            if isinstance(sibling, _Element) or (isinstance(sibling, str) and sibling.strip()):
+                before_paragraph = not isinstance(sibling, _Element) or sibling.name not in ("ul", "ol")
+                break
+        return "\n\n" + text + ("\n" if before_paragraph else "")
+
+    @staticmethod
+    def list_item(element: _Element, text: str, inline: bool) -> str:
+        text = text.strip()
+        if not text:
+            return "\n"
+        parent = element.parent
+        if parent is not None and parent.name == "ol":
+            start_attr = parent.attrs.get("start")
+            start = int(start_attr) if start_attr and start_attr.isnumeric() else 1
+            siblings = parent.children[: parent.children.index(element)]
+            bullet = f"{start + sum(isinstance(s, _Element) and s.name == 'li' for s in siblings)}."
+        else:
+            depth = -1
+            node: _Element | None = element
+            while node is not None:
+                depth += node.name == "ul"
+                node = node.parent
+            bullet = BULLETS[depth % len(BULLETS)]
+        bullet += " "
+        text = _indent(text, " " * len(bullet))
+        return f"{bullet}{text[len(bullet) :]}\n"
+
+
+_renderer = _Renderer()
+
+
+def html_to_markdown(html: str) -> str:
+    """
+    The markdown markdownify would convert html to, built from a single html.parser pass instead of a
+    BeautifulSoup tree. Descriptions using tags outside the common subset (tables, code, definition lists, ...), or
+    any description when the installed markdownify isn't one of EMULATED_MARKDOWNIFY, are converted by markdownify
+    itself.
+    """
+    if not FAST_CONVERSION:
+        return md(html)
+    builder = _TreeBuilder()
+    try:
+        builder.feed(html)
+        builder.close()
+    except _Unsupported:
+        return md(html)
+    return _renderer.render(builder.root)
+
+
+def content_key(html: str) -> str:
+    return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class MarkdownCache:
+    """
+    LRU cache of converted descriptions keyed by a hash of their html, so the same description, seen again on
+    another search or another run, is converted once. With a path the conversions are also kept in a SQLite file,
+    which backs the in-memory entries across runs.
+    """
+
+    def __init__(self, max_entries: int = 2048, path: str | Path | None = None) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(("hits", "misses", "stores"), 0)
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS markdown (key TEXT PRIMARY KEY, markdown TEXT NOT NULL)")
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            markdown = self._entries.get(key)
+            if markdown is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT markdown FROM markdown WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    markdown = row[0]
+                    self._remember(key, markdown)
+            self._counters["hits" if markdown is not None else "misses"] += 1
+            return markdown
+
+    def put(self, key: str, markdown: str) -> None:
+        with self._lock:
+            self._remember(key, markdown)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO markdown VALUES (?, ?)", (key, markdown))
+            self._counters["stores"] += 1
+
+    def _remember(self, key: str, markdown: str) -> None:
+        self._entries[key] = markdown
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM markdown")
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/store counters for this process, plus the entries held in memory."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_markdown_cache: MarkdownCache | None = MarkdownCache()
+
+
+def set_markdown_cache(cache: MarkdownCache | None) -> None:
+    """Installs the cache of converted descriptions (an in-memory one by default); None turns caching off."""
+    global _markdown_cache
+    _markdown_cache = cache
+
+
+def get_markdown_cache() -> MarkdownCache | None:
+    return _markdown_cache
+
+
+def _finish(markdown: str) -> str | None:
+    return markdown.strip() if markdown else None
+
+
+def convert_description(html: str) -> str | None:
+    """
+    Converts one description, through the installed cache (in a worker process of the scrape's cpu pool, if it uses
+    one); the result is stripped, or None if empty.
+    """
+    cache = _markdown_cache
+    if cache is None:
+        return _finish(run(html_to_markdown, html))
+    key = content_key(html)
+    markdown = cache.get(key)
+    if markdown is None:
+        markdown = run(html_to_markdown, html)
+        cache.put(key, markdown)
+    return _finish(markdown)
+
+
+def convert_descriptions(htmls: Iterable[str | None], workers: int | None = None) -> list[str | None]:
+    """
+    convert_description over many descriptions, in order (None stays None). Cached ones are looked up here; with
+    workers the rest are converted in a pool of that many processes, which pays off for large batches only.
+    """
+    htmls = list(htmls)
+    results: list[Any] = [None] * len(htmls)
+    cache = _markdown_cache
+    pending: dict[str, list[int]] = {}
+    with stage(MARKDOWN):
+        for index, html in enumerate(htmls):
+            if html is None:
+                continue
+            key = content_key(html)
+            markdown = cache.get(key) if cache is not None else None
+            if markdown is not None:
+                results[index] = _finish(markdown)
+            else:
+                pending.setdefault(key, []).append(index)
+        sources = [htmls[indices[0]] for indices in pending.values()]
+        if workers and len(sources) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(sources) // (workers * 4))
+                converted = list(executor.map(html_to_markdown, sources, chunksize=chunksize))
+        else:
+            converted = [html_to_markdown(html) for html in sources]  # type: ignore[arg-type]
+        for (key, indices), markdown in zip(pending.items(), converted):
+            if cache is not None:
+                cache.put(key, markdown)
+            for index in indices:
+                results[index] = _finish(markdown)
+    return results
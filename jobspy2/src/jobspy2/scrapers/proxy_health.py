@@ -0,0 +1,189 @@
+"""
+jobspy2.scrapers.proxy_health
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the proxy health tracking that the rotating sessions use to choose a proxy per request.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+LOCALHOST = "http://localhost"
+FAILURE_STATUS_CODES = frozenset({403, 407, 429})
+
+
+def format_proxy(proxy: str) -> dict[str, str]:
+    """Formats a proxy string into a requests-style proxies dictionary."""
+    if proxy.startswith("http://") or proxy.startswith("https://"):
+        return {"http": proxy, "https": proxy}
+    return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+
+
+class ProxyHealth:
+    """Running health of one proxy: smoothed latency and error rate, 429s, and its quarantine state."""
+
+    def __init__(self, proxy: str) -> None:
+        self.proxy = proxy
+        formatted = format_proxy(proxy)
+        # "localhost" stands for a direct connection, so it sends requests with no proxies at all
+        self.proxies: dict[str, str] = {} if formatted["http"] == LOCALHOST else formatted
+        self.requests = 0
+        self.failures = 0
+        self.throttled = 0
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.quarantines = 0
+        self.quarantined_until = 0.0
+
+
+class ProxyPool:
+    """
+    Chooses a proxy per request, weighted toward proxies that answer quickly and successfully. A proxy that fails
+    failure_threshold times in a row, or is answered with a 429, is quarantined for a cool-down that doubles with
+    each consecutive quarantine (up to max_cooldown, or longer if the server sent Retry-After). When every proxy is
+    quarantined, the one whose cool-down ends first is tried anyway rather than stalling the scrape.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str],
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.entries = [ProxyHealth(proxy) for proxy in proxies]
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.smoothing = smoothing
+        self._clock = clock
+        self._random = rng or random.Random()  # noqa: S311
+        self._lock = threading.Lock()
+
+    def choose(self) -> ProxyHealth:
+        with self._lock:
+            now = self._clock()
+            available = [entry for entry in self.entries if entry.quarantined_until <= now]
+            if not available:
+                return min(self.entries, key=lambda entry: entry.quarantined_until)
+            if len(available) == 1:
+                return available[0]
+            default_latency = self._default_latency()
+            weights = [self._weight(entry, default_latency) for entry in available]
+            return self._random.choices(available, weights=weights)[0]
+
+    def record(
+        self,
+        entry: ProxyHealth,
+        latency: float,
+        status_code: int | None = None,
+        retry_after: str | None = None,
+    ) -> None:
+        """Records the outcome of a request sent through entry; status_code None means the request raised."""
+        failed = status_code is None or status_code in FAILURE_STATUS_CODES or status_code >= 500
+        with self._lock:
+            alpha = self.smoothing
+            entry.requests += 1
+            entry.latency = latency if entry.latency is None else (1 - alpha) * entry.latency + alpha * latency
+            entry.error_rate = (1 - alpha) * entry.error_rate + alpha * failed
+            if not failed:
+                entry.consecutive_failures = 0
+                entry.quarantines = 0
+                return
+            entry.failures += 1
+            entry.consecutive_failures += 1
+            if status_code == 429:
+                entry.throttled += 1
+            if status_code == 429 or entry.consecutive_failures >= self.failure_threshold:
+                cooldown = min(self.cooldown * 2**entry.quarantines, self.max_cooldown)
+                entry.quarantines += 1
+                entry.consecutive_failures = 0
+                entry.quarantined_until = self._clock() + max(cooldown, _seconds(retry_after))
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Per-proxy counters, smoothed latency (seconds) and error rate, quarantine state and selection weight."""
+        with self._lock:
+            now = self._clock()
+            default_latency = self._default_latency()
+            return [
+                {
+                    "proxy": entry.proxy,
+                    "requests": entry.requests,
+                    "failures": entry.failures,
+                    "throttled": entry.throttled,
+                    "latency": entry.latency,
+                    "error_rate": round(entry.error_rate, 4),
+                    "quarantined": entry.quarantined_until > now,
+                    "quarantine_remaining": max(entry.quarantined_until - now, 0.0),
+                    "weight": self._weight(entry, default_latency),
+                }
+                for entry in self.entries
+            ]
+
+    def _default_latency(self) -> float:
+        """Proxies without measurements are assumed to be average, so they still get tried."""
+        known = [entry.latency for entry in self.entries if entry.latency is not None]
+        return sum(known) / len(known) if known else 1.0
+
+    @staticmethod
+    def _weight(entry: ProxyHealth, default_latency: float) -> float:
+        latency = entry.latency if entry.latency is not None else default_latency
+        return max((1 - entry.error_rate) ** 2, 0.01) / max(latency, 0.05)
+
+
+def _seconds(retry_after: str | None) -> float:
+    try:
+        return float(retry_after) if retry_after else 0.0
+    except ValueError:
+        return 0.0
+
+
+class ProxyHealthRegistry:
+    """
+    Shares one ProxyPool per (site, proxies) across every session of that site, so health learned by one scrape
+    carries over to the next one.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[tuple[str, tuple[str, ...]], ProxyPool] = {}
+        self._lock = threading.Lock()
+
+    def get(self, site: str, proxies: list[str] | str | None) -> ProxyPool | None:
+        proxy_list = [proxies] if isinstance(proxies, str) else list(proxies or [])
+        if not proxy_list:
+            return None
+        key = (site, tuple(proxy_list))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = ProxyPool(proxy_list)
+            return pool
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        with self._lock:
+            pools = list(self._pools.items())
+        stats: dict[str, list[dict[str, Any]]] = {}
+        for (site, _), pool in pools:
+            stats.setdefault(site, []).extend(pool.snapshot())
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pools.clear()
+
+
+proxy_health = ProxyHealthRegistry()
+
+
+def proxy_stats() -> Mapping[str, list[dict[str, Any]]]:
+    """Health of every proxy used so far in this process, per site."""
+    return proxy_health.snapshot()
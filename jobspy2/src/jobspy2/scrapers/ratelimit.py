@@ -0,0 +1,128 @@
+"""
+jobspy2.scrapers.ratelimit
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the process-wide per-site token-bucket rate limiter that paces search page requests.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, Union
+
+from .exceptions import RateLimitError
+
+RateSpec = Union[float, tuple[float, float], None]
+
+# Average spacing the scrapers used to sleep between search pages: LinkedIn 3-7s, ZipRecruiter 5s.
+DEFAULT_RATE_LIMITS: dict[str, RateSpec] = {
+    "linkedin": 0.2,
+    "zip_recruiter": 0.2,
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at `rate` tokens per second and holding at most `burst` tokens. Callers that
+    find it empty reserve a future token and sleep until it is theirs, so waiting threads are served in order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise RateLimitError(rate)
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Takes tokens, going into debt if needed, and returns how many seconds the caller must wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Blocks until tokens are available. Returns the seconds spent waiting."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Hands out one TokenBucket per (site, proxies), so every scrape of a site through the same proxies shares one
+    request budget no matter which thread or scrape_jobs call it runs in. Sites without a limit are not paced.
+    """
+
+    def __init__(self, limits: Mapping[str, RateSpec] | None = None) -> None:
+        self.limits: dict[str, tuple[float, float]] = {}
+        self._buckets: dict[tuple[str, Any], TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, float]] = {}
+        self.configure(DEFAULT_RATE_LIMITS if limits is None else limits)
+
+    def configure(self, limits: Mapping[str, RateSpec]) -> None:
+        """
+        Sets limits per site: requests per second, a (rate, burst) tuple, or None to stop pacing the site.
+        Sites not mentioned keep their current limit.
+        """
+        with self._lock:
+            for site, spec in limits.items():
+                if spec is None:
+                    self.limits.pop(site, None)
+                else:
+                    rate, burst = spec if isinstance(spec, tuple) else (spec, 1.0)
+                    if rate <= 0:
+                        raise RateLimitError(rate, site)
+                    self.limits[site] = (float(rate), float(burst))
+                for key in [key for key in self._buckets if key[0] == site]:
+                    del self._buckets[key]
+
+    def acquire(self, site: str, proxies: list[str] | str | None = None) -> float:
+        """Waits for a request slot on site through proxies. Returns the seconds spent waiting."""
+        with self._lock:
+            limit = self.limits.get(site)
+            if limit is None:
+                return 0.0
+            key = (site, tuple(proxies) if isinstance(proxies, list) else proxies)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(*limit)
+        waited = bucket.acquire()
+        with self._lock:
+            counters = self._counters.setdefault(site, {"requests": 0, "waited": 0.0})
+            counters["requests"] += 1
+            counters["waited"] += waited
+        return waited
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Paced requests and total seconds waited, per site."""
+        with self._lock:
+            return {site: dict(counters) for site, counters in self._counters.items()}
+
+
+rate_limiter = RateLimiter()
+
+
+def configure_rate_limits(limits: Mapping[str, RateSpec]) -> RateLimiter:
+    """
+    Sets the shared per-site request rates, e.g. {"linkedin": 0.5, "indeed": (2, 5), "zip_recruiter": None}.
+    :param limits: site name -> requests per second, (requests per second, burst) or None for no limit
+    """
+    rate_limiter.configure(limits)
+    return rate_limiter
@@ -0,0 +1,199 @@
+"""
+jobspy2.scrapers.replay
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the record/replay transports that capture scraper HTTP exchanges into fixture files and serve
+them back without a network.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlsplit
+
+import requests
+
+from .cache import build_response, request_key
+from .exceptions import ReplayMissError
+
+FIXTURE_VERSION = 1
+# The recorded body is already decoded, so these would describe the wire format rather than the stored bytes
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class Transport(Protocol):
+    """
+    Sits between a session and the network: send() gets the request and a live() callable that performs it, and
+    returns the response the scraper should see.
+    """
+
+    def send(
+        self, method: str, url: str, kwargs: dict[str, Any], live: Callable[[], requests.Response]
+    ) -> requests.Response: ...
+
+
+def _key(method: str, url: str, kwargs: dict[str, Any]) -> str:
+    return request_key(method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"), kwargs.get("headers"))
+
+
+def _route(method: str, url: str) -> tuple[str, str]:
+    parts = urlsplit(url)
+    return method.upper(), f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def load_fixture(path: str | Path) -> dict[str, Any]:
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fixture(path: str | Path, fixture: dict[str, Any]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = json.dumps(fixture, indent=1, default=str).encode("utf-8")
+    if path.suffix == ".gz":
+        content = gzip.compress(content, mtime=0)  # no timestamp, so re-recording identical exchanges is a no-op
+    path.write_bytes(content)
+
+
+class Recorder:
+    """
+    Records every exchange that passes through it. By default requests go out live; pass inner to record what
+    another transport answers instead (e.g. a synthetic site). meta is saved with the fixture, typically the
+    scrape_jobs arguments needed to replay it.
+    """
+
+    def __init__(self, inner: Transport | None = None, meta: dict[str, Any] | None = None) -> None:
+        self.inner = inner
+        self.meta = meta or {}
+        self.exchanges: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def send(
+        self, method: str, url: str, kwargs: dict[str, Any], live: Callable[[], requests.Response]
+    ) -> requests.Response:
+        response = self.inner.send(method, url, kwargs, live) if self.inner else live()
+        exchange = {
+            "key": _key(method, url, kwargs),
+            "method": method.upper(),
+            "url": url,
+            "params": kwargs.get("params"),
+            "status_code": response.status_code,
+            "response_url": str(response.url or url),
+            "headers": {k: v for k, v in (response.headers or {}).items() if k.lower() not in _DROPPED_HEADERS},
+            "body": response.content.decode("utf-8", "replace") if response.content else "",
+        }
+        with self._lock:
+            self.exchanges.append(exchange)
+        return response
+
+    def save(self, path: str | Path) -> None:
+        with self._lock:
+            fixture = {"version": FIXTURE_VERSION, "meta": self.meta, "exchanges": list(self.exchanges)}
+        save_fixture(path, fixture)
+
+
+class Replay:
+    """
+    Answers requests from recorded exchanges, matched on the same key as the response cache. Repeated requests get
+    the recorded responses in order, and the last one again once they run out. A request that was never recorded
+    falls back to the next exchange for the same method and url path (so a changed query string or body still
+    replays), and otherwise raises ReplayMissError, or goes out live when strict is False.
+    """
+
+    def __init__(self, fixture: str | Path | dict[str, Any], strict: bool = True) -> None:
+        self.fixture = fixture if isinstance(fixture, dict) else load_fixture(fixture)
+        self.meta: dict[str, Any] = self.fixture.get("meta", {})
+        self.strict = strict
+        self.misses: list[tuple[str, str]] = []
+        self.served = 0
+        self.elapsed = 0.0
+        self._by_key: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._by_route: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for exchange in self.fixture["exchanges"]:
+            self._by_key[exchange["key"]].append(exchange)
+            self._by_route[_route(exchange["method"], exchange["url"])].append(exchange)
+        self._positions: dict[Any, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def send(
+        self, method: str, url: str, kwargs: dict[str, Any], live: Callable[[], requests.Response]
+    ) -> requests.Response:
+        start = time.perf_counter()
+        with self._lock:
+            exchange = self._next(_key(method, url, kwargs)) or self._next(_route(method, url), by_route=True)
+            if exchange is None:
+                self.misses.append((method.upper(), url))
+            else:
+                self.served += 1
+        if exchange is None:
+            if self.strict:
+                raise ReplayMissError(method, url)
+            return live()
+        response = build_response(
+            exchange["status_code"],
+            exchange.get("response_url", exchange["url"]),
+            exchange["headers"],
+            exchange["body"].encode("utf-8"),
+        )
+        with self._lock:
+            self.elapsed += time.perf_counter() - start
+        return response
+
+    def _next(self, key: Any, by_route: bool = False) -> dict[str, Any] | None:
+        candidates = (self._by_route if by_route else self._by_key).get(key)
+        if not candidates:
+            return None
+        position = self._positions[key]
+        self._positions[key] = position + 1
+        return candidates[min(position, len(candidates) - 1)]
+
+
+_transport: Transport | None = None
+
+
+def set_transport(transport: Transport | None) -> None:
+    """Installs the transport used by every session created without one of its own; None restores the network."""
+    global _transport
+    _transport = transport
+
+
+def get_transport() -> Transport | None:
+    return _transport
+
+
+@contextmanager
+def using_transport(transport: Transport) -> Iterator[Transport]:
+    previous = get_transport()
+    set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
+
+
+@contextmanager
+def recording(
+    path: str | Path, inner: Transport | None = None, meta: dict[str, Any] | None = None
+) -> Iterator[Recorder]:
+    """Records the exchanges of every scrape run inside the block into a fixture file (gzipped if path ends in .gz)."""
+    recorder = Recorder(inner=inner, meta=meta)
+    with using_transport(recorder):
+        yield recorder
+    recorder.save(path)
+
+
+@contextmanager
+def replaying(fixture: str | Path | dict[str, Any], strict: bool = True) -> Iterator[Replay]:
+    """Serves every scrape run inside the block from a recorded fixture."""
+    with using_transport(Replay(fixture, strict=strict)) as replay:
+        yield replay
@@ -0,0 +1,225 @@
+"""
+jobspy2.scrapers.salary
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the extraction of salary ranges from job descriptions, either one description at a time or a
+whole result set at once: descriptions are matched with one precompiled pattern and the amounts are classified,
+annualized and validated as arrays.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+from ..jobs import CompensationInterval
+from .stats import SALARY, stage
+
+# Interval codes index into INTERVALS and ANNUAL_MULTIPLIERS
+INTERVALS = (
+    CompensationInterval.HOURLY,
+    CompensationInterval.DAILY,
+    CompensationInterval.WEEKLY,
+    CompensationInterval.MONTHLY,
+    CompensationInterval.YEARLY,
+)
+HOURLY, DAILY, WEEKLY, MONTHLY, YEARLY = range(len(INTERVALS))
+NO_INTERVAL = -1
+# 40 hours a week, 5 days a week, 52 weeks a year
+ANNUAL_MULTIPLIERS = np.array([2080, 260, 52, 12, 1], dtype=np.float64)
+ANNUAL_MULTIPLIER_BY_INTERVAL = {
+    interval.value: int(multiplier) for interval, multiplier in zip(INTERVALS, ANNUAL_MULTIPLIERS)
+}
+
+CURRENCIES = {"$": "USD", "US$": "USD", "C$": "CAD", "CA$": "CAD", "A$": "AUD", "AU$": "AUD"}
+CURRENCIES.update({"£": "GBP", "€": "EUR", "₹": "INR"})
+INTERVAL_WORDS = {
+    "hour": HOURLY,
+    "hr": HOURLY,
+    "hourly": HOURLY,
+    "day": DAILY,
+    "daily": DAILY,
+    "week": WEEKLY,
+    "wk": WEEKLY,
+    "weekly": WEEKLY,
+    "month": MONTHLY,
+    "mo": MONTHLY,
+    "monthly": MONTHLY,
+    "year": YEARLY,
+    "yr": YEARLY,
+    "annum": YEARLY,
+    "annually": YEARLY,
+    "yearly": YEARLY,
+}
+
+# Dollars can be prefixed with their country ("CA$"), which is looked up behind the match so the pattern starts
+# with the symbol and the regex engine can skip ahead to the next one
+DOLLAR_PREFIXES = ("US", "CA", "AU", "C", "A")
+_CURRENCY = r"(?:(?:US|CA?|AU?)?\$|£|€|₹)"
+_AMOUNT = r"(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?"
+_SALARY = rf"""
+    (?P<currency>{{symbol}})\s?(?P<min>{_AMOUNT})\s?(?P<min_k>[kK](?![A-Za-z]))?
+    (?:\s*(?:[-—–]|(?i:to))\s*{_CURRENCY}?\s?(?P<max>{_AMOUNT})\s?(?P<max_k>[kK](?![A-Za-z]))?)?
+    (?i:\s*(?:/\s*|per\s+|an?\s+)(?P<per>hour|hr|day|week|wk|month|mo|year|yr|annum)\b
+    |\s*(?P<adverb>hourly|daily|weekly|monthly|annually|yearly)\b)?
+"""  # noqa: RUF001
+SALARY_PATTERN = re.compile(_SALARY.replace("{symbol}", "[$£€₹]"), re.VERBOSE)
+# Only dollars can occur in ascii text, and a literal first character is much faster to scan for than a class
+ASCII_SALARY_PATTERN = re.compile(_SALARY.replace("{symbol}", r"\$"), re.VERBOSE)
+
+Salary = tuple[Union[CompensationInterval, None], Union[float, None], Union[float, None], Union[str, None]]
+NO_SALARY: Salary = (None, None, None, None)
+
+
+def _amount(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+def _currency(description: str, symbol: str, start: int) -> str:
+    if symbol != "$" or not start or not description[start - 1].isalpha():
+        return CURRENCIES[symbol]
+    for prefix in DOLLAR_PREFIXES:
+        begin = start - len(prefix)
+        if (
+            begin >= 0
+            and description.startswith(prefix, begin, start)
+            and (begin == 0 or not description[begin - 1].isalpha())
+        ):
+            return CURRENCIES[prefix + symbol]
+    return CURRENCIES[symbol]
+
+
+def parse_salaries(descriptions: Iterable[Any]) -> dict[str, np.ndarray]:
+    """
+    Finds the first salary in each description: a range ("$80,000 - $100,000", "$40-50k", "£30k to £35k") or a
+    single amount followed by its interval ("$25/hr", "$120,000 per year"). Returns arrays of the minimum and maximum
+    amounts (NaN where nothing was found), the interval stated next to them (NO_INTERVAL if none), the currency
+    codes and a matched mask.
+    """
+    minimums, maximums, intervals, currencies = [], [], [], []
+    for description in descriptions:
+        found = None
+        if isinstance(description, str) and description:
+            pattern = ASCII_SALARY_PATTERN if description.isascii() else SALARY_PATTERN
+            for match in pattern.finditer(description):
+                groups = match.groups()
+                # A lone amount is only a salary when its interval says so (not "$5M in funding")
+                if groups[3] or groups[5] or groups[6]:
+                    found = match
+                    break
+        if found is None:
+            minimums.append(np.nan)
+            maximums.append(np.nan)
+            intervals.append(NO_INTERVAL)
+            currencies.append(None)
+            continue
+        symbol, minimum_text, min_k, maximum_text, max_k, per, adverb = groups
+        minimum = _amount(minimum_text)
+        maximum = _amount(maximum_text) if maximum_text else minimum
+        if min_k or max_k:
+            minimum, maximum = minimum * 1000, maximum * 1000
+        minimums.append(minimum)
+        maximums.append(maximum)
+        intervals.append(INTERVAL_WORDS[(per or adverb).lower()] if per or adverb else NO_INTERVAL)
+        currencies.append(_currency(description, symbol, found.start()))
+    minimum_array = np.array(minimums, dtype=np.float64)
+    return {
+        "min": minimum_array,
+        "max": np.array(maximums, dtype=np.float64),
+        "interval": np.array(intervals, dtype=np.int64),
+        "currency": np.array(currencies, dtype=object),
+        "matched": ~np.isnan(minimum_array),
+    }
+
+
+def determine_intervals(
+    minimums: np.ndarray, stated: np.ndarray, hourly_threshold: float, monthly_threshold: float
+) -> np.ndarray:
+    """The interval code of each amount: the stated one, else hourly or monthly below the thresholds, else yearly."""
+    inferred = np.where(minimums < hourly_threshold, HOURLY, np.where(minimums < monthly_threshold, MONTHLY, YEARLY))
+    return np.where(stated == NO_INTERVAL, inferred, stated)
+
+
+def annualize(amounts: np.ndarray, intervals: np.ndarray) -> np.ndarray:
+    """amounts paid per interval (codes) as yearly amounts."""
+    return amounts * ANNUAL_MULTIPLIERS[intervals]
+
+
+def _extract(
+    descriptions: Iterable[Any],
+    lower_limit: int,
+    upper_limit: int,
+    hourly_threshold: int,
+    monthly_threshold: int,
+    enforce_annual_salary: bool,
+) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    with stage(SALARY):
+        parsed = parse_salaries(descriptions)
+    intervals = determine_intervals(parsed["min"], parsed["interval"], hourly_threshold, monthly_threshold)
+    annual_min = annualize(parsed["min"], intervals)
+    annual_max = annualize(parsed["max"], intervals)
+    # A range ending in 0 is checked by its minimum alone
+    annual_max = np.where(parsed["max"] == 0, annual_min, annual_max)
+    valid = (
+        parsed["matched"]
+        & (lower_limit <= annual_min)
+        & (annual_min <= upper_limit)
+        & (lower_limit <= annual_max)
+        & (annual_max <= upper_limit)
+    )
+    if enforce_annual_salary:
+        valid &= intervals == YEARLY
+    return parsed, intervals, valid
+
+
+def extract_salaries(
+    descriptions: pd.Series | Iterable[Any],
+    lower_limit: int = 1000,
+    upper_limit: int = 700000,
+    hourly_threshold: int = 350,
+    monthly_threshold: int = 30000,
+    enforce_annual_salary: bool = False,
+) -> pd.DataFrame:
+    """
+    extract_salary over many descriptions in one pass. Returns a frame with interval (CompensationInterval),
+    min_amount, max_amount and currency columns, one row per description (on the Series' index, if given); rows
+    without a valid salary are all missing.
+    """
+    index = descriptions.index if isinstance(descriptions, pd.Series) else None
+    parsed, intervals, valid = _extract(
+        descriptions, lower_limit, upper_limit, hourly_threshold, monthly_threshold, enforce_annual_salary
+    )
+    interval_values = np.array([*INTERVALS, None], dtype=object)
+    return pd.DataFrame(
+        {
+            "interval": interval_values[np.where(valid, intervals, len(INTERVALS))],
+            "min_amount": np.where(valid, parsed["min"], np.nan),
+            "max_amount": np.where(valid, parsed["max"], np.nan),
+            "currency": np.where(valid, parsed["currency"], None),
+        },
+        index=index,
+    )
+
+
+def salary_rows(
+    descriptions: Iterable[Any],
+    lower_limit: int = 1000,
+    upper_limit: int = 700000,
+    hourly_threshold: int = 350,
+    monthly_threshold: int = 30000,
+    enforce_annual_salary: bool = False,
+) -> list[Salary]:
+    """extract_salaries as a list of extract_salary tuples, for building job records."""
+    parsed, intervals, valid = _extract(
+        descriptions, lower_limit, upper_limit, hourly_threshold, monthly_threshold, enforce_annual_salary
+    )
+    return [
+        (INTERVALS[interval], minimum, maximum, currency) if is_valid else NO_SALARY
+        for interval, minimum, maximum, currency, is_valid in zip(
+            intervals.tolist(), parsed["min"].tolist(), parsed["max"].tolist(), parsed["currency"], valid.tolist()
+        )
+    ]
@@ -0,0 +1,139 @@
+"""
+jobspy2.scrapers.session_pool
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the process-wide registry of HTTP sessions shared across scrape_jobs calls.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import requests
+
+SessionKey = tuple[str, Any, Any]
+
+
+def session_key(site: str, proxies: list[str] | str | None, ca_cert: str | None) -> SessionKey:
+    """Key sessions by everything that changes how their connections are opened."""
+    return site, tuple(proxies) if isinstance(proxies, list) else proxies, ca_cert
+
+
+class SessionPool:
+    """
+    Keeps idle sessions (and therefore their keep-alive connections) per (site, proxies, ca_cert) key.
+    A session is leased to one scraper at a time with acquire() and handed back with release(); sessions
+    idle for longer than idle_timeout seconds, or beyond max_idle_per_key, are closed.
+    """
+
+    def __init__(self, max_idle_per_key: int = 4, idle_timeout: float = 300.0, pool_maxsize: int = 10) -> None:
+        self.max_idle_per_key = max_idle_per_key
+        self.idle_timeout = idle_timeout
+        self.pool_maxsize = pool_maxsize
+        self._idle: dict[SessionKey, list[tuple[requests.Session, float]]] = {}
+        self._leases: dict[int, tuple[bool, int]] = {}
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(("created", "reused", "evicted", "requests", "warm_requests"), 0)
+
+    def acquire(self, key: SessionKey, factory: Callable[[], requests.Session]) -> requests.Session:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            idle = self._idle.get(key)
+            if idle:
+                session, _ = idle.pop()
+                self._counters["reused"] += 1
+                self._leases[id(session)] = (True, _request_count(session))
+                return session
+        session = factory()
+        with self._lock:
+            self._counters["created"] += 1
+            self._leases[id(session)] = (False, _request_count(session))
+        return session
+
+    def release(self, key: SessionKey, session: requests.Session) -> None:
+        to_close = []
+        with self._lock:
+            reused, start_count = self._leases.pop(id(session), (False, 0))
+            served = _request_count(session) - start_count
+            self._counters["requests"] += served
+            if reused:
+                self._counters["warm_requests"] += served
+            idle = self._idle.setdefault(key, [])
+            idle.append((session, time.monotonic()))
+            while len(idle) > self.max_idle_per_key:
+                to_close.append(idle.pop(0)[0])
+            self._counters["evicted"] += len(to_close)
+        for stale in to_close:
+            stale.close()
+
+    def evict_idle(self) -> int:
+        """Closes sessions that have been idle for longer than idle_timeout. Returns how many were closed."""
+        with self._lock:
+            return self._evict_expired(time.monotonic())
+
+    def clear(self) -> None:
+        """Closes every idle session."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for sessions in idle.values():
+            for session, _ in sessions:
+                session.close()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Pool counters: sessions created, reused and evicted, sessions currently leased and idle, requests sent
+        over pooled sessions, and warm_requests, the share of those sent over a reused session whose keep-alive
+        connections skip the TCP+TLS handshake.
+        """
+        with self._lock:
+            return {
+                **self._counters,
+                "in_use": len(self._leases),
+                "idle": sum(len(sessions) for sessions in self._idle.values()),
+            }
+
+    def _evict_expired(self, now: float) -> int:
+        expired = 0
+        for key, sessions in list(self._idle.items()):
+            fresh = []
+            for session, last_used in sessions:
+                if now - last_used > self.idle_timeout:
+                    session.close()
+                    expired += 1
+                else:
+                    fresh.append((session, last_used))
+            if fresh:
+                self._idle[key] = fresh
+            else:
+                del self._idle[key]
+        self._counters["evicted"] += expired
+        return expired
+
+
+def _request_count(session: requests.Session) -> int:
+    return getattr(session, "request_count", 0)
+
+
+session_pool = SessionPool()
+
+
+def configure_session_pool(
+    max_idle_per_key: int | None = None, idle_timeout: float | None = None, pool_maxsize: int | None = None
+) -> SessionPool:
+    """
+    Tunes the shared session pool.
+    :param max_idle_per_key: idle sessions kept per (site, proxies, ca_cert)
+    :param idle_timeout: seconds an idle session is kept before it is closed
+    :param pool_maxsize: keep-alive connections per host in newly created requests-based sessions
+    """
+    with session_pool._lock:
+        if max_idle_per_key is not None:
+            session_pool.max_idle_per_key = max_idle_per_key
+        if idle_timeout is not None:
+            session_pool.idle_timeout = idle_timeout
+        if pool_maxsize is not None:
+            session_pool.pool_maxsize = pool_maxsize
+    return session_pool
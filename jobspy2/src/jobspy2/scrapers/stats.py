@@ -0,0 +1,137 @@
+"""
+jobspy2.scrapers.stats
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the per-stage timers and counters that fill a site's ScrapeStats while it is scraped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar, copy_context
+from typing import Any, TypeVar
+
+import requests
+
+from ..jobs import ScrapeStats
+from .cache import DETAIL, SEARCH
+
+NETWORK = "network"
+SLEEP = "sleep"
+PARSE = "parse"
+MARKDOWN = "markdown"
+SALARY = "salary"
+ASSEMBLY = "assembly"
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+
+
+class _Frame:
+    __slots__ = ("children", "name", "parent", "start", "stats", "thread")
+
+    def __init__(self, stats: ScrapeStats, name: str | None, parent: _Frame | None) -> None:
+        self.stats = stats
+        self.name = name
+        self.parent = parent
+        self.thread = threading.get_ident()
+        self.children = 0.0
+        self.start = time.perf_counter()
+
+
+_current: ContextVar[_Frame | None] = ContextVar("jobspy2_scrape_stage", default=None)
+
+
+class _Stage:
+    __slots__ = ("frame", "name", "stats", "token")
+
+    def __init__(self, name: str | None, stats: ScrapeStats | None = None) -> None:
+        self.name = name
+        self.stats = stats
+        self.frame: _Frame | None = None
+
+    def __enter__(self) -> _Stage:
+        parent = _current.get()
+        if self.stats is not None:
+            self.frame = _Frame(self.stats, self.name, None)
+        elif parent is not None:
+            self.frame = _Frame(parent.stats, self.name, parent)
+        else:
+            return self
+        self.token = _current.set(self.frame)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        frame = self.frame
+        if frame is None:
+            return
+        _current.reset(self.token)
+        self.frame = None
+        elapsed = time.perf_counter() - frame.start
+        parent = frame.parent
+        # Work handed to other threads overlaps with the parent, which is waiting for it rather than paused
+        if parent is not None and parent.thread == frame.thread:
+            parent.children += elapsed
+        if frame.name is not None:
+            add_time(frame.stats, frame.name, max(elapsed - frame.children, 0.0))
+
+
+def add_time(stats: ScrapeStats, name: str, seconds: float) -> None:
+    with _lock:
+        stats.timings[name] = stats.timings.get(name, 0.0) + seconds
+
+
+def stage(name: str) -> _Stage:
+    """Times the block as stage name of the scrape being collected in this context; does nothing outside one."""
+    return _Stage(name)
+
+
+def waiting() -> _Stage:
+    """
+    Marks a block that waits on worker threads started with submit(). Their stages are timed where they run, so the
+    wait itself is left out of the enclosing stage.
+    """
+    return _Stage(None)
+
+
+def collecting(stats: ScrapeStats, name: str) -> _Stage:
+    """Collects every stage and counter of the block, and the threads it submits to, into stats; the rest is name."""
+    return _Stage(name, stats)
+
+
+def count(**counters: int) -> None:
+    """Adds to the counters (requests, pages, bytes, ...) of the scrape being collected in this context."""
+    frame = _current.get()
+    if frame is None:
+        return
+    stats = frame.stats
+    with _lock:
+        for counter, value in counters.items():
+            setattr(stats, counter, getattr(stats, counter) + value)
+
+
+def count_response(response: requests.Response, cache_kind: str | None) -> None:
+    if _current.get() is None:
+        return
+    retry_state = getattr(getattr(response, "raw", None), "retries", None)
+    count(
+        requests=1,
+        pages=cache_kind == SEARCH,
+        detail_pages=cache_kind == DETAIL,
+        bytes=len(response.content or b""),
+        retries=len(getattr(retry_state, "history", None) or ()),
+    )
+
+
+def _run_as_parse(fn: Callable[..., T], args: tuple[Any, ...]) -> T:
+    with stage(PARSE):
+        return fn(*args)
+
+
+def submit(executor: Executor, fn: Callable[..., T], *args: Any) -> Future[T]:
+    """executor.submit() that keeps collecting into the caller's scrape, timing fn's own work as parse."""
+    return executor.submit(copy_context().run, _run_as_parse, fn, args)
@@ -2,18 +2,24 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Iterator
-from itertools import cycle
+import time
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
 import requests
 import tls_client
 from bs4.element import Tag
-from markdownify import markdownify as md
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter, Retry
 
 from ..jobs import CompensationInterval, JobType
+from .cache import SEARCH, get_response_cache, request_key
+from .keywords import classify_description
+from .markdown import convert_description
+from .proxy_health import ProxyPool, format_proxy
+from .replay import Transport, get_transport
+from .salary import salary_rows
+from .stats import MARKDOWN, NETWORK, SLEEP, count, count_response, stage
 
 
 def create_logger(name: str) -> logging.Logger:
@@ -30,20 +36,72 @@ def create_logger(name: str) -> logging.Logger:
 
 
 class RotatingProxySession:
-    def __init__(self, proxies: list[str] | str | None = None) -> None:
-        if isinstance(proxies, str):
-            self.proxy_cycle: Iterator[dict[str, str]] | None = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = cycle([self.format_proxy(proxy) for proxy in proxies]) if proxies else None
-        else:
-            self.proxy_cycle = None
-
-    @staticmethod
-    def format_proxy(proxy: str) -> dict[str, str]:
-        """Utility method to format a proxy string into a dictionary."""
-        if proxy.startswith("http://") or proxy.startswith("https://"):
-            return {"http": proxy, "https": proxy}
-        return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+    request_count = 0
+    throttle: Callable[[], float] | None = None
+    transport: Transport | None = None
+
+    def __init__(self, proxies: list[str] | str | None = None, proxy_pool: ProxyPool | None = None) -> None:
+        if proxy_pool is None and proxies:
+            proxy_pool = ProxyPool([proxies] if isinstance(proxies, str) else proxies)
+        self.proxy_pool = proxy_pool
+
+    def _send_through_proxy(self, send: Callable[[dict[str, str] | None], requests.Response]) -> requests.Response:
+        """
+        Sends through the proxy the pool picks for this request, and reports back how long it took and how it went.
+        The proxy is handed to send for this request alone, never set on the session, as the threads sharing a
+        session each send through their own.
+        """
+        self.request_count += 1
+        if self.proxy_pool is None:
+            return send(None)
+        entry = self.proxy_pool.choose()
+        start = time.perf_counter()
+        try:
+            response = send(entry.proxies)
+        except Exception:
+            self.proxy_pool.record(entry, time.perf_counter() - start)
+            raise
+        headers = response.headers or {}
+        self.proxy_pool.record(entry, time.perf_counter() - start, response.status_code, headers.get("retry-after"))
+        return response
+
+    def _send_through_cache(
+        self, send: Callable[..., requests.Response], method: str, url: str, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Serves requests marked with cache_kind ("search" or "detail") from the installed response cache, and stores
+        successful live responses for them. Unmarked requests, or any request while no cache is installed, go out as is.
+        Search pages that do go out first wait for a slot from throttle, the site's shared rate limit.
+        With a transport (the session's own, or the one installed with set_transport) requests are handed to it
+        instead, so they can be recorded or replayed.
+        """
+        cache_kind = kwargs.pop("cache_kind", None)
+        cache = get_response_cache() if cache_kind else None
+        key = None
+        if cache is not None:
+            key = request_key(
+                method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"), kwargs.get("headers")
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                count(cache_hits=1)
+                return cached
+
+        def live() -> requests.Response:
+            if cache_kind == SEARCH and self.throttle is not None:
+                with stage(SLEEP):
+                    self.throttle()
+            return send(method, url, **kwargs)
+
+        transport = self.transport or get_transport()
+        with stage(NETWORK):
+            response = transport.send(method, url, kwargs, live) if transport is not None else live()
+        count_response(response, cache_kind)
+        if key is not None and response.status_code == 200:
+            cache.put(key, cache_kind, response)
+        return response
+
+    format_proxy = staticmethod(format_proxy)
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
@@ -53,52 +111,56 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         has_retry: bool = False,
         delay: int = 1,
         clear_cookies: bool = False,
+        pool_maxsize: int | None = None,
+        proxy_pool: ProxyPool | None = None,
     ) -> None:
-        RotatingProxySession.__init__(self, proxies=proxies)
+        RotatingProxySession.__init__(self, proxies=proxies, proxy_pool=proxy_pool)
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
-        self.setup_session(has_retry, delay)
-
-    def setup_session(self, has_retry: bool, delay: int) -> None:
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
+        self.setup_session(has_retry, delay, pool_maxsize)
+
+    def setup_session(self, has_retry: bool, delay: int, pool_maxsize: int | None = None) -> None:
+        if has_retry or pool_maxsize:
+            retries = (
+                Retry(
+                    total=3,
+                    connect=3,
+                    status=3,
+                    status_forcelist=[500, 502, 503, 504, 429],
+                    backoff_factor=delay,
+                )
+                if has_retry
+                else 0
             )
-            adapter = HTTPAdapter(max_retries=retries)
+            pool_size = pool_maxsize or DEFAULT_POOLSIZE
+            adapter = HTTPAdapter(max_retries=retries, pool_connections=pool_size, pool_maxsize=pool_size)
             self.mount("http://", adapter)
             self.mount("https://", adapter)
 
     def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self._send_through_cache(self._send, method, url, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
         if self.clear_cookies:
             self.cookies.clear()
-
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        return self._send_through_proxy(
+            lambda proxies: requests.Session.request(self, method, url, proxies=proxies, **kwargs)
+        )
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies: list[str] | str | None = None) -> None:
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(self, proxies: list[str] | str | None = None, proxy_pool: ProxyPool | None = None) -> None:
+        RotatingProxySession.__init__(self, proxies=proxies, proxy_pool=proxy_pool)
         tls_client.Session.__init__(self, random_tls_extension_order=True)
 
-    def execute_request(self, *args: Any, **kwargs: Any) -> requests.Response:
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
+    def execute_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self._send_through_cache(self._send, method, url, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        response = self._send_through_proxy(
+            lambda proxy: tls_client.Session.execute_request(self, method, url, proxy=proxy, **kwargs)
+        )
         response.ok = response.status_code in range(200, 400)
         return response
 
@@ -111,23 +173,33 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    pool_maxsize: int | None = None,
+    proxy_pool: ProxyPool | None = None,
+    transport: Transport | None = None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    pool_maxsize sets how many keep-alive connections per host a non-tls session keeps.
+    proxy_pool shares proxy health with other sessions; by default the session tracks its proxies on its own.
+    transport (e.g. a Recorder or Replay) handles this session's requests instead of the installed default.
     :return: A session object
     """
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        session = TLSRotating(proxies=proxies, proxy_pool=proxy_pool)
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            pool_maxsize=pool_maxsize,
+            proxy_pool=proxy_pool,
         )
 
     if ca_cert:
         session.verify = ca_cert
+    if transport is not None:
+        session.transport = transport
 
     return session
 
@@ -135,8 +207,8 @@ def create_session(
 def markdown_converter(description_html: str | None) -> str | None:
     if description_html is None:
         return None
-    markdown = md(description_html)
-    return markdown.strip() if markdown else None
+    with stage(MARKDOWN):
+        return convert_description(description_html)
 
 
 def extract_emails_from_text(text: str | None) -> list[str] | None:
@@ -189,121 +261,25 @@ def extract_salary(
     hourly_threshold: int = 350,
     monthly_threshold: int = 30000,
     enforce_annual_salary: bool = False,
-) -> tuple[str | None, float | None, float | None, str | None]:
+) -> tuple[CompensationInterval | None, float | None, float | None, str | None]:
     """
-    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
-    (TODO: Needs test cases as the regex is complicated and may not cover all edge cases)
+    Extracts the first salary in a string (see salary.parse_salaries for the formats recognised) and returns its
+    interval, min and max amounts and currency. Without a stated interval, amounts below hourly_threshold are taken
+    as hourly and below monthly_threshold as monthly. Salaries whose annual amounts fall outside the limits (or, with
+    enforce_annual_salary, that aren't yearly) are dropped. Use salary.extract_salaries for many strings at once.
     """
     if not salary_str:
         return None, None, None, None
-
-    parsed_values = parse_salary_string(salary_str)
-    if not parsed_values:
-        return None, None, None, None
-
-    min_salary, max_salary = parsed_values
-    return calculate_salary_range(
-        min_salary,
-        max_salary,
-        lower_limit,
-        upper_limit,
-        hourly_threshold,
-        monthly_threshold,
-        enforce_annual_salary,
-    )
-
-
-def parse_salary_string(salary_str: str) -> tuple[int, int] | None:
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"  # noqa: RUF001
-    match = re.search(min_max_pattern, salary_str)
-    if not match:
-        return None
-
-    def to_int(s: str) -> int:
-        return int(float(s.replace(",", "")))
-
-    min_salary = to_int(match.group(1))
-    max_salary = to_int(match.group(3))
-
-    # Handle 'k' suffix for min and max salaries independently
-    if "k" in match.group(2).lower() or "k" in match.group(4).lower():
-        min_salary *= 1000
-        max_salary *= 1000
-
-    return min_salary, max_salary
-
-
-def calculate_salary_range(
-    min_salary: int,
-    max_salary: int,
-    lower_limit: int,
-    upper_limit: int,
-    hourly_threshold: int,
-    monthly_threshold: int,
-    enforce_annual_salary: bool,
-) -> tuple[str | None, float | None, float | None, str | None]:
-    """
-    Calculates the salary range based on the input parameters.
-    Returns a tuple of (interval, min_salary, max_salary, currency).
-    """
-    interval, annual_min, annual_max = determine_interval_and_annual_values(
-        min_salary, max_salary, hourly_threshold, monthly_threshold
-    )
-
-    if enforce_annual_salary and interval != CompensationInterval.YEARLY:
-        return None, None, None, None
-
-    if annual_min is not None and not is_valid_salary_range(
-        annual_min, annual_max or annual_min, lower_limit, upper_limit
-    ):
-        return None, None, None, None
-
-    return interval, min_salary, max_salary, "USD"
-
-
-def determine_interval_and_annual_values(
-    min_salary: int, max_salary: int, hourly_threshold: int, monthly_threshold: int
-) -> tuple[str, float | None, float | None]:
-    """
-    Determines the salary interval and calculates annual values.
-    Returns a tuple of (interval, annual_min, annual_max).
-    """
-    if min_salary < hourly_threshold:
-        interval = CompensationInterval.HOURLY
-        annual_min = min_salary * 2080  # 40 hours/week * 52 weeks
-        annual_max = max_salary * 2080 if max_salary else None
-    elif min_salary < monthly_threshold:
-        interval = CompensationInterval.MONTHLY
-        annual_min = min_salary * 12
-        annual_max = max_salary * 12 if max_salary else None
-    else:
-        interval = CompensationInterval.YEARLY
-        annual_min = min_salary
-        annual_max = max_salary if max_salary else None
-
-    return interval, annual_min, annual_max
-
-
-def is_valid_salary_range(annual_min: float, annual_max: float, lower_limit: int, upper_limit: int) -> bool:
-    """
-    Checks if the salary range is valid based on the given limits.
-    """
-    return lower_limit <= annual_min <= upper_limit and lower_limit <= annual_max <= upper_limit
+    return salary_rows(
+        [salary_str], lower_limit, upper_limit, hourly_threshold, monthly_threshold, enforce_annual_salary
+    )[0]
 
 
 def extract_job_type(description: str | None) -> list[JobType]:
     """
     Extracts job type from job description.
     """
-    if not description:
-        return []
-
-    job_types: list[JobType] = []
-    for job_type in JobType:
-        if any(keyword.lower() in description.lower() for keyword in job_type.value):
-            job_types.append(job_type)
-
-    return job_types
+    return classify_description(description).job_types
 
 
 def setup_logger(logger_name: str) -> logging.Logger:
@@ -0,0 +1,78 @@
+"""
+jobspy2.scrapers.workers
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the process-wide pool of threads the scrapers process each search page's jobs in (fetching
+their job pages and parsing them), shared by every page, site and scrape_jobs call instead of a pool per page.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .stats import submit, waiting
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 32
+
+_pool: ThreadPoolExecutor | None = None
+_max_workers = DEFAULT_MAX_WORKERS
+_lock = threading.Lock()
+
+
+class WorkersError(ValueError):
+    def __init__(self, max_workers: int) -> None:
+        self.message = f"max_workers must be a positive number of threads, got {max_workers!r}"
+        super().__init__(self.message)
+
+
+def worker_pool() -> ThreadPoolExecutor:
+    """The shared pool, started on first use"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="jobspy2-worker")
+        return _pool
+
+
+def configure_workers(max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+    """
+    Bounds the threads processing jobs across all scrapes. Jobs already submitted finish on the previous pool; later
+    ones use a new pool of max_workers threads.
+    """
+    global _pool, _max_workers
+    if max_workers < 1:
+        raise WorkersError(max_workers)
+    with _lock:
+        previous, _pool, _max_workers = _pool, None, max_workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def submit_jobs(fn: Callable[[Any], T], items: Iterable[Any], limit: int | None = None) -> list[Future[T]]:
+    """
+    fn(item) for each item in the shared pool, timed as part of the caller's scrape (see stats.submit). With a limit,
+    at most that many of them run at once: submitting waits for a slot, so call it where the scrape can wait.
+    """
+    executor = worker_pool()
+    if limit is None:
+        return [submit(executor, fn, item) for item in items]
+    slots = threading.BoundedSemaphore(limit)
+    futures = []
+    with waiting():
+        for item in items:
+            slots.acquire()
+            future = submit(executor, fn, item)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+    return futures
+
+
+def job_results(futures: list[Future[T]]) -> list[T]:
+    """The results of submit_jobs, in the order the items were submitted, raising the first job's error"""
+    with waiting():
+        return [future.result() for future in futures]
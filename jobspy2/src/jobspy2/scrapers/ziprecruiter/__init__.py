@@ -10,8 +10,6 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 import logging
@@ -30,16 +28,41 @@ from ...jobs import (
     Location,
 )
 from .. import Scraper, ScraperInput, Site
+from ..cache import DETAIL, SEARCH
+from ..cpu import run
+from ..descriptions import DescriptionHandle
 from ..utils import (
     create_logger,
-    create_session,
     extract_emails_from_text,
     markdown_converter,
     remove_attributes,
 )
+from ..workers import job_results, submit_jobs
 from .constants import headers
 
 
+def parse_job_page(html: str) -> tuple[str, str | None]:
+    """
+    The full description (job and company description html) and the direct job URL of a job page. A module-level
+    function, so that cpu.run can hand it to a worker process.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    job_descr_div = soup.find("div", class_="job_description")
+    company_descr_section = soup.find("section", class_="company_description")
+    job_description_clean = remove_attributes(job_descr_div).prettify(formatter="html") if job_descr_div else ""
+    company_description_clean = (
+        remove_attributes(company_descr_section).prettify(formatter="html") if company_descr_section else ""
+    )
+    job_url_direct = None
+    script_tag = soup.find("script", type="application/json")
+    if script_tag:
+        job_json = json.loads(script_tag.string)
+        job_url_val = job_json["model"].get("saveJobURL", "")
+        m = re.search(r"job_url=(.+)", job_url_val)
+        if m:
+            job_url_direct = m.group(1)
+    return job_description_clean + company_description_clean, job_url_direct
+
 
 class ZipRecruiterScraper(Scraper):
     base_url = "https://www.ziprecruiter.com"
@@ -52,11 +75,10 @@ class ZipRecruiterScraper(Scraper):
         super().__init__(Site.ZIP_RECRUITER, logger=logger, proxies=proxies, ca_cert=ca_cert)
 
         self.scraper_input: ScraperInput | None = None
-        self.session: requests.Session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session: requests.Session = self._acquire_session()
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay: int = 5
         self.jobs_per_page: int = 20
         self.seen_urls: set[str] = set()
 
@@ -68,34 +90,47 @@ class ZipRecruiterScraper(Scraper):
         """
         self.scraper_input = scraper_input
         job_list: list[JobPost] = []
-        continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
-            if page > 1:
-                time.sleep(self.delay)
-            self.logger.info(f"search page: {page} / {max_pages}")
-            jobs_on_page, continue_token = self._find_jobs_in_page(scraper_input, continue_token)
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
+        page = 1
+        self.logger.info(f"search page: {page} / {max_pages}")
+        jobs_data, continue_token = self._find_jobs_in_page(scraper_input)
+        while jobs_data:
+            results = submit_jobs(self._process_job, jobs_data)
+            has_next_page = bool(continue_token) and page < max_pages
+            next_page = None
+            if (
+                has_next_page
+                and len(job_list) + len(jobs_data) < scraper_input.results_wanted
+                and not scraper_input.seen_job_ids
+            ):
+                # Every job of this page is wanted, so the next page is too: fetch it while this one is processed
+                self.logger.info(f"search page: {page + 1} / {max_pages}")
+                next_page = self._find_jobs_in_page(scraper_input, continue_token)
+            jobs_on_page = list(filter(None, job_results(results)))
+            if not jobs_on_page:
                 break
-            if not continue_token:
+            job_list.extend(jobs_on_page)
+            self._publish(job_list, 0, scraper_input.results_wanted)
+            if not has_next_page or len(job_list) >= scraper_input.results_wanted or self._seen_page(jobs_on_page):
                 break
+            page += 1
+            if next_page is None:
+                self.logger.info(f"search page: {page} / {max_pages}")
+                next_page = self._find_jobs_in_page(scraper_input, continue_token)
+            jobs_data, continue_token = next_page
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
-    ) -> tuple[list[JobPost], str | None]:
+    ) -> tuple[list[dict[str, Any]], str | None]:
         """
-        Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
+        Searches a page of ZipRecruiter for jobs with scraper_input criteria
         :param scraper_input:
         :param continue_token:
-        :return: jobs found on page
+        :return: the page's jobs, to be processed with _process_job, and the next page's continue token
         """
-        jobs_list: list[JobPost] = []
+        jobs_list: list[dict[str, Any]] = []
         params = self._add_params(scraper_input)
         if continue_token:
             params["continue_from"] = continue_token
@@ -103,7 +138,7 @@ class ZipRecruiterScraper(Scraper):
             query_string = urlencode(params)
             full_url = f"{self.api_url}/jobs-app/jobs?{query_string}"	
             self.logger.debug(f"Getting ZipRecruiter URL: {full_url}")
-            res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
+            res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params, cache_kind=SEARCH)
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
                     self.logger.error("429 Response - Blocked by ZipRecruiter for too many requests")
@@ -121,13 +156,7 @@ class ZipRecruiterScraper(Scraper):
             return jobs_list, ""
 
         res_data = res.json()
-        jobs_data = res_data.get("jobs", [])
-        next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_data]
-
-        job_list = list(filter(None, (result.result() for result in job_results)))
-        return job_list, next_continue_token
+        return res_data.get("jobs", []), res_data.get("continue", None)
 
     def _process_job(self, job: dict[str, Any]) -> JobPost | None:
         """
@@ -160,7 +189,11 @@ class ZipRecruiterScraper(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        description_full = job_url_direct = description_handle = None
+        if self.scraper_input.defer_descriptions:
+            description_handle = DescriptionHandle.for_job(self.site, self.scraper_input, job_url)
+        elif not self._seen_job(f"zr-{job['listing_key']}"):
+            description_full, job_url_direct = self._get_descr(job_url)
 
         return JobPost(
             id=f"zr-{job['listing_key']}",
@@ -177,11 +210,19 @@ class ZipRecruiterScraper(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             description=description_full if description_full else description,
+            description_handle=description_handle,
             emails=extract_emails_from_text(description) if description else None,
             job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
 
+    def fetch_description(self, key: str) -> dict[str, Any]:
+        """
+        The JobPost fields filled in from a job's page, by its job page URL
+        """
+        description_full, job_url_direct = self._get_descr(key)
+        return {"description": description_full or None, "job_url_direct": job_url_direct}
+
     def _get_descr(self, job_url: str) -> tuple[str | None, str | None]:
         """
         Gets the full job description and direct job URL from the job page
@@ -190,25 +231,10 @@ class ZipRecruiterScraper(Scraper):
         """
         if not self.scraper_input:
             return None, None
-        res = self.session.get(job_url, allow_redirects=True)
+        res = self.session.get(job_url, allow_redirects=True, cache_kind=DETAIL)
         description_full = job_url_direct = None
         if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_descr_div = soup.find("div", class_="job_description")
-            company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = remove_attributes(job_descr_div).prettify(formatter="html") if job_descr_div else ""
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html") if company_descr_section else ""
-            )
-            description_full = job_description_clean + company_description_clean
-            script_tag = soup.find("script", type="application/json")
-            if script_tag:
-                job_json = json.loads(script_tag.string)
-                job_url_val = job_json["model"].get("saveJobURL", "")
-                m = re.search(r"job_url=(.+)", job_url_val)
-                if m:
-                    job_url_direct = m.group(1)
-
+            description_full, job_url_direct = run(parse_job_page, res.text)
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
                 description_full = markdown_converter(description_full)
 
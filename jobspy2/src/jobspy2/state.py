@@ -0,0 +1,125 @@
+"""
+jobspy2.state
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the state of incremental scrapes (scrape_jobs(since_last_run=True)): for each site, search term
+and location, the watermark its last run left, i.e. the newest date a job was posted and the ids of the jobs found so
+far. A run searches only the hours since that date and stops paging at a page of jobs it has already seen.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import math
+import os
+from pathlib import Path
+
+from pydantic import Field
+
+from .jobs import BaseModel, JobPost, JobResponse
+from .scrapers import ScraperInput, Site
+
+DEFAULT_STATE_PATH = Path.home() / ".jobspy2" / "state.json"
+# Seen ids are forgotten this long after they were first seen, so the state does not grow with every run
+SEEN_RETENTION_DAYS = 30
+
+
+class Watermark(BaseModel):
+    """Where the last run of a query left off, and when"""
+
+    last_run: datetime.datetime | None = None
+    newest_posted: datetime.date | None = None
+    # id of each job found, with the day it was first found
+    seen: dict[str, datetime.date] = Field(default_factory=dict)
+
+    def hours_old(self, now: datetime.datetime) -> int | None:
+        """
+        The hours_old that searches the jobs posted since the watermark: since the start of the day of the newest
+        job posted (sites date postings by day), or since the last run when none of its jobs had a date. None before
+        the first run.
+        """
+        if self.last_run is None:
+            return None
+        since = self.last_run
+        if self.newest_posted is not None:
+            since = min(since, datetime.datetime.combine(self.newest_posted, datetime.time.min))
+        return max(1, math.ceil((now - since).total_seconds() / 3600))
+
+    def advance(self, jobs: list[JobPost], run_started: datetime.datetime) -> None:
+        """Moves the watermark past a run's jobs, forgetting the ids first seen over SEEN_RETENTION_DAYS ago"""
+        today = run_started.date()
+        for job in jobs:
+            if job.id is not None:
+                self.seen.setdefault(job.id, today)
+        oldest = today - datetime.timedelta(days=SEEN_RETENTION_DAYS)
+        self.seen = {job_id: first_seen for job_id, first_seen in self.seen.items() if first_seen >= oldest}
+        dates = [job.date_posted for job in jobs if job.date_posted is not None]
+        if self.newest_posted is not None:
+            dates.append(self.newest_posted)
+        self.newest_posted = max(dates, default=None)
+        self.last_run = run_started
+
+
+class ScrapeState:
+    """
+    The watermarks of the incremental queries, kept in a JSON file: loaded on creation, and rewritten by save()
+    (through a temporary file swapped in, so a concurrent run never reads it half written).
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_STATE_PATH) -> None:
+        self.path = Path(path)
+        self._watermarks: dict[str, Watermark] = {}
+        if self.path.exists():
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+            self._watermarks = {key: Watermark.model_validate(value) for key, value in stored.items()}
+
+    @staticmethod
+    def key(site: Site, search_term: str | None, location: str | None) -> str:
+        """The query's key in the file, ignoring the case and surrounding spaces of its search term and location"""
+        return "|".join((site.value, (search_term or "").strip().lower(), (location or "").strip().lower()))
+
+    def watermark(self, site: Site, search_term: str | None, location: str | None) -> Watermark:
+        """The query's watermark, an empty one before its first run"""
+        return self._watermarks.setdefault(self.key(site, search_term, location), Watermark())
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        stored = {key: watermark.model_dump(mode="json") for key, watermark in sorted(self._watermarks.items())}
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(stored, indent=1), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class IncrementalRun:
+    """
+    A since_last_run scrape: the search of each site and query narrowed by its watermark, and the watermarks advanced
+    after, all saved together
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.state = ScrapeState(path if path is not None else DEFAULT_STATE_PATH)
+        self.started = datetime.datetime.now()
+
+    def _watermark(self, site: Site, scraper_input: ScraperInput) -> Watermark:
+        return self.state.watermark(site, scraper_input.search_term, scraper_input.location)
+
+    def site_input(self, site: Site, scraper_input: ScraperInput) -> ScraperInput:
+        """The site's search: within the hours since its watermark (or hours_old, if fewer), stopping at seen pages"""
+        watermark = self._watermark(site, scraper_input)
+        hours_old = watermark.hours_old(self.started)
+        if hours_old is None:
+            return scraper_input.model_copy()
+        if scraper_input.hours_old:
+            hours_old = min(hours_old, scraper_input.hours_old)
+        return scraper_input.model_copy(update={"hours_old": hours_old, "seen_job_ids": frozenset(watermark.seen)})
+
+    def advance(self, site: Site, scraper_input: ScraperInput, job_response: JobResponse) -> None:
+        """Advances the watermark of the site's search past its jobs, and drops the jobs earlier runs found"""
+        watermark = self._watermark(site, scraper_input)
+        seen = set(watermark.seen)
+        watermark.advance(job_response.jobs, self.started)
+        job_response.jobs = [job for job in job_response.jobs if job.id not in seen]
+
+    def save(self) -> None:
+        self.state.save()
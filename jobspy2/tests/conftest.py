@@ -0,0 +1,13 @@
+import pytest
+
+from jobspy2.scrapers.ratelimit import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def _unpaced_stub_sites():
+    """Offline tests hit local stub servers, so they run without the default per-site pacing."""
+    saved = dict(rate_limiter.limits)
+    rate_limiter.configure(dict.fromkeys(saved))
+    yield
+    rate_limiter.configure(dict.fromkeys(rate_limiter.limits))
+    rate_limiter.configure(saved)
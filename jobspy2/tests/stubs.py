@@ -0,0 +1,86 @@
+"""Local stub HTTP servers and canned job board pages for offline tests."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+Handler = Callable[[str, dict[str, list[str]], bytes], tuple[int, str]]
+
+
+def linkedin_card(job_id: int) -> str:
+    return f"""
+<li>
+  <div class="base-card relative base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+    <a class="base-card__full-link absolute" href="https://www.linkedin.com/jobs/view/engineer-at-acme-{job_id}?refId=abc">
+      <span class="sr-only">Software Engineer {job_id}</span>
+    </a>
+    <div class="base-search-card__info">
+      <h4 class="base-search-card__subtitle">
+        <a class="hidden-nested-link" href="https://www.linkedin.com/company/acme-{job_id % 7}?trk=public_jobs">Acme {job_id % 7}</a>
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">Austin, TX</span>
+        <span class="job-search-card__salary-info">$100,000.00 - $150,000.00</span>
+        <time class="job-search-card__listdate" datetime="2024-05-{1 + job_id % 28:02d}">1 day ago</time>
+      </div>
+    </div>
+  </div>
+</li>"""
+
+
+def linkedin_search_page(start: int, count: int) -> str:
+    return "".join(linkedin_card(job_id) for job_id in range(start, start + count))
+
+
+def linkedin_detail_page(description: str) -> str:
+    return f"""
+<div class="show-more-less-html__markup"><p>{description}</p></div>
+<ul class="description__job-criteria-list">
+  <li>
+    <h3 class="description__job-criteria-subheader">Seniority level</h3>
+    <span class="description__job-criteria-text description__job-criteria-text--criteria">Mid-Senior level</span>
+  </li>
+  <li>
+    <h3 class="description__job-criteria-subheader">Employment type</h3>
+    <span class="description__job-criteria-text description__job-criteria-text--criteria">Full-time</span>
+  </li>
+</ul>"""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    handler: Handler
+
+    def _respond(self) -> None:
+        parsed = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get("content-length") or 0))
+        status, text = self.handler(parsed.path, parse_qs(parsed.query), body)
+        payload = text.encode()
+        self.send_response(status)
+        self.send_header("content-type", "text/html; charset=utf-8")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, fmt: str, *args: object) -> None:
+        pass
+
+
+@contextmanager
+def stub_server(handler: Handler) -> Iterator[str]:
+    """Serves handler(path, query, body) -> (status, text) on localhost and yields the base url."""
+    handler_class = type("Handler", (_StubHandler,), {"handler": staticmethod(handler)})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
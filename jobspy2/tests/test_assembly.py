@@ -0,0 +1,89 @@
+from datetime import date
+
+import pandas as pd
+
+from jobspy2 import DESIRED_COLUMNS, Country, _job_to_record, _JobsFrameBuilder, _process_job_data
+from jobspy2.jobs import Compensation, CompensationInterval, JobPost, JobType, Location
+
+
+def _legacy_frame(records: list[dict], hyperlinks: bool = False) -> pd.DataFrame:
+    """The original one-frame-per-job assembly, kept as the reference for the columnar builder."""
+    jobs_df = pd.concat([pd.DataFrame([record]).dropna(axis=1, how="all") for record in records], ignore_index=True)
+    desired_order = ["job_url_hyper" if hyperlinks and c == "job_url" else c for c in DESIRED_COLUMNS]
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False]).reset_index(drop=True)
+
+
+def _jobs() -> list[tuple[str, JobPost]]:
+    return [
+        (
+            "linkedin",
+            JobPost(
+                id="li-1",
+                title="Engineer",
+                company_name="Acme",
+                job_url="https://www.linkedin.com/jobs/view/1",
+                location=Location(city="Austin", state="TX", country=Country.USA),
+                date_posted=date(2024, 5, 1),
+                compensation=Compensation(min_amount=100000, max_amount=120000),
+                job_type=[],
+            ),
+        ),
+        (
+            "indeed",
+            JobPost(
+                id="in-2",
+                title="Analyst",
+                company_name=None,
+                job_url="https://www.indeed.com/viewjob?jk=2",
+                location=None,
+                description="Pay is $40 - $50 per hour. Email jobs@example.com",
+                emails=["jobs@example.com"],
+                is_remote=True,
+                job_type=[JobType.FULL_TIME, JobType.CONTRACT],
+            ),
+        ),
+        (
+            "indeed",
+            JobPost(
+                id="in-3",
+                title="Manager",
+                company_name="Initech",
+                job_url="https://www.indeed.com/viewjob?jk=3",
+                location=Location(city="Denver", country="US"),
+                date_posted=date(2024, 5, 3),
+                compensation=Compensation(interval=CompensationInterval.HOURLY, min_amount=30, max_amount=45),
+                is_remote=False,
+            ),
+        ),
+    ]
+
+
+def _records() -> list[dict]:
+    records = []
+    for site, job in _jobs():
+        job_data = job.model_dump()
+        job_data["site"] = site
+        records.append(_process_job_data(job_data, True, Country.USA))
+    return records
+
+
+def test_records_read_from_jobs_match_dumped_jobs():
+    records = [_job_to_record(job, site, True, Country.USA) for site, job in _jobs()]
+    assert records == _records()
+
+
+def test_columnar_builder_matches_legacy_concat():
+    for hyperlinks in (False, True):
+        records = _records()
+        builder = _JobsFrameBuilder(hyperlinks=hyperlinks)
+        for record in records:
+            builder.append(record)
+        pd.testing.assert_frame_equal(builder.build(), _legacy_frame(records, hyperlinks))
+
+
+def test_columnar_builder_empty():
+    assert _JobsFrameBuilder().build().empty
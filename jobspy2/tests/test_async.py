@@ -0,0 +1,32 @@
+import asyncio
+
+import pandas as pd
+
+from jobspy2 import scrape_jobs_async
+from jobspy2.scrapers.linkedin import LinkedInScraper
+
+from .stubs import linkedin_search_page, stub_server
+
+
+def test_scrape_jobs_async_against_stub_server(monkeypatch):
+    def handler(path, query, body):
+        if path != "/jobs-guest/jobs/api/seeMoreJobPostings/search":
+            return 404, ""
+        offset = 1000 if query["keywords"] == ["data"] else 0
+        return 200, linkedin_search_page(offset + int(query["start"][0]), 10)
+
+    async def search_all():
+        return await asyncio.gather(
+            scrape_jobs_async(site_name="linkedin", search_term="engineer", results_wanted=10),
+            scrape_jobs_async(site_name="linkedin", search_term="data", results_wanted=10, max_concurrency=1),
+        )
+
+    with stub_server(handler) as base_url:
+        monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+        engineers, data = asyncio.run(search_all())
+
+    assert isinstance(engineers, pd.DataFrame) and len(engineers) == 10
+    assert set(engineers["id"]) == {f"li-{i}" for i in range(10)}
+    assert set(data["id"]) == {f"li-{i}" for i in range(1000, 1010)}
+    assert engineers.loc[0, "company"].startswith("Acme")
+    assert engineers.loc[0, "location"] == "Austin, TX"
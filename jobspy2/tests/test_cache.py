@@ -0,0 +1,67 @@
+import time
+
+from jobspy2 import ResponseCache, scrape_jobs, set_response_cache
+from jobspy2.scrapers.cache import DETAIL, SEARCH, build_response, request_key
+from jobspy2.scrapers.linkedin import LinkedInScraper
+
+from .stubs import linkedin_detail_page, linkedin_search_page, stub_server
+
+
+def _response(body: bytes):
+    return build_response(200, "https://example.com/x", {"content-type": "text/html"}, body)
+
+
+def test_request_key_covers_method_params_body_and_headers():
+    base = request_key("GET", "https://example.com/search", {"q": "python"})
+    assert base == request_key("get", "https://example.com/search", {"q": "python"})
+    assert base != request_key("GET", "https://example.com/search", {"q": "java"})
+    assert base != request_key("POST", "https://example.com/search", {"q": "python"})
+    assert request_key("POST", "u", json_body={"a": 1, "b": 2}) == request_key("POST", "u", json_body={"b": 2, "a": 1})
+    assert request_key("POST", "u", headers={"indeed-co": "US"}) != request_key(
+        "POST", "u", headers={"indeed-co": "GB"}
+    )
+
+
+def test_cache_ttl_per_kind_and_lru_eviction(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", search_ttl=0, detail_ttl=60, max_bytes=10)
+    cache.put("search", SEARCH, _response(b"abcd"))
+    cache.put("detail", DETAIL, _response(b"efgh"))
+    time.sleep(0.01)
+
+    assert cache.get("search") is None
+    hit = cache.get("detail")
+    assert hit.text == "efgh" and hit.ok and hit.headers["Content-Type"] == "text/html"
+
+    cache.put("other", DETAIL, _response(b"ijkl"))
+    assert cache.get("detail") is not None
+    cache.put("newest", DETAIL, _response(b"mnop"))
+    assert cache.get("other") is None
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2 and stats["expired"] == 1
+    assert stats["evictions"] == 1 and stats["entries"] == 2 and stats["bytes"] == 8
+
+
+def test_scrapers_serve_repeated_searches_and_details_from_cache(monkeypatch, tmp_path):
+    hits = {"search": 0, "detail": 0}
+
+    def handler(path, query, body):
+        if path.startswith("/jobs/view/"):
+            hits["detail"] += 1
+            return 200, linkedin_detail_page("Build things")
+        hits["search"] += 1
+        return 200, linkedin_search_page(int(query["start"][0]), 3)
+
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    set_response_cache(cache)
+    try:
+        with stub_server(handler) as base_url:
+            monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+            kwargs = {"site_name": "linkedin", "search_term": "engineer", "results_wanted": 3}
+            first = scrape_jobs(linkedin_fetch_description=True, **kwargs)
+            second = scrape_jobs(linkedin_fetch_description=True, **kwargs)
+    finally:
+        set_response_cache(None)
+
+    assert hits == {"search": 1, "detail": 3}
+    assert list(first["description"]) == list(second["description"]) == ["Build things"] * 3
+    assert cache.stats()["hits"] == 4
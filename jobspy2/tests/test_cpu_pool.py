@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jobspy2 import scrape_jobs, shutdown_cpu_pools
+from jobspy2.scrapers.cpu import CpuWorkersError, run, using_cpu_pool
+from jobspy2.scrapers.markdown import html_to_markdown
+from jobspy2.scrapers.replay import load_fixture, replaying
+from jobspy2.scrapers.ziprecruiter import parse_job_page
+
+FIXTURES = Path(__file__).parent / "fixtures"
+HTML = "<div class='job_description'><p>About the <b>role</b></p><ul><li>Python</li></ul></div>"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stop_workers():
+    yield
+    shutdown_cpu_pools()
+
+
+def test_run_matches_inline_calls_with_and_without_a_pool():
+    inline = (run(html_to_markdown, HTML), run(parse_job_page, HTML))
+    with using_cpu_pool(1):
+        assert (run(html_to_markdown, HTML), run(parse_job_page, HTML)) == inline
+    assert inline == (html_to_markdown(HTML), parse_job_page(HTML))
+
+
+def test_cpu_workers_must_be_positive():
+    with pytest.raises(CpuWorkersError):
+        scrape_jobs(site_name="linkedin", search_term="python", cpu_workers=0)
+
+
+@pytest.mark.parametrize("site", ["linkedin", "zip_recruiter", "google"])
+def test_fixture_scrapes_match_with_cpu_workers(site):
+    fixture = load_fixture(FIXTURES / f"{site}.json.gz")
+    frames = []
+    for cpu_workers in (None, 1):
+        with replaying(fixture):
+            frames.append(scrape_jobs(**fixture["meta"], cpu_workers=cpu_workers))
+    pd.testing.assert_frame_equal(*frames)
@@ -0,0 +1,133 @@
+import math
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jobspy2 import deduplicate_jobs, scrape_jobs
+from jobspy2.dedup import DeduplicationError, duplicate_clusters, merge_cluster
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+DESCRIPTION = (
+    "We are hiring a backend engineer to build the services behind our payments platform. You will design APIs, "
+    "own data pipelines in Python and Go, review code, mentor other engineers and work with product on the roadmap. "
+    "Five years of experience with distributed systems and cloud infrastructure is expected."
+)
+OTHER_DESCRIPTION = (
+    "Join the clinical team of a regional hospital as a registered nurse on the night shift. Responsibilities "
+    "include patient assessment, medication administration, charting and coordinating care with physicians and "
+    "families. A current state license and two years of acute care experience are required."
+)
+
+
+def job(job_id, site, title, company, location, description=None, **fields):
+    return {
+        "id": job_id,
+        "site": site,
+        "job_url": f"https://{site}.example.com/{job_id}",
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": description,
+        **fields,
+    }
+
+
+def test_listings_with_the_same_fingerprint_are_merged():
+    records = [
+        job("li-1", "linkedin", "Backend Engineer", "Acme", "Austin, TX"),
+        job("in-1", "indeed", "Backend  engineer", "Acme, Inc.", "Austin, TX, US", DESCRIPTION, job_type="fulltime"),
+        job("gd-1", "glassdoor", "Backend Engineer", "Acme", "Denver, CO"),
+    ]
+    assert duplicate_clusters(records) == [[0, 1], [2]]
+
+
+def test_listings_with_similar_descriptions_are_merged():
+    reworded = DESCRIPTION.replace("Five years", "5+ years")
+    records = [
+        job("li-1", "linkedin", "Backend Engineer", "Acme", "Austin, TX", DESCRIPTION),
+        job("zr-1", "zip_recruiter", "Sr. Backend Engineer (Remote)", "Acme", None, reworded),
+        job("gd-1", "glassdoor", "Senior Backend Engineer", "Initech", "Austin, TX", DESCRIPTION),
+        job("go-1", "google", "Registered Nurse", "Acme", "Austin, TX", OTHER_DESCRIPTION),
+        job("in-1", "indeed", "Backend Engineer - Payments", None, "Austin, TX", DESCRIPTION[:120]),
+    ]
+    # Another company's listing of the same text, an unrelated description and a description too short to compare
+    # are kept apart
+    assert duplicate_clusters(records) == [[0, 1], [2], [3], [4]]
+    assert duplicate_clusters(records, threshold=1.0) == [[0], [1], [2], [3], [4]]
+    with pytest.raises(DeduplicationError):
+        duplicate_clusters(records, threshold=0)
+
+
+def test_merged_record_fills_its_missing_fields_from_the_others():
+    records = [
+        job("li-1", "linkedin", "Backend Engineer", "Acme", "Austin, TX", interval="yearly", min_amount=1.0),
+        job("in-1", "indeed", "Backend Engineer", "Acme", "Austin, TX", DESCRIPTION, job_type="fulltime"),
+        job(
+            "gd-1",
+            "glassdoor",
+            "Backend Engineer",
+            "Acme",
+            "Austin, TX",
+            company_url="https://acme.example.com",
+            interval="hourly",
+            min_amount=50.0,
+            max_amount=60.0,
+            currency="USD",
+        ),
+    ]
+    merged = merge_cluster(records, [0, 1, 2])
+    assert merged["id"] == "gd-1"
+    assert merged["description"] == DESCRIPTION
+    assert merged["job_type"] == "fulltime"
+    assert (merged["interval"], merged["min_amount"], merged["max_amount"]) == ("hourly", 50.0, 60.0)
+    assert merged["duplicate_ids"] == "li-1, in-1"
+
+
+def test_deduplicate_jobs_frame():
+    frame = pd.DataFrame([
+        job("li-1", "linkedin", "Backend Engineer", "Acme", "Austin, TX", DESCRIPTION, min_amount=math.nan),
+        job("in-1", "indeed", "Backend Engineer", "Acme", "Austin, TX", min_amount=90000.0),
+        job("in-2", "indeed", "Registered Nurse", "Acme", "Austin, TX", OTHER_DESCRIPTION, min_amount=math.nan),
+    ])
+    deduplicated = deduplicate_jobs(frame)
+    assert list(deduplicated.columns) == [*frame.columns, "duplicate_ids"]
+    assert deduplicated["id"].tolist() == ["li-1", "in-2"]
+    assert deduplicated["min_amount"].tolist()[0] == 90000.0
+    # Deduplicating again with more listings keeps the ids merged before
+    again = pd.concat([deduplicated, frame.iloc[[1]].assign(id="zr-1")], ignore_index=True)
+    assert deduplicate_jobs(again)["duplicate_ids"].tolist()[0] == "in-1, zr-1"
+
+
+def test_same_site_listings_and_jobs_without_a_location_are_kept_apart():
+    records = [
+        job("in-1", "indeed", "Backend Engineer", "Acme", "Austin, TX", DESCRIPTION),
+        job("in-2", "indeed", "Backend Engineer", "Acme", "Austin, TX", DESCRIPTION),
+        job("li-1", "linkedin", "Backend Engineer", "Acme", "Austin, TX"),
+        job("gd-1", "glassdoor", "Data Engineer", "Acme", None),
+        job("zr-1", "zip_recruiter", "Data Engineer", "Acme", None),
+        job("in-1", "indeed", "Backend Engineer", "Acme", "Austin, TX"),
+    ]
+    # Two openings on one site stay apart, each listing of another site joins one of them, and a site's listing
+    # found again (same id) joins its first listing
+    assert duplicate_clusters(records) == [[0, 2, 5], [1], [3], [4]]
+    assert merge_cluster(records, [0, 2, 5])["duplicate_ids"] == "li-1"
+
+
+def test_scrape_jobs_deduplicates_across_sites():
+    indeed, glassdoor = (load_fixture(FIXTURES / f"{site}.json.gz") for site in ("indeed", "glassdoor"))
+    fixture = {**indeed, "exchanges": indeed["exchanges"] + glassdoor["exchanges"]}
+    meta = {**indeed["meta"], "site_name": ["indeed", "glassdoor"], "results_wanted": 60}
+    with replaying(fixture):
+        jobs = scrape_jobs(**meta)
+    with replaying(fixture):
+        deduplicated = scrape_jobs(**meta, deduplicate=True)
+    assert len(deduplicated) < len(jobs)
+    merged_ids = deduplicated["duplicate_ids"].dropna().str.split(", ").explode()
+    assert sorted([*deduplicated["id"], *merged_ids]) == sorted(jobs["id"])
+    assert list(deduplicated.columns) == [*jobs.columns[:1], "duplicate_ids", *jobs.columns[1:]]
+    # Every merged listing comes from the other site
+    for job_id, duplicate_ids in deduplicated[["id", "duplicate_ids"]].dropna().itertuples(index=False):
+        assert all(duplicate[:3] != job_id[:3] for duplicate in duplicate_ids.split(", "))
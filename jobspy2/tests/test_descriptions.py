@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jobspy2 import DescriptionHandleError, resolve_descriptions, scrape_jobs
+from jobspy2.jobs import Country, DescriptionFormat
+from jobspy2.scrapers import Site
+from jobspy2.scrapers.descriptions import DescriptionHandle
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def by_id(jobs):
+    return jobs.sort_values("id").reset_index(drop=True)
+
+
+def test_handles_round_trip():
+    handle = DescriptionHandle(
+        Site.ZIP_RECRUITER, Country.CANADA, DescriptionFormat.HTML, "https://www.ziprecruiter.com/jobs//j?lvk=a:b"
+    )
+    assert handle.encode() == "zip_recruiter:canada:html:https://www.ziprecruiter.com/jobs//j?lvk=a:b"
+    assert DescriptionHandle.decode(handle.encode()) == handle
+    for invalid in ("linkedin:usa:markdown", "monster:usa:markdown:1", "linkedin:atlantis:markdown:1"):
+        with pytest.raises(DescriptionHandleError):
+            DescriptionHandle.decode(invalid)
+
+
+@pytest.mark.parametrize("site", ["linkedin", "zip_recruiter", "glassdoor"])
+def test_resolved_descriptions_match_a_full_scrape(site):
+    fixture = load_fixture(FIXTURES / f"{site}.json.gz")
+    with replaying(fixture):
+        full = scrape_jobs(**fixture["meta"])
+    with replaying(fixture) as replay:
+        deferred = scrape_jobs(**fixture["meta"], defer_descriptions=True)
+        search_requests = replay.served
+        resolved = resolve_descriptions(deferred, concurrency=4)
+    assert search_requests < len(deferred) == deferred["description_handle"].notna().sum()
+    if site != "zip_recruiter":  # whose search results carry a short description
+        assert deferred["description"].isna().all()
+    assert resolved["description_handle"].isna().all()
+    pd.testing.assert_frame_equal(by_id(resolved.drop(columns="description_handle")), by_id(full))
+
+
+def test_only_the_remaining_jobs_are_fetched():
+    fixture = load_fixture(FIXTURES / "linkedin.json.gz")
+    with replaying(fixture) as replay:
+        deferred = scrape_jobs(**fixture["meta"], defer_descriptions=True)
+        wanted = deferred[deferred["title"].str.contains("Python")]
+        searched = replay.served
+        resolved = resolve_descriptions(pd.concat([wanted, wanted]))
+        assert replay.served - searched == len(wanted) > 0
+    assert resolved["description"].str.contains("About the role").all()
@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers.linkedin import LinkedInScraper
+
+from .stubs import linkedin_detail_page, linkedin_search_page, stub_server
+
+
+class DetailPages:
+    """Stub LinkedIn whose job pages take a while, counting how many are being served at once"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = self.most_in_flight = 0
+        self.details = []
+
+    def __call__(self, path, query, body):
+        if path == "/jobs-guest/jobs/api/seeMoreJobPostings/search":
+            return 200, linkedin_search_page(int(query["start"][0]), 10)
+        job_id = path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+            self.details.append(job_id)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return 200, linkedin_detail_page(f"Job {job_id} description")
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_detail_pages_are_fetched_concurrently_in_order(monkeypatch, concurrency):
+    site = DetailPages()
+    with stub_server(site) as base_url:
+        monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+        jobs = scrape_jobs(
+            site_name="linkedin",
+            search_term="engineer",
+            results_wanted=15,
+            linkedin_fetch_description=True,
+            linkedin_detail_concurrency=concurrency,
+            description_format="html",
+        )
+    assert site.most_in_flight == concurrency
+    # Only the wanted jobs' pages are fetched, and each job keeps its own description
+    assert sorted(site.details, key=int) == [str(job_id) for job_id in range(15)]
+    assert (jobs["description"].str.extract(r"Job (\d+)")[0] == jobs["id"].str.removeprefix("li-")).all()
+
+
+def test_threads_fetching_job_pages_do_not_share_a_session(monkeypatch):
+    used = []
+    thread_session = LinkedInScraper._thread_session
+
+    def recording_thread_session(self):
+        session = thread_session(self)
+        used.append((threading.get_ident(), id(session)))
+        return session
+
+    monkeypatch.setattr(LinkedInScraper, "_thread_session", recording_thread_session)
+    with stub_server(DetailPages()) as base_url:
+        monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+        scrape_jobs(
+            site_name="linkedin",
+            search_term="engineer",
+            results_wanted=15,
+            linkedin_fetch_description=True,
+            linkedin_detail_concurrency=4,
+        )
+    sessions_by_thread = {}
+    for thread, session in used:
+        sessions_by_thread.setdefault(thread, set()).add(session)
+    sessions = [session for thread_sessions in sessions_by_thread.values() for session in thread_sessions]
+    assert len(sessions_by_thread) > 1
+    assert len(sessions) == len(set(sessions)) == len(sessions_by_thread)
@@ -0,0 +1,68 @@
+import itertools
+
+import jobspy2
+from jobspy2 import iter_jobs, scrape_jobs
+from jobspy2.jobs import JobPost, JobResponse, Location
+from jobspy2.scrapers import Scraper, ScraperInput, Site
+
+
+def _make_scraper(site: Site, pages: int = 3, per_page: int = 4):
+    class PagedScraper(Scraper):
+        pages_scraped = 0
+
+        def __init__(self, logger, proxies=None, ca_cert=None):
+            super().__init__(site, logger=logger, proxies=proxies, ca_cert=ca_cert)
+
+        def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+            job_list: list[JobPost] = []
+            stop = scraper_input.offset + scraper_input.results_wanted
+            for page in range(pages):
+                job_list += [
+                    JobPost(
+                        id=f"{site.value}-{page}-{i}",
+                        title="Engineer",
+                        company_name="Acme",
+                        job_url=f"https://example.com/{site.value}/{page}/{i}",
+                        location=Location(city="Austin", state="TX"),
+                    )
+                    for i in range(per_page)
+                ]
+                type(self).pages_scraped += 1
+                self._publish(job_list, scraper_input.offset, stop)
+                if len(job_list) >= stop:
+                    break
+            return JobResponse(jobs=job_list[scraper_input.offset : stop])
+
+    return PagedScraper
+
+
+def test_iter_jobs_yields_same_jobs_as_scrape_jobs(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, _make_scraper(Site.INDEED))
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.GOOGLE, _make_scraper(Site.GOOGLE))
+    kwargs = {"site_name": ["indeed", "google"], "search_term": "engineer", "results_wanted": 6, "offset": 3}
+
+    streamed = list(iter_jobs(**kwargs))
+    batch = scrape_jobs(**kwargs)
+
+    assert sorted(job["id"] for job in streamed) == sorted(batch["id"])
+    assert [job["id"] for job in streamed if job["site"] == "indeed"] == [
+        "indeed-0-3",
+        "indeed-1-0",
+        "indeed-1-1",
+        "indeed-1-2",
+        "indeed-1-3",
+        "indeed-2-0",
+    ]
+    assert streamed[0]["location"] == "Austin, TX"
+
+
+def test_iter_jobs_stops_scrapers_when_consumer_closes(monkeypatch):
+    scraper_class = _make_scraper(Site.INDEED, pages=50)
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, scraper_class)
+
+    jobs = iter_jobs(site_name="indeed", results_wanted=1000, max_queue_size=2)
+    first = list(itertools.islice(jobs, 3))
+    jobs.close()
+
+    assert len(first) == 3
+    assert scraper_class.pages_scraped < 50
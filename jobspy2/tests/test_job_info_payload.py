@@ -0,0 +1,62 @@
+import json
+import logging
+import re
+
+import pytest
+
+from jobspy2.scrapers.google import GoogleJobsScraper
+from jobspy2.scrapers.google.payload import first_job_info, initial_page_job_infos
+
+JOB = ["Engineer", "Initech", "Austin, TX", [["https://example.com/job/1", "example.com"]]]
+INITIAL_PAGE = 'AF_initDataCallback({{key: "ds:0", data:[[[{{"520084652":{0}}}]]]}});'
+
+
+def find_job_info(data):
+    """The recursive search the scraper ran over every decoded results page entry"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "520084652" and isinstance(value, list):
+                return value
+            if result := find_job_info(value):
+                return result
+    elif isinstance(data, list):
+        for item in data:
+            if result := find_job_info(item):
+                return result
+    return None
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        [[[{"520084652": JOB}]]],
+        [[[{"other": {"520084652": JOB}}, {"520084652": ["later"]}]]],
+        [[[{"520084652": []}, {"520084652": {"520084652": JOB}}]]],  # empty and non-list values are skipped
+        [[[{"520084652 ": "x", "text": '{"520084652": ["quoted"]}'}, {"520084652": JOB}]]],
+        [[[{"text": "no jobs here"}]]],
+    ],
+)
+def test_first_job_info_matches_decoding_the_whole_entry(entry):
+    for payload in (json.dumps(entry), json.dumps(entry, indent=1)):
+        assert first_job_info(payload) == find_job_info(json.loads(payload))
+
+
+def test_initial_page_job_infos():
+    page = INITIAL_PAGE.format(json.dumps([JOB])) + INITIAL_PAGE.format(json.dumps([["Second"]]))
+    assert initial_page_job_infos(page) == [[JOB], [["Second"]]]
+    assert initial_page_job_infos("<html>no jobs</html>") == []
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        '[["cut ]]}]]] short"]]',  # the old pattern stops at the first closing brackets
+        '[["spans",\n"lines"]]',
+        '["no nested array"]',
+    ],
+)
+def test_initial_page_falls_back_where_the_pattern_would_differ(array):
+    page = INITIAL_PAGE.format(array)
+    assert initial_page_job_infos(page) is None
+    matches = re.findall(r'520084652":(\[.*?\]\s*])\s*}\s*]\s*]\s*]', page)
+    assert len(GoogleJobsScraper._find_job_info_initial_page(page, logging.getLogger("test"))) == len(matches)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from jobspy2.jobs import JobType
+from jobspy2.scrapers.keywords import REMOTE_KEYWORDS, KeywordMatcher, classify_description, classify_descriptions
+from jobspy2.scrapers.utils import extract_job_type
+
+KEYWORDS = [keyword for job_type in JobType for keyword in job_type.value] + list(REMOTE_KEYWORDS)
+
+
+def substring_job_types(description):
+    return [
+        job_type for job_type in JobType if any(keyword.lower() in description.lower() for keyword in job_type.value)
+    ]
+
+
+def substring_is_remote(description):
+    return any(keyword in description.lower() for keyword in REMOTE_KEYWORDS)
+
+
+@pytest.mark.parametrize(
+    ("description", "job_types", "is_remote"),
+    [
+        ("Fulltime CONTRACTOR role, WFH on Fridays", [JobType.FULL_TIME, JobType.CONTRACT], True),
+        ("Stelle in Teilzeit", [JobType.PART_TIME], False),
+        ("Tiempocompletother", [JobType.FULL_TIME, JobType.OTHER], False),  # keywords sharing a letter
+        ("internshiparttime", [JobType.PART_TIME, JobType.INTERNSHIP], False),
+        ("summeremote", [JobType.SUMMER], True),
+        ("praktikum", [JobType.INTERNSHIP], False),
+        ("nothing to see here", [], False),
+        ("", [], False),
+        (None, [], False),
+    ],
+)
+def test_classify_description(description, job_types, is_remote):
+    assert classify_description(description) == (job_types, is_remote)
+    assert extract_job_type(description) == job_types
+
+
+def test_matches_substring_checks_on_random_text():
+    rng = random.Random(7)  # noqa: S311
+    alphabet = "".join(sorted(set("".join(KEYWORDS)))) + " \nABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    descriptions = []
+    for _ in range(3000):
+        parts = [
+            rng.choice(KEYWORDS) if rng.random() < 0.3 else rng.choice(alphabet) for _ in range(rng.randint(0, 12))
+        ]
+        # Fuse neighbouring keywords by dropping the letters where they meet
+        descriptions.append("".join(part[rng.randint(0, 2) :] if rng.random() < 0.3 else part for part in parts))
+    expected = [(substring_job_types(description), substring_is_remote(description)) for description in descriptions]
+    assert [classify_description(description) for description in descriptions] == expected
+    assert classify_descriptions(descriptions) == expected
+
+
+def test_classify_descriptions_keeps_descriptions_apart():
+    assert classify_descriptions(["contr", "act remote", None, "wfh"]) == [
+        ([], False),
+        ([], True),
+        ([], False),
+        ([], True),
+    ]
+
+
+def test_classify_descriptions_that_lengthen_when_lowercased():
+    descriptions = ["İİİİİİİİİİ abc", "x", "internship remote"]
+    assert classify_descriptions(descriptions) == [([], False), ([], False), ([JobType.INTERNSHIP], True)]
+
+
+def test_matcher_finds_keywords_inside_other_keywords():
+    matcher = KeywordMatcher({"long": ("abcd",), "inner": ("bc", "BCD"), "overlap": ("cde",)})
+    assert matcher.find("xABCDE") == ["long", "inner", "overlap"]
+    assert matcher.find_many(["abc", "bcde", "cd"]) == [["inner"], ["inner", "overlap"], []]
@@ -0,0 +1,75 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers.glassdoor import lookups
+from jobspy2.scrapers.glassdoor.lookups import LocationCache, TokenCache
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+FIXTURE = Path(__file__).parent / "fixtures" / "glassdoor.json.gz"
+
+
+@pytest.fixture(autouse=True)
+def _empty_lookups(monkeypatch):
+    monkeypatch.setattr(lookups, "token_cache", TokenCache())
+    monkeypatch.setattr(lookups, "location_cache", LocationCache())
+
+
+def requested_urls(fixture):
+    with replaying(fixture) as replay:
+        urls = []
+        send = replay.send
+
+        def recording_send(method, url, kwargs, live):
+            urls.append(url)
+            return send(method, url, kwargs, live)
+
+        replay.send = recording_send
+        jobs = scrape_jobs(**fixture["meta"])
+    return urls, jobs
+
+
+def test_later_searches_start_with_their_listings():
+    fixture = load_fixture(FIXTURE)
+    first_urls, first = requested_urls(fixture)
+    later_urls, later = requested_urls(fixture)
+    assert len(later_urls) == len(first_urls) - 2
+    assert later_urls[0].endswith("/graph")
+    assert sorted(later["id"]) == sorted(first["id"])
+
+
+def test_concurrent_scrapes_fetch_one_token():
+    cache = TokenCache()
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.05)
+        return "token"
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(cache.get("gd.example", fetch))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tokens == ["token"] * 8 and len(fetches) == 1
+    cache.invalidate("gd.example")
+    assert cache.get("gd.example", lambda: None) is None
+    assert cache.get("gd.example", lambda: "new") == "new"
+
+
+def test_tokens_expire():
+    cache = TokenCache(ttl=0)
+    assert cache.get("gd.example", lambda: "first") == "first"
+    assert cache.get("gd.example", lambda: "second") == "second"
+
+
+def test_locations_persist_across_caches(tmp_path):
+    path = tmp_path / "locations.json"
+    LocationCache(path).put("https://www.glassdoor.com/", " Austin, TX ", (1147401, "C"))
+    assert LocationCache(path).get("https://www.glassdoor.com/", "austin, tx") == (1147401, "C")
+    assert LocationCache(path).get("https://www.glassdoor.co.uk/", "austin, tx") is None
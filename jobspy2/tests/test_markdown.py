@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+from markdownify import markdownify as md
+
+from jobspy2 import MarkdownCache, scrape_jobs, set_markdown_cache
+from jobspy2.scrapers import markdown
+from jobspy2.scrapers.markdown import content_key, convert_descriptions, get_markdown_cache, html_to_markdown
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+EDGE_CASES = [
+    "<p>Caf&eacute; &amp; <b> bold </b><br>next_line * <i></i><a href='https://x.com'>https://x.com</a></p>",
+    "<ul><li>one<ul><li>nested<ol start='3'><li>three</li><li><p>four</p></li></ol></li></ul></li><li></li></ul>tail",
+    "<h1> Title <em>x</em></h1><h2><p>inline</p><br>heading</h2><h4>a\n  b</h4><hr><blockquote>q\n<p>r</p></blockquote>",
+    "<div>\n <!-- note --> <span> text </span>\n</div> <section><b>unclosed <i>tags</p>  &#x41;&#169;&bogus;</section>",
+    "<li>loose item</li><ol><li>a</li>text<li>b</li></ol><img src='i.png' alt='logo' title='t\"q'><q>quote</q>",
+    "<p>table <table><tr><td>falls</td><td>back</td></tr></table> and <code>code_span</code></p>",
+    "",
+]
+
+
+@pytest.fixture
+def markdown_cache():
+    previous = get_markdown_cache()
+    cache = MarkdownCache(max_entries=2)
+    set_markdown_cache(cache)
+    yield cache
+    set_markdown_cache(previous)
+
+
+@pytest.mark.parametrize("html", EDGE_CASES)
+def test_converter_matches_markdownify(html):
+    assert html_to_markdown(html) == md(html)
+
+
+def test_converter_matches_markdownify_on_recorded_descriptions():
+    descriptions = []
+    for path in sorted(FIXTURES.glob("*.json.gz")):
+        fixture = load_fixture(path)
+        with replaying(fixture):
+            jobs = scrape_jobs(**{**fixture["meta"], "description_format": "html"})
+        descriptions += [description for description in jobs["description"] if isinstance(description, str)]
+    assert len(descriptions) > 100
+    for description in descriptions:
+        assert html_to_markdown(description) == md(description)
+
+
+def test_cache_is_lru_and_persists(tmp_path, markdown_cache):
+    assert convert_descriptions(["<p>a</p>", None, "<b>b</b>", "<p>a</p>", "<br>"]) == ["a", None, "**b**", "a", ""]
+    assert markdown_cache.stats() == {"hits": 0, "misses": 4, "stores": 3, "entries": 2}
+    assert markdown_cache.get(content_key("<p>a</p>")) is None  # evicted by the two later descriptions
+    assert markdown_cache.get(content_key("<br>")) == "  "
+
+    persistent = MarkdownCache(path=tmp_path / "markdown.sqlite")
+    persistent.put(content_key("<em>c</em>"), "*c*")
+    persistent.close()
+    reopened = MarkdownCache(path=tmp_path / "markdown.sqlite")
+    assert reopened.get(content_key("<em>c</em>")) == "*c*"
+    assert reopened.stats()["hits"] == 1
+
+
+def test_descriptions_convert_in_worker_processes(markdown_cache):
+    htmls = [f"<p>job {n}</p><ul><li>item</li></ul>" for n in range(4)] + [None]
+    assert convert_descriptions(htmls, workers=2) == [f"job {n}\n\n* item" for n in range(4)] + [None]
+    assert markdown_cache.stats()["stores"] == 4
+
+
+def test_other_markdownify_versions_convert_everything_themselves(monkeypatch):
+    monkeypatch.setattr(markdown, "FAST_CONVERSION", False)
+    monkeypatch.setattr(markdown, "md", lambda html: f"markdownify({html})")
+    assert html_to_markdown("<p>text</p>") == "markdownify(<p>text</p>)"
@@ -0,0 +1,47 @@
+import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jobspy2 import scrape_jobs, write_parquet
+from jobspy2.output import OutputFormatError, to_arrow
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+pa = pytest.importorskip("pyarrow", exc_type=ImportError)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="module")
+def indeed_fixture():
+    return load_fixture(FIXTURES / "indeed.json.gz")
+
+
+def test_arrow_output_is_typed_and_matches_the_frame(indeed_fixture):
+    with replaying(indeed_fixture):
+        jobs_df = scrape_jobs(**indeed_fixture["meta"])
+    with replaying(indeed_fixture):
+        table = scrape_jobs(**indeed_fixture["meta"], output_format="arrow")
+
+    assert table.equals(to_arrow(jobs_df))
+    assert table.schema.field("date_posted").type == pa.date32()
+    assert table.schema.field("min_amount").type == pa.float64()
+    assert pa.types.is_dictionary(table.schema.field("company").type)
+    assert table.column("title").to_pylist() == jobs_df["title"].tolist()
+
+
+def test_partitioned_parquet_by_site_and_date(indeed_fixture, tmp_path):
+    with replaying(indeed_fixture):
+        jobs_df = scrape_jobs(**indeed_fixture["meta"])
+    write_parquet(jobs_df, tmp_path / "jobs", partition_by=["site", "date"], scrape_date=datetime.date(2024, 5, 1))
+
+    partition = tmp_path / "jobs" / "site=indeed" / "date=2024-05-01"
+    assert len(list(partition.glob("*.parquet"))) == 1
+    written = pd.read_parquet(partition)
+    assert written["job_url"].tolist() == jobs_df["job_url"].tolist()
+
+
+def test_unknown_output_format():
+    with pytest.raises(OutputFormatError):
+        scrape_jobs(site_name="indeed", output_format="csv")
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers import ParserBackend
+from jobspy2.scrapers.linkedin.parsers import PARSERS
+from jobspy2.scrapers.replay import load_fixture, replaying
+
+from .stubs import linkedin_detail_page, linkedin_search_page
+
+FIXTURES = Path(__file__).parent / "fixtures"
+soup_parser, lxml_parser = PARSERS[ParserBackend.BS4], PARSERS[ParserBackend.LXML]
+
+
+def test_backends_extract_the_same_cards_and_details():
+    search_page = linkedin_search_page(0, 10)
+    assert len(lxml_parser.job_cards(search_page)) == 10
+    assert lxml_parser.job_cards(search_page) == soup_parser.job_cards(search_page)
+
+    detail_page = linkedin_detail_page("<p>Caf&eacute; &amp; <br> tea<ul><li>one<li>two</ul><div>nested</div></p>")
+    assert lxml_parser.job_details(detail_page) == soup_parser.job_details(detail_page)
+    assert lxml_parser.job_details("") == soup_parser.job_details("")
+    assert lxml_parser.job_cards("") == soup_parser.job_cards("") == []
+
+
+def test_lxml_backend_scrapes_identical_jobs():
+    fixture = load_fixture(FIXTURES / "linkedin.json.gz")
+    frames = []
+    for backend in ("bs4", "lxml"):
+        with replaying(fixture):
+            frames.append(scrape_jobs(**fixture["meta"], linkedin_parser=backend))
+    pd.testing.assert_frame_equal(*frames)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        scrape_jobs(site_name="linkedin", linkedin_parser="html5lib")
@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers.cache import build_response
+from jobspy2.scrapers.indeed import IndeedPageSizeError
+from jobspy2.scrapers.replay import Replay, load_fixture, replaying, using_transport
+
+FIXTURE = Path(__file__).parent / "fixtures" / "indeed.json.gz"
+LISTING_FIELDS = ("key", "title", "datePublished", "location", "compensation", "attributes", "employer", "recruit")
+
+
+class ListingSite:
+    """Replays the fixture, answering with only the job fields the listing projection asks for"""
+
+    def __init__(self):
+        self.replay = Replay(load_fixture(FIXTURE))
+        self.queries = []
+
+    def send(self, method, url, kwargs, live):
+        self.queries.append(kwargs["json"]["query"])
+        response = self.replay.send(method, url, kwargs, live)
+        data = response.json()
+        for result in data["data"]["jobSearch"]["results"]:
+            job = {field: result["job"][field] for field in LISTING_FIELDS}
+            job["employer"] = {
+                "relativeCompanyPageUrl": job["employer"]["relativeCompanyPageUrl"],
+                "name": job["employer"]["name"],
+            }
+            result["job"] = job
+        return build_response(response.status_code, response.url, response.headers, json.dumps(data).encode())
+
+
+def test_listing_projection_asks_for_and_parses_listings():
+    fixture = load_fixture(FIXTURE)
+    with replaying(fixture):
+        full = scrape_jobs(**fixture["meta"])
+    with using_transport(ListingSite()) as site:
+        listings = scrape_jobs(**fixture["meta"], indeed_projection="listing", indeed_page_size=50)
+    assert all("limit: 50" in query and "dossier" not in query and "description" not in query for query in site.queries)
+    assert listings["description"].isna().all() and listings["company_revenue"].isna().all()
+    columns = ["id", "title", "company", "location", "date_posted", "job_type", "job_url_direct"]
+    assert listings[columns].equals(full[columns])
+
+
+def test_page_size_is_bounded():
+    with pytest.raises(IndeedPageSizeError):
+        scrape_jobs(site_name="indeed", indeed_page_size=101)
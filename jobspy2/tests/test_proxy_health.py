@@ -0,0 +1,87 @@
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from jobspy2.scrapers.proxy_health import ProxyPool
+from jobspy2.scrapers.utils import create_session
+
+from .stubs import stub_server
+
+
+def test_selection_favours_fast_healthy_proxies():
+    pool = ProxyPool(["fast:1", "slow:1", "flaky:1"], failure_threshold=100, rng=random.Random(0))  # noqa: S311
+    fast, slow, flaky = pool.entries
+    for _ in range(5):
+        pool.record(fast, 0.1, 200)
+        pool.record(slow, 2.0, 200)
+        pool.record(flaky, 0.1, 503)
+    picks = Counter(pool.choose().proxy for _ in range(2000))
+    assert picks["fast:1"] > 10 * picks["slow:1"] > 0
+    assert picks["fast:1"] > 3 * picks["flaky:1"]
+
+
+def test_quarantine_cooldown_doubles_and_429_honours_retry_after():
+    now = [0.0]
+    pool = ProxyPool(["a:1", "b:1"], failure_threshold=2, cooldown=10, clock=lambda: now[0])
+    a, b = pool.entries
+    pool.record(a, 0.1)
+    pool.record(a, 0.1, 502)
+    assert all(pool.choose() is b for _ in range(20))
+
+    now[0] = 10
+    pool.record(a, 0.1, 403)
+    pool.record(a, 0.1, 403)
+    assert a.quarantined_until == 30
+
+    pool.record(b, 0.1, 429, retry_after="120")
+    snapshot = {entry["proxy"]: entry for entry in pool.snapshot()}
+    assert snapshot["b:1"]["throttled"] == 1 and snapshot["b:1"]["quarantine_remaining"] == 120
+    assert pool.choose() is a  # every proxy is quarantined: the one free soonest is tried
+
+    now[0] = 31
+    pool.record(a, 0.1, 200)
+    assert pool.choose() is a and a.quarantines == 0
+
+
+def test_dead_proxy_is_quarantined_and_localhost_means_direct():
+    with stub_server(lambda path, query, body: (200, "ok")) as base_url:
+        pool = ProxyPool(["127.0.0.1:9", "localhost"], failure_threshold=1)
+        session = create_session(proxies=["127.0.0.1:9", "localhost"], is_tls=False, proxy_pool=pool)
+        results = []
+        for _ in range(12):
+            try:
+                results.append(session.get(base_url, timeout=5).text)
+            except requests.RequestException:
+                results.append(None)
+    dead, direct = pool.snapshot()
+    assert direct["proxy"] == "localhost" and direct["failures"] == 0
+    assert dead["failures"] <= 1 and (dead["quarantined"] or dead["requests"] == 0)
+    assert results.count("ok") == direct["requests"] >= 11
+
+
+def test_unknown_status_codes_are_not_failures():
+    pool = ProxyPool(["a:1"])
+    pool.record(pool.entries[0], 0.2, 404)
+    assert pool.snapshot()[0]["failures"] == 0
+    assert pool.snapshot()[0]["latency"] == pytest.approx(0.2)
+
+
+def test_threads_sharing_a_session_are_recorded_against_their_own_proxy(monkeypatch):
+    def request(self, method, url, proxies=None, **kwargs):
+        time.sleep(0.01)
+        response = requests.Response()
+        response.status_code = 200 if proxies["http"].endswith("good:1") else 503
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    pool = ProxyPool(["good:1", "bad:1"], failure_threshold=1000)
+    session = create_session(proxies=["good:1", "bad:1"], is_tls=False, proxy_pool=pool)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: session.get("http://example.com"), range(40)))
+    good, bad = pool.snapshot()
+    assert good["failures"] == 0 and bad["failures"] == bad["requests"] > 0
+    assert not session.proxies
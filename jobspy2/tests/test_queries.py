@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+from jobspy2 import QueryListError, SiteConcurrencyError, iter_jobs, scrape_jobs, scrape_jobs_async
+from jobspy2.scrapers.replay import Replay, load_fixture, replaying, using_transport
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class InFlight:
+    """Replays a fixture, answering each request in 20 ms, and counts the most requests answered at once"""
+
+    def __init__(self, fixture):
+        self.replay = Replay(fixture)
+        self.lock = threading.Lock()
+        self.in_flight = self.most = 0
+
+    def send(self, method, url, kwargs, live):
+        with self.lock:
+            self.in_flight += 1
+            self.most = max(self.most, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return self.replay.send(method, url, kwargs, live)
+
+
+def test_jobs_are_tagged_with_the_queries_that_found_them():
+    fixture = load_fixture(FIXTURES / "google.json.gz")
+    meta = {**fixture["meta"], "search_term": ["software engineer", "python developer"]}
+    with replaying(fixture):
+        jobs = scrape_jobs(**meta)
+    with replaying(fixture):
+        single = scrape_jobs(**fixture["meta"])
+    assert list(jobs.columns[:4]) == ["id", "site", "search_term", "search_location"]
+    # The replayed pages of both searches are the same, so every job is found by both and returned once
+    assert sorted(jobs["id"]) == sorted(single["id"])
+    assert set(jobs["search_term"]) == {"software engineer; python developer"}
+    assert set(jobs["search_location"]) == {"Austin, TX"}
+    assert "search_term" not in single.columns
+
+
+def test_site_searches_run_a_few_at_a_time():
+    fixture = load_fixture(FIXTURES / "indeed.json.gz")
+    terms = ["software engineer", "python developer", "data engineer", "devops engineer"]
+    meta = {**fixture["meta"], "search_term": terms, "location": ["Austin, TX", "Dallas, TX"], "results_wanted": 10}
+    with using_transport(InFlight(fixture)) as transport:
+        jobs = scrape_jobs(**meta, site_concurrency={"indeed": 3})
+    assert transport.most == 3
+    assert transport.replay.served == len(terms) * 2
+    assert set(jobs["search_location"].str.split("; ").explode()) == {"Austin, TX", "Dallas, TX"}
+    with pytest.raises(SiteConcurrencyError):
+        scrape_jobs(**meta, site_concurrency=0)
+
+
+class FailingTerm:
+    """Replays a fixture, failing every request that searches for term"""
+
+    def __init__(self, fixture, term):
+        self.replay = Replay(fixture)
+        self.term = term
+
+    def send(self, method, url, kwargs, live):
+        if self.term in repr(kwargs):
+            raise requests.ConnectionError(self.term)
+        return self.replay.send(method, url, kwargs, live)
+
+
+def test_a_failing_search_does_not_lose_the_others():
+    fixture = load_fixture(FIXTURES / "indeed.json.gz")
+    meta = {**fixture["meta"], "search_term": ["software engineer", "devops engineer"], "results_wanted": 10}
+    stats = {}
+    with using_transport(FailingTerm(fixture, "devops engineer")):
+        jobs = scrape_jobs(**meta, stats_callback=stats.update)
+    assert len(jobs) == 10
+    assert set(jobs["search_term"]) == {"software engineer"}
+    assert stats["indeed"].failed_queries == [("devops engineer", "Austin, TX")]
+    with using_transport(FailingTerm(fixture, "devops engineer")), pytest.raises(requests.ConnectionError):
+        scrape_jobs(**{**meta, "search_term": "devops engineer"})
+
+
+def test_single_query_scrapes_reject_lists():
+    with pytest.raises(QueryListError, match="scrape_jobs_async"):
+        asyncio.run(scrape_jobs_async(site_name="indeed", search_term=["python", "go"]))
+    with pytest.raises(QueryListError, match="iter_jobs"):
+        next(iter_jobs(site_name="indeed", location=["Austin, TX", "Dallas, TX"]))
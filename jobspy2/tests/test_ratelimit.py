@@ -0,0 +1,56 @@
+import threading
+import time
+
+import pytest
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers.exceptions import RateLimitError
+from jobspy2.scrapers.linkedin import LinkedInScraper
+from jobspy2.scrapers.ratelimit import RateLimiter, TokenBucket, rate_limiter
+
+from .stubs import linkedin_search_page, stub_server
+
+
+def test_token_bucket_serves_burst_then_queues_reservations():
+    now = [0.0]
+    waits = []
+    bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0], sleep=waits.append)
+    assert [bucket.acquire() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    assert waits == [0.5, 1.0]
+    now[0] = 10
+    assert bucket.acquire() == 0
+
+
+def test_rate_limiter_shares_budget_per_site_and_proxies():
+    limiter = RateLimiter({"linkedin": 20})
+    start = time.perf_counter()
+    threads = [threading.Thread(target=limiter.acquire, args=("linkedin",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.perf_counter() - start >= 0.14
+    assert limiter.stats()["linkedin"]["requests"] == 4
+
+    assert limiter.acquire("linkedin", ["10.0.0.1:8080"]) == 0
+    assert limiter.acquire("indeed") == 0
+    limiter.configure({"linkedin": None})
+    assert limiter.acquire("linkedin") == 0
+
+
+def test_only_live_search_pages_are_paced(monkeypatch):
+    def handler(path, query, body):
+        return 200, linkedin_search_page(int(query["start"][0]), 10)
+
+    rate_limiter.configure({"linkedin": 1000})
+    with stub_server(handler) as base_url:
+        monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+        before = rate_limiter.stats().get("linkedin", {}).get("requests", 0)
+        jobs = scrape_jobs(site_name="linkedin", search_term="engineer", results_wanted=30)
+    assert len(jobs) == 30
+    assert rate_limiter.stats()["linkedin"]["requests"] - before == 3
+
+
+def test_non_positive_rates_are_rejected():
+    with pytest.raises(RateLimitError):
+        RateLimiter({"linkedin": 0})
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers.exceptions import ReplayMissError
+from jobspy2.scrapers.linkedin import LinkedInScraper
+from jobspy2.scrapers.replay import Replay, load_fixture, recording, replaying
+from jobspy2.scrapers.utils import create_session
+
+from .stubs import linkedin_detail_page, linkedin_search_page, stub_server
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_recorded_scrape_replays_identically_without_the_server(monkeypatch, tmp_path):
+    def handler(path, query, body):
+        if path.startswith("/jobs/view/"):
+            return 200, linkedin_detail_page(f"Job {path.rsplit('/', 1)[-1]}")
+        return 200, linkedin_search_page(int(query["start"][0]), 10)
+
+    kwargs = {
+        "site_name": "linkedin",
+        "search_term": "engineer",
+        "results_wanted": 20,
+        "linkedin_fetch_description": True,
+    }
+    with stub_server(handler) as base_url:
+        monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+        with recording(tmp_path / "linkedin.json.gz", meta=kwargs) as recorder:
+            live = scrape_jobs(**kwargs)
+    assert len(recorder.exchanges) == 22
+
+    with replaying(tmp_path / "linkedin.json.gz") as replay:
+        replayed = scrape_jobs(**replay.meta)
+    assert replay.served == 22 and not replay.misses
+    pd.testing.assert_frame_equal(live, replayed)
+
+
+def test_unrecorded_requests_miss_in_strict_mode():
+    fixture = {"exchanges": []}
+    session = create_session(is_tls=False, transport=Replay(fixture))
+    with pytest.raises(ReplayMissError):
+        session.get("https://example.com/jobs")
+
+
+@pytest.mark.parametrize("site", ["linkedin", "indeed", "glassdoor", "zip_recruiter", "google"])
+def test_synthetic_fixtures_replay_offline(site):
+    fixture = load_fixture(FIXTURES / f"{site}.json.gz")
+    with replaying(fixture) as replay:
+        jobs = scrape_jobs(**fixture["meta"])
+    assert not replay.misses
+    assert len(jobs) == fixture["meta"]["results_wanted"]
+    assert jobs["title"].notna().all() and jobs["description"].str.contains("About the role").all()
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from jobspy2 import extract_salaries
+from jobspy2.jobs import CompensationInterval
+from jobspy2.scrapers.utils import extract_salary
+
+HOURLY, MONTHLY, YEARLY = CompensationInterval.HOURLY, CompensationInterval.MONTHLY, CompensationInterval.YEARLY
+
+CORPUS = [
+    ("Pay: $80,000 - $100,000", (YEARLY, 80000, 100000, "USD")),
+    ("The range is $120k–$150k plus equity", (YEARLY, 120000, 150000, "USD")),  # noqa: RUF001
+    ("Base salary $95-120K depending on experience", (YEARLY, 95000, 120000, "USD")),
+    ("$1,200,000 - $1,500,000 for partners", (None, None, None, None)),  # above the upper limit
+    ("Earn $25.50 - $30.75 an hour", (HOURLY, 25.5, 30.75, "USD")),
+    ("Starting at $22/hr", (HOURLY, 22, 22, "USD")),
+    ("Compensation: $135,000 per year", (YEARLY, 135000, 135000, "USD")),
+    ("Stipend of $4,000 - $5,000 monthly", (MONTHLY, 4000, 5000, "USD")),
+    ("$3,500 - $4,500", (MONTHLY, 3500, 4500, "USD")),  # inferred from the amounts
+    ("Salary £45k to £55k per annum", (YEARLY, 45000, 55000, "GBP")),
+    ("€60.000 is not parsed as sixty thousand but €50k-€65k is", (YEARLY, 50000, 65000, "EUR")),
+    ("CA$90,000 - CA$110,000", (YEARLY, 90000, 110000, "CAD")),
+    ("AU$130k-AU$150k, or about USA$85k", (YEARLY, 130000, 150000, "AUD")),
+    ("We raised $5M and offer $100 - $120 hourly", (HOURLY, 100, 120, "USD")),
+    ("Offering a $2,000 signing bonus", (None, None, None, None)),  # a lone amount without an interval
+    ("No salary listed", (None, None, None, None)),
+    ("", (None, None, None, None)),
+    (None, (None, None, None, None)),
+]
+
+
+@pytest.mark.parametrize(("description", "expected"), CORPUS)
+def test_extract_salary(description, expected):
+    assert extract_salary(description) == expected
+
+
+def test_enforce_annual_salary_drops_other_intervals():
+    assert extract_salary("$30 - $40", enforce_annual_salary=True) == (None, None, None, None)
+    assert extract_salary("$90k - $100k", enforce_annual_salary=True) == (YEARLY, 90000, 100000, "USD")
+
+
+def test_batch_matches_single_extraction():
+    descriptions = pd.Series([description for description, _ in CORPUS], index=range(100, 100 + len(CORPUS)))
+    salaries = extract_salaries(descriptions)
+    assert list(salaries.columns) == ["interval", "min_amount", "max_amount", "currency"]
+    assert salaries.index.equals(descriptions.index)
+    rows = salaries.astype(object).where(salaries.notna(), None)
+    assert [tuple(row) for row in rows.itertuples(index=False)] == [expected for _, expected in CORPUS]
+    assert extract_salaries([]).empty
@@ -0,0 +1,84 @@
+import logging
+
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers.indeed import IndeedScraper
+from jobspy2.scrapers.linkedin import LinkedInScraper
+from jobspy2.scrapers.session_pool import SessionPool, session_key, session_pool
+
+from .stubs import linkedin_search_page, stub_server
+
+
+class FakeSession:
+    def __init__(self):
+        self.request_count = 0
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_reuses_idle_sessions_per_key():
+    pool = SessionPool(max_idle_per_key=1)
+    key = session_key("indeed", ["1.2.3.4:80"], None)
+
+    first = pool.acquire(key, FakeSession)
+    first.request_count += 3
+    pool.release(key, first)
+    second = pool.acquire(key, FakeSession)
+    second.request_count += 2
+    other = pool.acquire(session_key("indeed", None, None), FakeSession)
+    pool.release(key, second)
+    pool.release(session_key("indeed", None, None), other)
+
+    assert second is first and other is not first
+    assert pool.stats() == {
+        "created": 2,
+        "reused": 1,
+        "evicted": 0,
+        "requests": 5,
+        "warm_requests": 2,
+        "in_use": 0,
+        "idle": 2,
+    }
+
+
+def test_pool_evicts_idle_and_excess_sessions():
+    pool = SessionPool(max_idle_per_key=1, idle_timeout=0)
+    key = session_key("google", None, None)
+    first, second = pool.acquire(key, FakeSession), pool.acquire(key, FakeSession)
+    pool.release(key, first)
+    pool.release(key, second)
+
+    assert first.closed and not second.closed
+    assert pool.evict_idle() == 1 and second.closed
+    assert pool.stats()["evicted"] == 2 and pool.stats()["idle"] == 0
+
+
+def test_scrape_jobs_reuses_sessions_across_calls(monkeypatch):
+    def handler(path, query, body):
+        return 200, linkedin_search_page(int(query["start"][0]), 5)
+
+    with stub_server(handler) as base_url:
+        monkeypatch.setattr(LinkedInScraper, "base_url", base_url)
+        before = session_pool.stats()
+        for _ in range(3):
+            assert len(scrape_jobs(site_name="linkedin", search_term="engineer", results_wanted=5)) == 5
+        after = session_pool.stats()
+
+    assert after["reused"] - before["reused"] >= 2
+    assert after["warm_requests"] - before["warm_requests"] >= 2
+
+
+def test_released_sessions_forget_the_site_state_of_their_scrape():
+    scraper = IndeedScraper(logger=logging.getLogger("test"))
+    session = scraper.session
+    fresh_headers = dict(session.headers)
+    session.cookies.set("blocked", "1")
+    session.headers["x-token"] = "stale"
+    scraper.close()
+
+    again = IndeedScraper(logger=logging.getLogger("test"))
+    assert again.session is session
+    assert not session.cookies
+    assert dict(session.headers) == fresh_headers
+    again.close()
@@ -0,0 +1,72 @@
+import datetime
+import json
+from pathlib import Path
+
+from jobspy2 import scrape_jobs
+from jobspy2.jobs import JobPost
+from jobspy2.scrapers import Site
+from jobspy2.scrapers.replay import load_fixture, replaying
+from jobspy2.state import SEEN_RETENTION_DAYS, ScrapeState, Watermark
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def job_post(job_id, date_posted=None):
+    return JobPost(
+        id=job_id, title="Engineer", company_name="Acme", job_url=job_id, location=None, date_posted=date_posted
+    )
+
+
+def test_watermark_advances_past_a_run():
+    first_run = datetime.datetime(2024, 5, 1, 9, 30)
+    watermark = Watermark()
+    assert watermark.hours_old(first_run) is None
+    watermark.advance([job_post("li-1", datetime.date(2024, 4, 30)), job_post("li-2")], first_run)
+    assert watermark.newest_posted == datetime.date(2024, 4, 30)
+    assert watermark.seen == {"li-1": first_run.date(), "li-2": first_run.date()}
+    # Searched from the start of the newest job's day, as sites date postings by day
+    assert watermark.hours_old(datetime.datetime(2024, 5, 1, 10, 0)) == 34
+
+    later_run = first_run + datetime.timedelta(days=SEEN_RETENTION_DAYS + 1)
+    watermark.advance([job_post("li-3")], later_run)
+    assert watermark.newest_posted == datetime.date(2024, 4, 30)
+    assert watermark.seen == {"li-3": later_run.date()}
+
+
+def test_state_file_round_trip(tmp_path):
+    path = tmp_path / "state" / "jobs.json"
+    state = ScrapeState(path)
+    state.watermark(Site.INDEED, " Software Engineer", "Austin, TX").advance(
+        [job_post("in-1", datetime.date(2024, 5, 1))], datetime.datetime(2024, 5, 1, 12)
+    )
+    state.save()
+    assert list(json.loads(path.read_text())) == ["indeed|software engineer|austin, tx"]
+    reloaded = ScrapeState(path).watermark(Site.INDEED, "software engineer", "austin, tx ")
+    assert reloaded == state.watermark(Site.INDEED, "Software Engineer", "Austin, TX")
+
+
+def test_runs_since_the_last_one_fetch_only_new_jobs(tmp_path):
+    path = tmp_path / "state.json"
+    fixture = load_fixture(FIXTURES / "linkedin.json.gz")
+    with replaying(fixture) as replay:
+        first = scrape_jobs(**fixture["meta"], since_last_run=True, state_path=path)
+        first_requests = replay.served
+    state = json.loads(path.read_text())
+    (watermark,) = state.values()
+    assert sorted(watermark["seen"]) == sorted(first["id"])
+
+    # Jobs an earlier run had not found come back; the page of jobs it had found is the last one fetched
+    new_ids = set(first["id"][:3])
+    for job_id in new_ids:
+        del watermark["seen"][job_id]
+    path.write_text(json.dumps(state))
+    with replaying(fixture) as replay:
+        second = scrape_jobs(**fixture["meta"], since_last_run=True, state_path=path)
+        second_requests = replay.served
+    assert set(second["id"]) == new_ids
+    assert second_requests < first_requests
+
+    with replaying(fixture) as replay:
+        third = scrape_jobs(**fixture["meta"], since_last_run=True, state_path=path)
+        assert replay.served == 1
+    assert third.empty
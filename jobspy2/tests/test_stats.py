@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from jobspy2 import _build_scraper_input, _run_scraper, scrape_jobs
+from jobspy2.jobs import ScrapeStats
+from jobspy2.scrapers import Site
+from jobspy2.scrapers.replay import load_fixture, replaying
+from jobspy2.scrapers.stats import PARSE, collecting, stage
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_scrape_stats_count_pages_and_time_stages():
+    fixture = load_fixture(FIXTURES / "linkedin.json.gz")
+    reported = {}
+    with replaying(fixture):
+        scrape_jobs(**fixture["meta"], stats_callback=reported.update)
+
+    stats = reported["linkedin"]
+    assert (stats.pages, stats.detail_pages, stats.requests) == (5, 50, 55)
+    assert stats.bytes == sum(len(exchange["body"].encode()) for exchange in fixture["exchanges"])
+    for name in ("network", "parse", "markdown", "assembly"):
+        assert stats.timings[name] > 0
+    assert stats.total == pytest.approx(sum(stats.timings.values()))
+
+
+def test_stages_of_worker_threads_are_collected():
+    fixture = load_fixture(FIXTURES / "glassdoor.json.gz")
+    with replaying(fixture):
+        response = _run_scraper(Site.GLASSDOOR, _build_scraper_input(**fixture["meta"]), None, None, None)
+
+    assert response.stats.site == "glassdoor"
+    assert response.stats.detail_pages == len(response.jobs)
+    assert response.stats.timings["markdown"] > 0
+
+
+def test_nested_stages_are_exclusive():
+    stats = ScrapeStats()
+    with collecting(stats, PARSE):
+        with stage("network"):
+            pass
+        with stage("outer"), stage("inner"):
+            sum(range(10_000))
+    assert set(stats.timings) == {"parse", "network", "outer", "inner"}
+    with stage("network"):
+        pass  # nothing is collecting here
+    assert stats.timings["inner"] > stats.timings["outer"]
@@ -0,0 +1,79 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from jobspy2 import configure_workers, scrape_jobs
+from jobspy2.scrapers.replay import Replay, load_fixture, using_transport
+from jobspy2.scrapers.workers import WorkersError, job_results, submit_jobs
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# Session cookies, csrf token and location lookups, made before the first search page
+SETUP_URLS = ("/jobs-app/event", "/Job/computer-science-jobs.htm", "/findPopularLocationAjax.htm")
+
+
+class SlowJobPages:
+    """Replays a fixture, answering job pages and details in 10 ms, and logs each request as it is answered"""
+
+    def __init__(self, site):
+        self.replay = Replay(load_fixture(FIXTURES / f"{site}.json.gz"))
+        self.lock = threading.Lock()
+        self.log = []
+
+    def send(self, method, url, kwargs, live):
+        response = self.replay.send(method, url, kwargs, live)
+        if any(setup in url for setup in SETUP_URLS):
+            kind = "setup"
+        elif "/jobs-app/jobs" in url or "JobSearchResultsQuery" in str(kwargs.get("data")):
+            kind = "search"
+        else:
+            kind = "job"
+            time.sleep(0.01)
+        with self.lock:
+            self.log.append((kind, threading.current_thread().name))
+        return response
+
+
+@pytest.mark.parametrize(("site", "jobs_per_page"), [("zip_recruiter", 20), ("glassdoor", 30)])
+def test_next_page_is_fetched_while_jobs_are_processed(site, jobs_per_page):
+    with using_transport(SlowJobPages(site)) as transport:
+        scrape_jobs(site_name=site, search_term="software engineer", location="Austin, TX", results_wanted=60)
+    kinds = [kind for kind, _ in transport.log]
+    second_search = [index for index, kind in enumerate(kinds) if kind == "search"][1]
+    assert kinds[:second_search].count("job") < jobs_per_page
+    assert all(thread.startswith("jobspy2-worker") for kind, thread in transport.log if kind == "job")
+
+
+def test_limited_jobs_run_a_few_at_a_time_in_order():
+    lock = threading.Lock()
+    running = []
+    most = 0
+
+    def job(item):
+        nonlocal most
+        with lock:
+            running.append(item)
+            most = max(most, len(running))
+        time.sleep(0.005)
+        with lock:
+            running.remove(item)
+        return item * 2
+
+    assert job_results(submit_jobs(job, range(12), limit=3)) == [item * 2 for item in range(12)]
+    assert most == 3
+
+
+def test_job_errors_are_raised():
+    with pytest.raises(ZeroDivisionError):
+        job_results(submit_jobs(lambda item: 1 / item, [1, 0]))
+
+
+def test_configure_workers():
+    with pytest.raises(WorkersError):
+        configure_workers(0)
+    configure_workers(4)
+    try:
+        assert job_results(submit_jobs(str, [1, 2])) == ["1", "2"]
+    finally:
+        configure_workers()